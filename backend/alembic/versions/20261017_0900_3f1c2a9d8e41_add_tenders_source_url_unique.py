@@ -0,0 +1,40 @@
+"""Add unique (source_name, source_url) constraint to tenders
+
+Revision ID: 3f1c2a9d8e41
+Revises: 
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c2a9d8e41'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Drop duplicate rows left by earlier runs, keeping the oldest one
+    op.execute(
+        """
+        DELETE FROM tenders t
+        USING tenders d
+        WHERE t.source_name = d.source_name
+          AND t.source_url = d.source_url
+          AND t.id > d.id
+        """
+    )
+    op.create_unique_constraint(
+        "uq_tenders_source_name_source_url",
+        "tenders",
+        ["source_name", "source_url"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("uq_tenders_source_name_source_url", "tenders", type_="unique")
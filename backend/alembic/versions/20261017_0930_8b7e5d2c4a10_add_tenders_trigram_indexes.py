@@ -0,0 +1,49 @@
+"""Add pg_trgm GIN indexes for tender keyword search
+
+Revision ID: 8b7e5d2c4a10
+Revises: 3f1c2a9d8e41
+Create Date: 2026-10-17 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b7e5d2c4a10'
+down_revision: Union[str, None] = '3f1c2a9d8e41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # Build concurrently so existing tables stay writable during the migration
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tenders_title_trgm",
+            "tenders",
+            ["title"],
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_tenders_content_trgm",
+            "tenders",
+            ["content"],
+            postgresql_using="gin",
+            postgresql_ops={"content": "gin_trgm_ops"},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_tenders_content_trgm", "tenders", postgresql_concurrently=True)
+        op.drop_index("ix_tenders_title_trgm", "tenders", postgresql_concurrently=True)
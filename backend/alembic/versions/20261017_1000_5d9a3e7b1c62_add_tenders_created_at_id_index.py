@@ -0,0 +1,34 @@
+"""Add composite index for keyset pagination of tenders
+
+Revision ID: 5d9a3e7b1c62
+Revises: 8b7e5d2c4a10
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d9a3e7b1c62'
+down_revision: Union[str, None] = '8b7e5d2c4a10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tenders_created_at_id",
+            "tenders",
+            ["created_at", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_tenders_created_at_id", "tenders", postgresql_concurrently=True)
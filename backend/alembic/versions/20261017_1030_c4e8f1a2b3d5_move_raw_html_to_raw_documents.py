@@ -0,0 +1,111 @@
+"""Move tenders.raw_html into the compressed raw_documents store
+
+Revision ID: c4e8f1a2b3d5
+Revises: 5d9a3e7b1c62
+Create Date: 2026-10-17 10:30:00.000000
+
+"""
+import hashlib
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import zstandard
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e8f1a2b3d5'
+down_revision: Union[str, None] = '5d9a3e7b1c62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 500
+
+tenders = sa.table(
+    "tenders",
+    sa.column("id", sa.Integer),
+    sa.column("raw_html", sa.Text),
+    sa.column("raw_html_hash", sa.String),
+)
+raw_documents = sa.table(
+    "raw_documents",
+    sa.column("hash", sa.String),
+    sa.column("data", sa.LargeBinary),
+    sa.column("size", sa.Integer),
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "raw_documents",
+        sa.Column("hash", sa.String(length=64), nullable=False),
+        sa.Column("data", sa.LargeBinary(), nullable=False),
+        sa.Column("size", sa.Integer(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("hash"),
+    )
+    op.add_column("tenders", sa.Column("raw_html_hash", sa.String(length=64), nullable=True))
+    op.create_index("ix_tenders_raw_html_hash", "tenders", ["raw_html_hash"])
+
+    # Compress existing pages in batches, storing identical pages once
+    conn = op.get_bind()
+    compressor = zstandard.ZstdCompressor(level=9)
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            sa.select(tenders.c.id, tenders.c.raw_html)
+            .where(tenders.c.id > last_id, tenders.c.raw_html.is_not(None))
+            .order_by(tenders.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        last_id = rows[-1].id
+
+        documents = {}
+        for row in rows:
+            encoded = row.raw_html.encode("utf-8")
+            digest = hashlib.sha256(encoded).hexdigest()
+            documents[digest] = {
+                "hash": digest,
+                "data": compressor.compress(encoded),
+                "size": len(encoded),
+            }
+            conn.execute(
+                tenders.update().where(tenders.c.id == row.id).values(raw_html_hash=digest)
+            )
+
+        conn.execute(
+            postgresql.insert(raw_documents)
+            .values(list(documents.values()))
+            .on_conflict_do_nothing(index_elements=["hash"])
+        )
+
+    op.drop_column("tenders", "raw_html")
+
+
+def downgrade() -> None:
+    op.add_column("tenders", sa.Column("raw_html", sa.Text(), nullable=True))
+
+    conn = op.get_bind()
+    decompressor = zstandard.ZstdDecompressor()
+    digests = conn.execute(sa.select(raw_documents.c.hash)).scalars().all()
+    for digest in digests:
+        data = conn.execute(
+            sa.select(raw_documents.c.data).where(raw_documents.c.hash == digest)
+        ).scalar_one()
+        conn.execute(
+            tenders.update()
+            .where(tenders.c.raw_html_hash == digest)
+            .values(raw_html=decompressor.decompress(data).decode("utf-8"))
+        )
+
+    op.drop_index("ix_tenders_raw_html_hash", table_name="tenders")
+    op.drop_column("tenders", "raw_html_hash")
+    op.drop_table("raw_documents")
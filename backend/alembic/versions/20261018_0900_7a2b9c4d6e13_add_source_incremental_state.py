@@ -0,0 +1,26 @@
+"""Add incremental crawl state to source configs
+
+Revision ID: 7a2b9c4d6e13
+Revises: c4e8f1a2b3d5
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a2b9c4d6e13'
+down_revision: Union[str, None] = 'c4e8f1a2b3d5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("source_configs", sa.Column("incremental_state", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("source_configs", "incremental_state")
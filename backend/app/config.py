@@ -1,6 +1,6 @@
 """Application configuration settings."""
 import os
-from typing import Optional
+from typing import List, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -20,6 +20,32 @@ class Settings(BaseSettings):
     gemini_api_key: str
     gemini_model: str = "gemini-2.0-flash-exp"
     gemini_temperature: float = 0.5
+    gemini_max_concurrency: int = 4  # Max in-flight Gemini requests per process
+
+    # Extraction cache
+    extraction_cache_enabled: bool = True
+    extraction_cache_path: str = ".cache/extraction_cache.sqlite3"
+    extraction_cache_ttl_seconds: int = 30 * 24 * 3600
+    extraction_cache_max_entries: int = 100_000
+
+    # Batched extraction (several tenders per Gemini request)
+    extraction_batch_max_items: int = 10
+    extraction_batch_max_tokens: int = 24_000  # Estimated input tokens per request
+    extraction_batch_max_output_tokens: int = 8192
+
+    # Rule (regex) extraction tier run before Gemini
+    extraction_rules_enabled: bool = True
+    extraction_rules_min_confidence: float = 0.8  # Less certain rule values defer to Gemini
+    # Gemini is skipped when the rules find all of these (JSON list in the environment)
+    extraction_required_fields: List[str] = [
+        "project_name",
+        "budget_amount",
+        "deadline",
+        "contact_phone",
+    ]
+
+    # Raw HTML storage
+    raw_html_compression_level: int = 3  # zstd level for stored detail pages
 
     # App
     debug: bool = False
@@ -31,6 +57,53 @@ class Settings(BaseSettings):
     # Scraping
     scraper_timeout: int = 30
     scraper_max_retries: int = 3
+    scraper_detail_concurrency: int = 5  # Concurrent detail requests per host
+    scraper_max_pages: int = 10  # List pages per run for paginated sources
+    scraper_parser: str = "lxml"  # HTML parser backend: "lxml" (compiled selectors) or "bs4"
+    scraper_parse_workers: int = 2  # Processes parsing detail pages (0 parses on the event loop)
+    scraper_parse_offload_bytes: int = 64 * 1024  # Smaller detail pages are parsed inline
+    incremental_bloom_capacity: int = 5000  # Recent URLs remembered per filter generation
+    incremental_bloom_error_rate: float = 0.01
+
+    # Shared HTTP client pool
+    http_max_connections: int = 100
+    http_max_keepalive: int = 20  # Idle keep-alive connections kept in the pool
+    http_keepalive_expiry: float = 60.0
+    http_max_per_host: int = 10  # Concurrent requests per host across all sources
+    http_http2: bool = True
+    http_dns_ttl: float = 300.0  # Seconds to cache DNS lookups (0 disables)
+
+    # HTTP validator cache (conditional GET for list and detail pages)
+    http_cache_enabled: bool = True
+    http_cache_path: str = ".cache/http_cache.sqlite3"
+    http_cache_ttl_seconds: int = 7 * 24 * 3600
+    http_cache_max_entries: int = 50_000
+
+    # Task pipeline
+    pipeline_queue_size: int = 20  # Max items buffered between stages
+    pipeline_extract_workers: int = 4
+    pipeline_extract_batch_size: int = 1  # Tenders per extraction call (>1 packs Gemini requests)
+    pipeline_insert_batch_size: int = 50  # Rows per multi-row INSERT
+    pipeline_commit_every: int = 1  # Batches per commit (0 = commit once at the end)
+
+    # Filter expressions
+    filter_timezone: str = "Asia/Shanghai"  # Zone of naive (announcement-local) deadlines
+
+    # Re-filtering stored tenders (POST /sources/{id}/refilter)
+    refilter_chunk_size: int = 2000  # Rows read and bulk-updated per round trip
+
+    # Multi-source runs (enforced by the background job manager)
+    task_max_concurrent_sources: int = 8  # Source jobs running at once
+    task_source_timeout: int = 1800  # Seconds per source job
+    job_retention: int = 500  # Finished jobs kept for status queries
+
+    # Scheduler (enable in one process only)
+    scheduler_enabled: bool = True
+    scheduler_timezone: str = "Asia/Shanghai"
+    scheduler_tick_seconds: float = 5.0
+    scheduler_refresh_seconds: float = 60.0  # Reload schedule_cron from the database
+    scheduler_jitter_seconds: float = 30.0
+    scheduler_run_limit: int = 50  # Items per scheduled run
 
 
 settings = Settings()
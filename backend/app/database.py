@@ -1,5 +1,7 @@
 """Database connection and session management."""
 from typing import AsyncGenerator
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base
 
@@ -25,6 +27,13 @@ AsyncSessionLocal = async_sessionmaker(
 Base = declarative_base()
 
 
+def dialect_insert(db: AsyncSession, model):
+    """INSERT construct for the session's dialect (supports ON CONFLICT)."""
+    if db.get_bind().dialect.name == "sqlite":
+        return sqlite.insert(model)
+    return postgresql.insert(model)
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Dependency for getting async database sessions."""
     async with AsyncSessionLocal() as session:
@@ -41,4 +50,7 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
 async def init_db() -> None:
     """Initialize database tables."""
     async with engine.begin() as conn:
+        if conn.dialect.name == "postgresql":
+            # Required by the trigram search indexes
+            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         await conn.run_sync(Base.metadata.create_all)
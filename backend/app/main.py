@@ -7,6 +7,10 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.config import settings
 from app.database import init_db
 from app.routers import tenders, tasks, sources
+from app.services.jobs import job_manager
+from app.services.scheduler import scheduler
+from app.services.scraper.http_client import http_clients
+from app.services.scraper.parse_pool import parse_pool
 
 # Configure logging
 logging.basicConfig(
@@ -25,10 +29,20 @@ async def lifespan(app: FastAPI):
     await init_db()
     logger.info("Database initialized")
 
+    http_clients.start()
+    parse_pool.start()
+
+    if settings.scheduler_enabled:
+        scheduler.start()
+
     yield
 
     # Shutdown
     logger.info("Shutting down application...")
+    await scheduler.stop()
+    await job_manager.stop()
+    await http_clients.close()
+    await parse_pool.close()
 
 
 # Create FastAPI app
@@ -46,6 +60,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 # Include routers
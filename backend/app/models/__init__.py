@@ -1,4 +1,4 @@
 """Export models."""
-from app.models.tender import Tender, SourceConfig
+from app.models.tender import Tender, RawDocument, SourceConfig
 
-__all__ = ["Tender", "SourceConfig"]
+__all__ = ["Tender", "RawDocument", "SourceConfig"]
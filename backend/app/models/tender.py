@@ -1,7 +1,18 @@
 """Database models for tenders and source configurations."""
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import JSON, String, Text, DateTime, Numeric, Integer, Boolean
+from sqlalchemy import (
+    JSON,
+    String,
+    Text,
+    DateTime,
+    Numeric,
+    Integer,
+    Boolean,
+    Index,
+    LargeBinary,
+    UniqueConstraint,
+)
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 
@@ -12,6 +23,24 @@ class Tender(Base):
     """Tender announcement model."""
 
     __tablename__ = "tenders"
+    __table_args__ = (
+        UniqueConstraint("source_name", "source_url", name="uq_tenders_source_name_source_url"),
+        # Keyset pagination of GET /tenders (newest first)
+        Index("ix_tenders_created_at_id", "created_at", "id"),
+        # Trigram indexes serve keyword ILIKE searches (PostgreSQL pg_trgm)
+        Index(
+            "ix_tenders_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_tenders_content_trgm",
+            "content",
+            postgresql_using="gin",
+            postgresql_ops={"content": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
 
@@ -35,7 +64,7 @@ class Tender(Base):
     location: Mapped[Optional[str]] = mapped_column(String(200))
 
     # Metadata
-    raw_html: Mapped[Optional[str]] = mapped_column(Text)
+    raw_html_hash: Mapped[Optional[str]] = mapped_column(String(64), index=True)  # RawDocument.hash
     extracted_data: Mapped[Optional[dict]] = mapped_column(JSON)
 
     # Status
@@ -56,6 +85,22 @@ class Tender(Base):
         return f"<Tender(id={self.id}, title='{self.title[:50]}...')>"
 
 
+class RawDocument(Base):
+    """Compressed raw detail HTML, stored once per distinct page."""
+
+    __tablename__ = "raw_documents"
+
+    hash: Mapped[str] = mapped_column(String(64), primary_key=True)  # sha256 of the HTML
+    data: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)  # zstd-compressed UTF-8
+    size: Mapped[int] = mapped_column(Integer, nullable=False)  # Uncompressed bytes
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return f"<RawDocument(hash='{self.hash[:12]}', size={self.size})>"
+
+
 class SourceConfig(Base):
     """Data source configuration model."""
 
@@ -80,6 +125,9 @@ class SourceConfig(Base):
     # Schedule
     schedule_cron: Mapped[Optional[str]] = mapped_column(String(100))
 
+    # Incremental crawl state (e.g. {"high_water_mark": "2024-12-01T00:00:00"})
+    incremental_state: Mapped[Optional[dict]] = mapped_column(JSON)
+
     # Timestamps
     last_run_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
     created_at: Mapped[datetime] = mapped_column(
@@ -6,7 +6,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.models.tender import SourceConfig
-from app.schemas.tender import SourceConfigCreate, SourceConfigUpdate, SourceConfigResponse
+from app.schemas.tender import (
+    SourceConfigCreate,
+    SourceConfigUpdate,
+    SourceConfigResponse,
+)
+from app.services.jobs import job_manager
 
 router = APIRouter(prefix="/sources", tags=["sources"])
 
@@ -88,6 +93,38 @@ async def update_source(
     return source
 
 
+@router.post("/{source_id}/refilter", response_model=dict, status_code=202)
+async def refilter_source(
+    source_id: int,
+    db: AsyncSession = Depends(get_db),
+) -> dict:
+    """
+    Submit a background job re-applying the source's current filter rules to its stored tenders.
+
+    Tenders are streamed in chunks and ``is_filtered``/``filter_reason`` are
+    bulk-updated where the decision changed. Returns immediately; poll
+    ``GET /tasks/{job_id}`` for the scanned/updated/filtered counts and the
+    number of kept tenders that have no extracted data. Submitting while a
+    re-filter of the source is active returns that job.
+
+    Args:
+        source_id: Source ID
+        db: Database session
+
+    Returns:
+        Submitted job
+    """
+    result = await db.execute(
+        select(SourceConfig).where(SourceConfig.id == source_id)
+    )
+    source = result.scalar_one_or_none()
+
+    if not source:
+        raise HTTPException(status_code=404, detail="Source not found")
+
+    return job_manager.submit_refilter(source.id, source.name).to_dict()
+
+
 @router.delete("/{source_id}", status_code=204)
 async def delete_source(
     source_id: int,
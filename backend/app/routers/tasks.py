@@ -1,11 +1,13 @@
 """API router for task execution."""
-from typing import Optional
+from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
-from app.services.task import task_service
+from app.models.tender import SourceConfig
+from app.services.jobs import job_manager
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
@@ -18,53 +20,84 @@ class RunTaskRequest(BaseModel):
 
 
 class RunTaskResponse(BaseModel):
-    """Response model for task execution."""
+    """Response model for task submission."""
 
     success: bool
     message: str
     results: list
 
 
-@router.post("/run", response_model=RunTaskResponse)
+@router.post("/run", response_model=RunTaskResponse, status_code=202)
 async def run_task(
     request: RunTaskRequest,
     db: AsyncSession = Depends(get_db),
 ) -> RunTaskResponse:
     """
-    Run scraping and extraction task.
+    Submit scraping and extraction tasks to run in the background.
+
+    Returns immediately with one job per source; poll ``GET /tasks/{job_id}``
+    for progress. Submitting a source that already has an active job returns
+    that job instead of starting a duplicate run.
 
     Args:
         request: Task configuration
         db: Database session
 
     Returns:
-        Task execution results
+        Submitted jobs
     """
-    try:
-        if request.source_id:
-            # Run task for specific source
-            result = await task_service.run_source_task(
-                db=db,
-                source_id=request.source_id,
-                limit=request.limit,
-            )
-            results = [result]
-            message = f"Task completed for source {request.source_id}"
-        else:
-            # Run tasks for all active sources
-            results = await task_service.run_all_active_sources(
-                db=db,
-                limit=request.limit,
+    if request.source_id:
+        # Submit task for specific source
+        result = await db.execute(
+            select(SourceConfig).where(SourceConfig.id == request.source_id)
+        )
+        source = result.scalar_one_or_none()
+
+        if not source:
+            raise HTTPException(
+                status_code=400, detail=f"Source config {request.source_id} not found"
             )
-            message = f"Tasks completed for {len(results)} sources"
+        if not source.is_active:
+            raise HTTPException(status_code=400, detail=f"Source {source.name} is not active")
 
-        return RunTaskResponse(
-            success=True,
-            message=message,
-            results=results,
+        sources = [source]
+        message = f"Task submitted for source {request.source_id}"
+    else:
+        # Submit tasks for all active sources
+        result = await db.execute(
+            select(SourceConfig).where(SourceConfig.is_active == True)
         )
+        sources = result.scalars().all()
+        message = f"Tasks submitted for {len(sources)} sources"
+
+    jobs = [job_manager.submit(source.id, source.name, request.limit) for source in sources]
+
+    return RunTaskResponse(
+        success=True,
+        message=message,
+        results=[job.to_dict() for job in jobs],
+    )
+
+
+@router.get("", response_model=List[dict])
+async def get_jobs() -> List[dict]:
+    """Get recent jobs, newest first."""
+    return [job.to_dict() for job in job_manager.list()]
+
+
+@router.get("/{job_id}", response_model=dict)
+async def get_job(job_id: str) -> dict:
+    """
+    Get job status, progress and timing.
+
+    Args:
+        job_id: Job ID returned on submission
+
+    Returns:
+        Job status
+    """
+    job = job_manager.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
 
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Task execution failed: {e}")
+    return job.to_dict()
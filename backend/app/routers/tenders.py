@@ -1,45 +1,89 @@
 """API router for tender-related endpoints."""
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, PlainTextResponse
 from sqlalchemy import select, desc, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.models.tender import Tender
-from app.schemas.tender import TenderResponse, TenderUpdate
+from app.schemas.tender import TenderResponse, TenderSummaryResponse, TenderUpdate
+from app.services.pagination import encode_cursor, paginate_by_created_at
+from app.services.raw_store import load_document
+from app.services.search import keyword_condition, keyword_rank
 
 router = APIRouter(prefix="/tenders", tags=["tenders"])
 
 
-@router.get("", response_model=List[TenderResponse])
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# Columns a list query may select; content is detail-only
+SUMMARY_FIELDS = tuple(TenderSummaryResponse.model_fields)
+
+
+def _parse_fields(fields: Optional[str]) -> List[str]:
+    """Validate a comma-separated field list, always including id."""
+    if not fields:
+        return list(SUMMARY_FIELDS)
+
+    requested = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = sorted(set(requested) - set(SUMMARY_FIELDS))
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown or non-list fields: {', '.join(unknown)}",
+        )
+    return ["id"] + [name for name in dict.fromkeys(requested) if name != "id"]
+
+
+@router.get("", response_model=List[TenderSummaryResponse])
 async def get_tenders(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = None,
     source_name: Optional[str] = None,
     keyword: Optional[str] = None,
     min_budget: Optional[float] = None,
     max_budget: Optional[float] = None,
     include_filtered: bool = False,
+    sort: str = Query("created_at", pattern="^(created_at|relevance)$"),
+    fields: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
-) -> List[TenderResponse]:
+) -> List[TenderSummaryResponse]:
     """
     Get list of tender announcements with filtering.
 
+    List items omit the announcement text; fetch ``GET /tenders/{id}`` for
+    the full record. Only the listed columns are read from the database.
+
+    When sorting by created_at, the response carries an X-Next-Cursor header
+    if more rows may follow; pass it back as ``cursor`` to fetch the next page
+    without the cost of a growing offset.
+
     Args:
-        skip: Number of records to skip (pagination)
+        response: Response (for the next-cursor header)
+        skip: Number of records to skip (offset pagination, ignored with cursor)
         limit: Maximum number of records to return
+        cursor: Cursor from the previous page (keyset pagination)
         source_name: Filter by source name
         keyword: Search keyword in title and content
         min_budget: Minimum budget amount
         max_budget: Maximum budget amount
         include_filtered: Include filtered items (default: False)
+        sort: "created_at" (newest first) or "relevance" (keyword match score)
+        fields: Comma-separated subset of list fields to return (id is always included)
         db: Database session
 
     Returns:
-        List of tender announcements
+        List of tender summaries
     """
-    # Build query
-    query = select(Tender)
+    selected = _parse_fields(fields)
+
+    # Build query (created_at is always read for the next cursor)
+    columns = dict.fromkeys([*selected, "created_at"])
+    query = select(*(getattr(Tender, name) for name in columns))
 
     # Apply filters
     conditions = []
@@ -51,10 +95,7 @@ async def get_tenders(
         conditions.append(Tender.source_name == source_name)
 
     if keyword:
-        keyword_filter = f"%{keyword}%"
-        conditions.append(
-            (Tender.title.ilike(keyword_filter)) | (Tender.content.ilike(keyword_filter))
-        )
+        conditions.append(keyword_condition(keyword))
 
     if min_budget is not None:
         conditions.append(Tender.budget_amount >= min_budget)
@@ -66,13 +107,38 @@ async def get_tenders(
         query = query.where(and_(*conditions))
 
     # Apply ordering and pagination
-    query = query.order_by(desc(Tender.created_at)).offset(skip).limit(limit)
+    by_relevance = sort == "relevance" and bool(keyword)
+    if by_relevance:
+        if cursor:
+            raise HTTPException(
+                status_code=400, detail="cursor is only supported with sort=created_at"
+            )
+        query = query.order_by(desc(keyword_rank(keyword)), desc(Tender.created_at))
+        query = query.offset(skip).limit(limit)
+    else:
+        try:
+            query = paginate_by_created_at(query, limit, cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        if not cursor:
+            query = query.offset(skip)
 
     # Execute query
     result = await db.execute(query)
-    tenders = result.scalars().all()
+    rows = result.all()
+
+    headers = {}
+    if not by_relevance and len(rows) == limit:
+        last = rows[-1]
+        headers[NEXT_CURSOR_HEADER] = encode_cursor(last.created_at, last.id)
 
-    return tenders
+    if fields:
+        # Partial rows do not fit the summary model; serialize them directly
+        content = [{name: row._mapping[name] for name in selected} for row in rows]
+        return JSONResponse(jsonable_encoder(content), headers=headers)
+
+    response.headers.update(headers)
+    return rows
 
 
 @router.get("/{tender_id}", response_model=TenderResponse)
@@ -99,6 +165,36 @@ async def get_tender(
     return tender
 
 
+@router.get("/{tender_id}/raw", response_class=PlainTextResponse)
+async def get_tender_raw_html(
+    tender_id: int,
+    db: AsyncSession = Depends(get_db),
+) -> PlainTextResponse:
+    """
+    Get the raw detail HTML a tender was extracted from.
+
+    Served as plain text so the scraped markup is never rendered by the browser.
+
+    Args:
+        tender_id: Tender ID
+        db: Database session
+
+    Returns:
+        Raw HTML
+    """
+    result = await db.execute(select(Tender.raw_html_hash).where(Tender.id == tender_id))
+    row = result.one_or_none()
+
+    if row is None:
+        raise HTTPException(status_code=404, detail="Tender not found")
+
+    raw_html = await load_document(db, row.raw_html_hash) if row.raw_html_hash else None
+    if raw_html is None:
+        raise HTTPException(status_code=404, detail="Raw HTML not stored for this tender")
+
+    return PlainTextResponse(raw_html)
+
+
 @router.patch("/{tender_id}", response_model=TenderResponse)
 async def update_tender(
     tender_id: int,
@@ -76,14 +76,13 @@ class TenderUpdate(BaseModel):
     is_manually_corrected: bool = True
 
 
-class TenderResponse(BaseModel):
-    """Schema for tender API response."""
+class TenderSummaryResponse(BaseModel):
+    """Schema for tender list items (without the announcement text)."""
 
     id: int
     source_name: str
     source_url: str
     title: str
-    content: str
     project_name: Optional[str] = None
     budget_amount: Optional[float] = None
     budget_currency: Optional[str] = None
@@ -102,6 +101,22 @@ class TenderResponse(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class TenderResponse(TenderSummaryResponse):
+    """Schema for tender API response."""
+
+    content: str
+
+
+def _validate_filter_rules(v: Optional[dict]) -> Optional[dict]:
+    """Reject filter expressions that do not compile."""
+    if v and v.get("expr"):
+        # Imported here so schemas do not depend on the services package at import time
+        from app.services.filter_plan import compile_expr
+
+        compile_expr(v["expr"])
+    return v
+
+
 class SourceConfigCreate(BaseModel):
     """Schema for creating a source config."""
 
@@ -113,6 +128,8 @@ class SourceConfigCreate(BaseModel):
     is_active: bool = True
     schedule_cron: Optional[str] = None
 
+    _check_filter_rules = field_validator("filter_rules")(_validate_filter_rules)
+
 
 class SourceConfigUpdate(BaseModel):
     """Schema for updating a source config."""
@@ -123,6 +140,8 @@ class SourceConfigUpdate(BaseModel):
     is_active: Optional[bool] = None
     schedule_cron: Optional[str] = None
 
+    _check_filter_rules = field_validator("filter_rules")(_validate_filter_rules)
+
 
 class SourceConfigResponse(BaseModel):
     """Schema for source config API response."""
@@ -135,6 +154,7 @@ class SourceConfigResponse(BaseModel):
     filter_rules: Optional[dict] = None
     is_active: bool
     schedule_cron: Optional[str] = None
+    incremental_state: Optional[dict] = None
     last_run_at: Optional[datetime] = None
     created_at: datetime
     updated_at: datetime
@@ -0,0 +1,103 @@
+"""Persistent cache for AI extraction results."""
+import asyncio
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+from typing import Any, Dict, Optional
+
+from app.services.sqlite_cache import SqliteCache
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _normalize(text: str) -> str:
+    """Collapse whitespace so formatting-only differences share a key."""
+    return _WHITESPACE_RE.sub(" ", text or "").strip()
+
+
+class ExtractionCache(SqliteCache):
+    """
+    SQLite-backed cache of extraction results keyed by content hash.
+
+    See ``SqliteCache`` for storage, expiry and eviction.
+    """
+
+    table = "extraction_cache"
+    value_columns = {"value": "TEXT NOT NULL"}
+
+    def __init__(self, path: str, ttl_seconds: int, max_entries: int) -> None:
+        """
+        Initialize cache.
+
+        Args:
+            path: SQLite database file path
+            ttl_seconds: Entry lifetime in seconds
+            max_entries: Maximum number of stored entries
+        """
+        super().__init__(path, ttl_seconds, max_entries)
+
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(title: str, content: str, model: str, prompt_version: str) -> str:
+        """
+        Build a cache key.
+
+        Args:
+            title: Tender title
+            content: Tender content as sent to the model (already truncated)
+            model: Model name
+            prompt_version: Hash of the system instruction and prompt template
+
+        Returns:
+            Hex digest identifying the request
+        """
+        payload = json.dumps(
+            [model, prompt_version, _normalize(title), _normalize(content)],
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached value for key, or None on a miss."""
+        try:
+            value = await asyncio.to_thread(self._get, key)
+        except sqlite3.Error as e:
+            logger.warning(f"Extraction cache read failed: {e}")
+            value = None
+
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store value under key."""
+        try:
+            await asyncio.to_thread(self._set, key, value)
+        except sqlite3.Error as e:
+            logger.warning(f"Extraction cache write failed: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for this process."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else None,
+        }
+
+    def _get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Blocking lookup."""
+        row = self._fetch(key)
+        return json.loads(row[0]) if row is not None else None
+
+    def _set(self, key: str, value: Dict[str, Any]) -> None:
+        """Blocking write."""
+        self._store(key, (json.dumps(value, ensure_ascii=False),))
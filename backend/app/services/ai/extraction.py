@@ -1,16 +1,90 @@
 """AI extraction service using Google Gemini."""
+import asyncio
+import hashlib
 import logging
 import json
 import re
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from pydantic import ValidationError
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 import google.generativeai as genai
 
 from app.config import settings
 from app.schemas.tender import TenderExtractModel
+from app.services.ai.cache import ExtractionCache
+from app.services.ai.rules import RuleExtraction, RuleExtractor, merge_tiers, rule_extractor
 
 logger = logging.getLogger(__name__)
 
+# Characters of content sent to the model
+CONTENT_LIMIT = 5000
+
+PROMPT_TEMPLATE = """请从以下招标公告中提取关键信息:
+
+标题: {title}
+
+内容:
+{content}
+
+返回JSON格式的提取结果:"""
+
+# Batched requests: several announcements, answered with a JSON array
+BATCH_INSTRUCTION = """
+
+批量模式:
+当输入包含多条公告时，返回JSON数组，每条公告对应一个对象，字段与上面相同，并增加"id"字段，值为该公告的编号。不要遗漏或合并公告。"""
+
+BATCH_PROMPT_TEMPLATE = """请分别从以下{count}条招标公告中提取关键信息:
+
+{documents}
+
+返回JSON数组，每条公告一个对象，用"id"标明公告编号:"""
+
+DOCUMENT_TEMPLATE = """=== 公告 {id} ===
+标题: {title}
+
+内容:
+{content}"""
+
+
+class BatchResponseError(ValueError):
+    """A batched answer that cannot be used as a whole (unparsable or truncated)."""
+
+
+@dataclass
+class ExtractionMetrics:
+    """Per-process counters of which tier answered extraction requests."""
+
+    items: int = 0
+    rules_only: int = 0  # Answered by the rule tier without Gemini
+    cache_hits: int = 0
+    model_calls: int = 0
+    model_failures: int = 0
+    batch_calls: int = 0  # Requests carrying several announcements
+    batched_items: int = 0
+    rule_fields: Dict[str, int] = field(default_factory=dict)  # Confident rule values per field
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Counters and hit rates."""
+        items = max(1, self.items)
+        return {
+            "items": self.items,
+            "rules_only": self.rules_only,
+            "cache_hits": self.cache_hits,
+            "model_calls": self.model_calls,
+            "model_failures": self.model_failures,
+            "batch_calls": self.batch_calls,
+            "items_per_batch": round(self.batched_items / max(1, self.batch_calls), 2),
+            "rules_only_rate": round(self.rules_only / items, 3),
+            "cache_hit_rate": round(self.cache_hits / items, 3),
+            "model_call_rate": round(self.model_calls / items, 3),
+            "rule_field_rates": {
+                name: round(count / items, 3) for name, count in sorted(self.rule_fields.items())
+            },
+        }
+
+
 # Configure Gemini API
 genai.configure(api_key=settings.gemini_api_key)
 
@@ -18,8 +92,13 @@ genai.configure(api_key=settings.gemini_api_key)
 class ExtractionService:
     """Service for extracting structured data from tender announcements using AI."""
 
-    def __init__(self) -> None:
-        """Initialize extraction service."""
+    def __init__(self, rules: Optional[RuleExtractor] = rule_extractor) -> None:
+        """
+        Initialize extraction service.
+
+        Args:
+            rules: Deterministic tier run before Gemini (None to always call Gemini)
+        """
         self.model = genai.GenerativeModel(
             model_name=settings.gemini_model,
             generation_config={
@@ -30,6 +109,40 @@ class ExtractionService:
             },
             system_instruction=self._get_system_instruction(),
         )
+        # Same instruction extended for multi-announcement requests; sent once
+        # per batch instead of once per announcement
+        self.batch_model = genai.GenerativeModel(
+            model_name=settings.gemini_model,
+            generation_config={
+                "temperature": settings.gemini_temperature,
+                "top_p": 0.95,
+                "top_k": 40,
+                "max_output_tokens": settings.extraction_batch_max_output_tokens,
+            },
+            system_instruction=self._get_system_instruction() + BATCH_INSTRUCTION,
+        )
+        self.batch_max_items = max(1, settings.extraction_batch_max_items)
+        self.batch_max_tokens = settings.extraction_batch_max_tokens
+        # Bounds in-flight requests; calls go through the SDK's async API so the
+        # event loop keeps serving other requests while Gemini responds.
+        self._semaphore = asyncio.Semaphore(max(1, settings.gemini_max_concurrency))
+
+        # Changes to the instruction or template invalidate cached results
+        self.prompt_version = hashlib.sha256(
+            (self._get_system_instruction() + PROMPT_TEMPLATE).encode("utf-8")
+        ).hexdigest()[:16]
+        self.cache: Optional[ExtractionCache] = None
+        if settings.extraction_cache_enabled:
+            self.cache = ExtractionCache(
+                path=settings.extraction_cache_path,
+                ttl_seconds=settings.extraction_cache_ttl_seconds,
+                max_entries=settings.extraction_cache_max_entries,
+            )
+
+        self.rules = rules if settings.extraction_rules_enabled else None
+        self.rules_min_confidence = settings.extraction_rules_min_confidence
+        self.required_fields = list(settings.extraction_required_fields)
+        self.metrics = ExtractionMetrics()
 
     def _get_system_instruction(self) -> str:
         """Get system instruction for the AI model."""
@@ -70,16 +183,18 @@ class ExtractionService:
   "location": "北京市朝阳区"
 }"""
 
-    @retry(
-        stop=stop_after_attempt(settings.scraper_max_retries),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(Exception),
-        reraise=True,
-    )
     async def extract(self, title: str, content: str) -> Optional[TenderExtractModel]:
         """
         Extract structured information from tender announcement.
 
+        The rule tier reads labeled fields first. When it finds every field
+        in ``extraction_required_fields`` with enough confidence, Gemini is
+        not called. Otherwise Gemini's result fills the fields the rules
+        missed or were unsure about, while confident rule values are kept.
+        Gemini results are served from the extraction cache when the same
+        title and content were already extracted with the current model and
+        prompt.
+
         Args:
             title: Tender title
             content: Tender content
@@ -88,21 +203,331 @@ class ExtractionService:
             TenderExtractModel with extracted data, or None if extraction fails
 
         Raises:
-            Exception: If extraction fails after retries
+            Exception: If extraction fails after retries and the rules found nothing
         """
+        self.metrics.items += 1
+        rules, extracted = self._apply_rules(title, content)
+        if extracted is not None:
+            return extracted
+
         try:
-            # Prepare prompt
-            prompt = f"""请从以下招标公告中提取关键信息:
+            model_data = await self._extract_with_model(title, content)
+        except Exception:
+            if rules is None or not rules.values:
+                raise
+            logger.warning(f"Gemini failed, keeping rule results for: {title[:50]}")
+            model_data = None
 
-标题: {title}
+        return self._combine(rules, model_data)
 
-内容:
-{content[:5000]}
+    async def extract_batch(
+        self,
+        documents: Sequence[Tuple[str, str]],
+    ) -> List[Optional[TenderExtractModel]]:
+        """
+        Extract many announcements, packing those that need Gemini into few requests.
 
-返回JSON格式的提取结果:"""
+        Rule-tier answers and cache hits are resolved first, as in
+        ``extract``. The rest are packed into requests of up to
+        ``extraction_batch_max_items`` announcements and
+        ``extraction_batch_max_tokens`` estimated input tokens, each asking
+        for a JSON array keyed by announcement id. Every element is
+        validated with TenderExtractModel; announcements missing from a
+        response or failing validation are retried in a smaller request, and
+        a failed request is split in half, down to single-announcement
+        requests with the usual retries.
+
+        Args:
+            documents: (title, content) pairs
+
+        Returns:
+            Extraction results in input order (None where extraction failed)
+        """
+        results: List[Optional[TenderExtractModel]] = [None] * len(documents)
+        rule_results: List[Optional[RuleExtraction]] = []
+        pending: List[Tuple[int, str, str, Optional[str]]] = []
+
+        for index, (title, content) in enumerate(documents):
+            self.metrics.items += 1
+            rules, extracted = self._apply_rules(title, content)
+            rule_results.append(rules)
+            if extracted is not None:
+                results[index] = extracted
+                continue
+
+            content = content[:CONTENT_LIMIT]
+            cache_key, cached = await self._cached(title, content)
+            if cached is not None:
+                results[index] = self._combine(rules, cached)
+                continue
+            pending.append((index, title, content, cache_key))
+
+        model_results: Dict[int, TenderExtractModel] = {}
+        batches = self._pack([(index, title, content) for index, title, content, _ in pending])
+        for part in await asyncio.gather(*(self._extract_packed(batch) for batch in batches)):
+            model_results.update(part)
+
+        for index, title, content, cache_key in pending:
+            model_data = model_results.get(index)
+            if model_data and cache_key:
+                await self.cache.set(cache_key, model_data.model_dump(mode="json"))
+            results[index] = self._combine(rule_results[index], model_data)
+
+        return results
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-tier counters and hit rates for this process."""
+        return self.metrics.to_dict()
+
+    def _apply_rules(
+        self, title: str, content: str
+    ) -> Tuple[Optional[RuleExtraction], Optional[TenderExtractModel]]:
+        """
+        Run the rule tier.
+
+        Returns:
+            (rule result or None when disabled, final result when Gemini can be skipped)
+        """
+        if self.rules is None:
+            return None, None
 
-            # Call Gemini API
-            response = self.model.generate_content(prompt)
+        rules = self.rules.extract(title, content)
+        confident = rules.confident(self.rules_min_confidence)
+        for name in confident:
+            self.metrics.rule_fields[name] = self.metrics.rule_fields.get(name, 0) + 1
+
+        if rules.missing(self.required_fields, self.rules_min_confidence):
+            return rules, None
+
+        self.metrics.rules_only += 1
+        logger.debug(f"Extracted by rules only: {title[:50]}")
+        return rules, TenderExtractModel(**confident)
+
+    def _combine(
+        self,
+        rules: Optional[RuleExtraction],
+        model_data: Optional[TenderExtractModel],
+    ) -> Optional[TenderExtractModel]:
+        """Merge rule and Gemini results (None if neither found anything)."""
+        if rules is None:
+            return model_data
+        if model_data is None and not rules.values:
+            return None
+
+        merged = merge_tiers(
+            rules,
+            model_data.model_dump() if model_data else None,
+            self.rules_min_confidence,
+        )
+        return TenderExtractModel(**merged)
+
+    async def _cached(
+        self, title: str, content: str
+    ) -> Tuple[Optional[str], Optional[TenderExtractModel]]:
+        """Cache key and cached Gemini result (content already truncated)."""
+        if not self.cache:
+            return None, None
+
+        cache_key = self.cache.make_key(
+            title, content, settings.gemini_model, self.prompt_version
+        )
+        cached = await self.cache.get(cache_key)
+        if cached is None:
+            return cache_key, None
+
+        self.metrics.cache_hits += 1
+        logger.debug(f"Extraction cache hit for: {title[:50]}")
+        return cache_key, TenderExtractModel(**cached)
+
+    async def _extract_with_model(self, title: str, content: str) -> Optional[TenderExtractModel]:
+        """Gemini tier, behind the extraction cache."""
+        content = content[:CONTENT_LIMIT]
+
+        cache_key, cached = await self._cached(title, content)
+        if cached is not None:
+            return cached
+
+        self.metrics.model_calls += 1
+        try:
+            tender_data = await self._extract(title, content)
+        except Exception:
+            self.metrics.model_failures += 1
+            raise
+
+        if tender_data and cache_key:
+            await self.cache.set(cache_key, tender_data.model_dump(mode="json"))
+
+        return tender_data
+
+    def _pack(self, documents: List[Tuple[int, str, str]]) -> List[List[Tuple[int, str, str]]]:
+        """Group documents into requests bounded by item count and estimated tokens."""
+        batches: List[List[Tuple[int, str, str]]] = []
+        batch: List[Tuple[int, str, str]] = []
+        tokens = 0
+        for document in documents:
+            size = self._estimate_tokens(document[1], document[2])
+            if batch and (
+                len(batch) >= self.batch_max_items or tokens + size > self.batch_max_tokens
+            ):
+                batches.append(batch)
+                batch, tokens = [], 0
+            batch.append(document)
+            tokens += size
+        if batch:
+            batches.append(batch)
+        return batches
+
+    @staticmethod
+    def _estimate_tokens(title: str, content: str) -> int:
+        """
+        Rough token count of a document in a batched prompt.
+
+        Counts one token per character, which is about right for Chinese and
+        overestimates ASCII, so batches stay under the budget.
+        """
+        return len(title) + len(content) + len(DOCUMENT_TEMPLATE)
+
+    async def _extract_packed(
+        self, documents: List[Tuple[int, str, str]]
+    ) -> Dict[int, TenderExtractModel]:
+        """
+        Extract a packed batch, splitting and retrying what fails.
+
+        Transient API errors are retried on the same batch by
+        ``_generate_batch``; only unusable answers (unparsable, truncated,
+        missing or invalid elements) lead to smaller requests.
+
+        Args:
+            documents: (index, title, content) triples
+
+        Returns:
+            Results by index (indices that could not be extracted are absent)
+        """
+        if len(documents) == 1:
+            index, title, content = documents[0]
+            self.metrics.model_calls += 1
+            try:
+                tender_data = await self._extract(title, content)
+            except Exception as e:
+                self.metrics.model_failures += 1
+                logger.warning(f"Extraction failed for {title[:50]}: {e}")
+                return {}
+            return {index: tender_data} if tender_data else {}
+
+        try:
+            results = await self._extract_batch_request(documents)
+        except BatchResponseError as e:
+            # The answer was unusable as a whole; smaller requests may fit
+            self.metrics.model_failures += 1
+            logger.warning(f"Batched extraction of {len(documents)} items failed: {e}")
+            results = {}
+        except Exception as e:
+            # API errors were already retried with backoff; splitting would
+            # only multiply requests against an exhausted quota
+            self.metrics.model_failures += 1
+            logger.error(f"Batched extraction of {len(documents)} items gave up: {e}")
+            return {}
+
+        failed = [document for document in documents if document[0] not in results]
+        if not failed:
+            return results
+
+        if len(failed) == len(documents):
+            middle = len(documents) // 2
+            parts = [
+                await self._extract_packed(documents[:middle]),
+                await self._extract_packed(documents[middle:]),
+            ]
+        else:
+            logger.info(f"Retrying {len(failed)} of {len(documents)} batched items")
+            parts = [await self._extract_packed(failed)]
+
+        for part in parts:
+            results.update(part)
+        return results
+
+    async def _extract_batch_request(
+        self, documents: List[Tuple[int, str, str]]
+    ) -> Dict[int, TenderExtractModel]:
+        """Send one multi-announcement request and validate each array element."""
+        # Announcements are numbered from 1 within the request
+        by_id = {str(number): document for number, document in enumerate(documents, 1)}
+        prompt = BATCH_PROMPT_TEMPLATE.format(
+            count=len(documents),
+            documents="\n\n".join(
+                DOCUMENT_TEMPLATE.format(id=number, title=title, content=content)
+                for number, (_, title, content) in by_id.items()
+            ),
+        )
+
+        # Counted once per logical request, like single-item calls
+        self.metrics.model_calls += 1
+        self.metrics.batch_calls += 1
+        self.metrics.batched_items += len(documents)
+        response = await self._generate_batch(prompt)
+
+        if self._finish_reason(response) == "MAX_TOKENS":
+            raise BatchResponseError("Response truncated at the output token limit")
+        try:
+            text = response.text or ""
+        except ValueError as e:
+            # Blocked or empty candidates have no text
+            raise BatchResponseError(f"Response has no text: {e}") from e
+
+        elements = self._parse_json_array(text)
+        if elements is None:
+            raise BatchResponseError(f"Expected a JSON array, got: {text[:200]}")
+
+        results: Dict[int, TenderExtractModel] = {}
+        for element in elements:
+            if not isinstance(element, dict):
+                continue
+            document = by_id.get(str(element.pop("id", "")).strip())
+            if document is None:
+                continue
+            try:
+                results[document[0]] = TenderExtractModel(**element)
+            except ValidationError as e:
+                logger.warning(f"Invalid batched result for {document[1][:50]}: {e}")
+        return results
+
+    @retry(
+        stop=stop_after_attempt(settings.scraper_max_retries),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        retry=retry_if_exception_type(Exception),
+        sleep=asyncio.sleep,
+        reraise=True,
+    )
+    async def _generate_batch(self, prompt: str) -> Any:
+        """Send a batched prompt to Gemini (API errors retried with backoff)."""
+        async with self._semaphore:
+            return await self.batch_model.generate_content_async(prompt)
+
+    @staticmethod
+    def _finish_reason(response: Any) -> Optional[str]:
+        """Name of the first candidate's finish reason, if the response has one."""
+        candidates = getattr(response, "candidates", None) or []
+        if not candidates:
+            return None
+        reason = getattr(candidates[0], "finish_reason", None)
+        return getattr(reason, "name", reason)
+
+    @retry(
+        stop=stop_after_attempt(settings.scraper_max_retries),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        retry=retry_if_exception_type(Exception),
+        sleep=asyncio.sleep,
+        reraise=True,
+    )
+    async def _extract(self, title: str, content: str) -> Optional[TenderExtractModel]:
+        """Call Gemini and validate its response (retried on failure)."""
+        try:
+            # Prepare prompt
+            prompt = PROMPT_TEMPLATE.format(title=title, content=content)
+
+            # Call Gemini API without blocking the event loop
+            async with self._semaphore:
+                response = await self.model.generate_content_async(prompt)
 
             if not response.text:
                 logger.warning("Empty response from Gemini API")
@@ -125,6 +550,21 @@ class ExtractionService:
             logger.error(f"Extraction failed: {e}", exc_info=True)
             raise
 
+    def _parse_json_array(self, text: str) -> Optional[list]:
+        """Parse a JSON array from a batched response, handling code fences."""
+        for candidate in (
+            text,
+            *re.findall(r"```(?:json)?\s*(\[.*?\])\s*```", text, re.DOTALL),
+            *re.findall(r"\[.*\]", text, re.DOTALL),
+        ):
+            try:
+                parsed = json.loads(candidate)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(parsed, list):
+                return parsed
+        return None
+
     def _parse_json_response(self, text: str) -> Optional[dict]:
         """Parse JSON from AI response, handling various formats."""
         # Try direct JSON parse first
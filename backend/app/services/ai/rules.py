@@ -0,0 +1,324 @@
+"""Deterministic (regex) extraction tier for templated announcements."""
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+# Confidence of a value found after its label (e.g. "预算金额：50万元"), of a
+# labeled field whose labels disagree, and of an unlabeled pattern match
+LABELED = 0.9
+CONFLICTING = 0.5
+UNLABELED = 0.6
+
+# Label, optional "（万元）" unit, colon; the value follows on the same line
+_LABEL_TAIL = r"\s*(?:[（(](?P<label_unit>[^）)]{1,4})[）)])?\s*[：:]\s*(?P<value>[^\n\r]+)"
+
+_NUMBER = re.compile(
+    r"(?P<currency>人民币|¥|￥)?\s*(?P<number>\d[\d,，]*(?:\.\d+)?)\s*(?P<unit>亿元|万元|元|亿|万)?"
+)
+_DATETIME = re.compile(
+    r"(?P<year>\d{4})\s*[年\-/.]\s*(?P<month>\d{1,2})\s*[月\-/.]\s*(?P<day>\d{1,2})\s*日?"
+    r"(?:\s*(?:上午|下午)?\s*(?P<hour>\d{1,2})\s*[:：时点]\s*(?P<minute>\d{1,2})?)?"
+)
+_PHONE = re.compile(r"(?<!\d)(?:1[3-9]\d{9}|0\d{2,3}[-－—]?\d{7,8}(?:[-－—转]\d{1,6})?)(?!\d)")
+_EMAIL = re.compile(r"[A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,}")
+_NAME = re.compile(r"[一-龥·]{2,6}(?:先生|女士|老师|工)?|[A-Za-z][A-Za-z .]{1,30}")
+# Labels and separators that end a contact name ("张先生电话：139…")
+_NAME_END = re.compile(r"电话|手机|座机|联系方式|联系电话|传真|邮箱|电子邮件|地址|[\s：:,，;；、/（(]")
+# Names of offices rather than people ("采购中心", "招标代理机构")
+_ORGANIZATION = re.compile(r"(?:中心|公司|办公室|单位|机构|代理|部|处|科|局|委|院|所|站|组|室)$")
+
+# Words after a number that make it something other than an amount ("第1包", "2024年")
+_NOT_AMOUNT_AFTER = re.compile(r"\s*(?:包|标段|批次|年|月|日|号|个|项|期|次|%|％)")
+_NOT_AMOUNT_BEFORE = re.compile(r"(?:第|附件|编号|序号)\s*$")
+_LOT_BEFORE = re.compile(r"(?:包|标段)$")  # "包1", unless the number has a unit ("第一包50万元")
+# Several lots priced on one line ("第1包 50万元")
+_LOTS = re.compile(
+    r"第\s*[0-9一二三四五六七八九十]+\s*(?:包|标段|批次)|(?:包|标段)\s*[0-9一二三四五六七八九十]+"
+)
+
+_UNIT_FACTORS = {"元": 1, "万": 10_000, "万元": 10_000, "亿": 100_000_000, "亿元": 100_000_000}
+
+
+def _labeled(labels: str) -> re.Pattern:
+    """Pattern for a labeled value, e.g. ``预算金额（万元）：50``."""
+    return re.compile(rf"(?:{labels}){_LABEL_TAIL}")
+
+
+_PROJECT_NAME = _labeled(r"项目名称|采购项目名称|招标项目名称")
+_BUDGET = _labeled(r"预算金额|采购预算|项目预算|最高限价|招标控制价|控制价")
+_DEADLINE = _labeled(
+    r"提交投标文件截止时间|投标文件递交截止时间|响应文件提交截止时间|投标截止时间|"
+    r"递交截止时间|提交截止时间|截止时间|开标时间"
+)
+_PROJECT_CONTACT_PERSON = _labeled(r"项目联系人")
+_CONTACT_PERSON = _labeled(r"采购联系人|联系人")
+_CONTACT_PHONE = _labeled(r"项目联系电话|联系电话|电话|联系方式")
+_LOCATION = _labeled(r"项目地点|实施地点|交货地点|服务地点|送达地点|开标地点")
+
+
+@dataclass
+class RuleExtraction:
+    """Field values found by the rule tier, each with a confidence in [0, 1]."""
+
+    values: Dict[str, Any] = field(default_factory=dict)
+    confidence: Dict[str, float] = field(default_factory=dict)
+
+    def confident(self, min_confidence: float) -> Dict[str, Any]:
+        """Values whose confidence reaches min_confidence."""
+        return {
+            name: value
+            for name, value in self.values.items()
+            if self.confidence[name] >= min_confidence
+        }
+
+    def missing(self, required: Iterable[str], min_confidence: float) -> List[str]:
+        """Required fields not found with enough confidence."""
+        confident = self.confident(min_confidence)
+        return [name for name in required if name not in confident]
+
+
+class RuleExtractor:
+    """
+    Extracts fields that templated announcements label consistently.
+
+    CCGP-style notices state "项目名称：", "预算金额：…万元", "提交投标文件截止时间：",
+    "联系人：" and "电话：" on their own lines, so these fields can be read
+    without a model. A value found after its label gets high confidence; an
+    unlabeled match (any phone number in the text), or labels that disagree
+    with each other (several 包 with different budgets), get low confidence so
+    the caller can defer to the model.
+    """
+
+    def extract(self, title: str, content: str) -> RuleExtraction:
+        """
+        Extract fields from an announcement.
+
+        Args:
+            title: Tender title
+            content: Tender content
+
+        Returns:
+            Values found, with per-field confidence
+        """
+        text = f"{title}\n{content}"
+        result = RuleExtraction()
+
+        self._labeled_field(result, "project_name", _PROJECT_NAME, text, self._clean_text)
+        self._labeled_field(
+            result, "budget_amount", _BUDGET, text, self._parse_budget,
+            confidence=self._budget_confidence,
+        )
+        self._labeled_field(result, "deadline", _DEADLINE, text, self._parse_datetime)
+        self._labeled_field(result, "location", _LOCATION, text, self._clean_text)
+
+        # Notices list purchaser and agency contacts before the project contact;
+        # prefer the project contact and the phone number that follows it
+        person_at = self._labeled_field(
+            result, "contact_person", _PROJECT_CONTACT_PERSON, text, self._parse_name,
+            confidence=self._name_confidence,
+        )
+        if person_at is None:
+            person_at = self._labeled_field(
+                result, "contact_person", _CONTACT_PERSON, text, self._parse_name,
+                confidence=self._name_confidence,
+            )
+        phone_at = None
+        if person_at is not None:
+            phone_at = self._labeled_field(
+                result, "contact_phone", _CONTACT_PHONE, text, self._parse_phone,
+                pos=person_at, first_only=True,
+            )
+        if phone_at is None:
+            phone_at = self._labeled_field(
+                result, "contact_phone", _CONTACT_PHONE, text, self._parse_phone
+            )
+        if phone_at is None:
+            self._unlabeled_field(result, "contact_phone", _PHONE.findall(text))
+        self._unlabeled_field(
+            result, "contact_email", _EMAIL.findall(text), confident_if_unique=True
+        )
+
+        return result
+
+    @staticmethod
+    def _labeled_field(
+        result: RuleExtraction,
+        name: str,
+        pattern: re.Pattern,
+        text: str,
+        parse: Callable[[str, Optional[str]], Any],
+        pos: int = 0,
+        first_only: bool = False,
+        confidence: Optional[Callable[[str, Any], float]] = None,
+    ) -> Optional[int]:
+        """
+        Read a labeled field; disagreeing labels lower the confidence.
+
+        Args:
+            result: Result to fill in
+            name: Field name
+            pattern: Labeled-value pattern
+            text: Announcement text
+            parse: Turns the raw value (and the label's unit) into the field value
+            pos: Position to start searching at
+            first_only: Take the first parsable value and ignore later labels
+            confidence: Confidence of one (raw value, parsed value) pair
+                (LABELED when not given); the lowest one used is kept
+
+        Returns:
+            Position of the first label used, or None if nothing was found
+        """
+        values = []
+        first_at = None
+        lowest = LABELED
+        for match in pattern.finditer(text, pos):
+            raw = match.group("value")
+            value = parse(raw, match.group("label_unit"))
+            if value is None:
+                continue
+            if first_at is None:
+                first_at = match.start()
+            if value not in values:
+                values.append(value)
+            if confidence is not None:
+                lowest = min(lowest, confidence(raw, value))
+            if first_only:
+                break
+        if not values:
+            return None
+
+        result.values[name] = values[0]
+        result.confidence[name] = lowest if len(values) == 1 else min(lowest, CONFLICTING)
+        return first_at
+
+    @staticmethod
+    def _unlabeled_field(
+        result: RuleExtraction,
+        name: str,
+        matches: List[str],
+        confident_if_unique: bool = False,
+    ) -> None:
+        """Take the first pattern match anywhere in the text."""
+        distinct = list(dict.fromkeys(match.strip() for match in matches))
+        if not distinct:
+            return
+        result.values[name] = distinct[0]
+        unique = confident_if_unique and len(distinct) == 1
+        result.confidence[name] = LABELED if unique else UNLABELED
+
+    @staticmethod
+    def _clean_text(value: str, label_unit: Optional[str] = None) -> Optional[str]:
+        """Labeled free text, cut at the next full stop or field separator."""
+        value = re.split(r"[；;。]|\s{2,}", value.strip(), maxsplit=1)[0].strip()
+        return value[:200] or None
+
+    @staticmethod
+    def _parse_name(value: str, label_unit: Optional[str] = None) -> Optional[str]:
+        """Contact name at the start of the labeled value, up to the next label."""
+        value = value.strip()
+        end = _NAME_END.search(value)
+        if end is not None:
+            value = value[: end.start()]
+        match = _NAME.match(value)
+        return match.group(0).strip() if match else None
+
+    @staticmethod
+    def _name_confidence(raw: str, name: str) -> float:
+        """Office names ("采购中心") are not reliable contact persons."""
+        return UNLABELED if _ORGANIZATION.search(name) else LABELED
+
+    @staticmethod
+    def _parse_phone(value: str, label_unit: Optional[str] = None) -> Optional[str]:
+        """First phone number in the labeled value."""
+        match = _PHONE.search(value)
+        return match.group(0) if match else None
+
+    @staticmethod
+    def _parse_budget(value: str, label_unit: Optional[str] = None) -> Optional[float]:
+        """
+        Amount in yuan, normalizing 万元/亿元 (from the value or the label).
+
+        A number counts as the amount only if it starts the value or carries
+        a currency sign or unit (its own or the label's), and is not a lot,
+        year, date or attachment number ("第1包", "2024年", "详见附件2").
+        """
+        value = value.strip()
+        label_unit = (label_unit or "").strip()
+        for match in _NUMBER.finditer(value):
+            before = value[: match.start("number")]
+            if _NOT_AMOUNT_AFTER.match(value, match.end()) or _NOT_AMOUNT_BEFORE.search(before):
+                continue
+            marked = match.group("currency") or match.group("unit")
+            if not marked and _LOT_BEFORE.search(before):
+                continue
+            if not (match.start() == 0 or marked or label_unit):
+                continue
+            number = float(match.group("number").replace(",", "").replace("，", ""))
+            factor = _UNIT_FACTORS.get(match.group("unit") or label_unit or "元")
+            if factor is None:
+                return None
+            return round(number * factor, 2)
+        return None
+
+    @staticmethod
+    def _budget_confidence(raw: str, amount: float) -> float:
+        """A line pricing several lots does not give the project's budget."""
+        return CONFLICTING if _LOTS.search(raw) else LABELED
+
+    @staticmethod
+    def _parse_datetime(value: str, label_unit: Optional[str] = None) -> Optional[datetime]:
+        """First date (and time) in the labeled value."""
+        match = _DATETIME.search(value)
+        if not match:
+            return None
+        hour = int(match.group("hour") or 0)
+        if "下午" in value[: match.end()] and hour < 12:
+            hour += 12
+        try:
+            return datetime(
+                int(match.group("year")),
+                int(match.group("month")),
+                int(match.group("day")),
+                hour,
+                int(match.group("minute") or 0),
+            )
+        except ValueError:
+            return None
+
+
+def merge_tiers(
+    rules: RuleExtraction,
+    model_values: Optional[Dict[str, Any]],
+    min_confidence: float,
+) -> Dict[str, Any]:
+    """
+    Combine rule and model results field by field.
+
+    Confident rule values win, the model fills the remaining fields, and
+    low-confidence rule values are used only where the model has nothing.
+
+    Args:
+        rules: Rule tier result
+        model_values: Model result (None if the model was not called or failed)
+        min_confidence: Confidence at which rule values are trusted
+
+    Returns:
+        Merged values
+    """
+    merged: Dict[str, Any] = {}
+    confident = rules.confident(min_confidence)
+    model_values = model_values or {}
+
+    for name in set(rules.values) | set(model_values):
+        if name in confident:
+            merged[name] = confident[name]
+        elif model_values.get(name) is not None:
+            merged[name] = model_values[name]
+        elif name in rules.values:
+            merged[name] = rules.values[name]
+    return merged
+
+
+# Create singleton instance
+rule_extractor = RuleExtractor()
@@ -0,0 +1,44 @@
+"""Set-based deduplication lookups for scraped tenders."""
+from typing import Iterable, Set
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.tender import Tender
+
+# Keeps the IN (...) parameter list well below driver limits
+LOOKUP_CHUNK_SIZE = 500
+
+
+async def find_existing_urls(
+    db: AsyncSession,
+    source_name: str,
+    urls: Iterable[str],
+) -> Set[str]:
+    """
+    Return the subset of urls already stored for a source.
+
+    Issues one ``source_url IN (...)`` query per chunk and selects only the key
+    column, served by the (source_name, source_url) unique index.
+
+    Args:
+        db: Database session
+        source_name: Source name
+        urls: Candidate source URLs
+
+    Returns:
+        Set of URLs that already exist
+    """
+    pending = list(dict.fromkeys(urls))
+    existing: Set[str] = set()
+
+    for start in range(0, len(pending), LOOKUP_CHUNK_SIZE):
+        chunk = pending[start:start + LOOKUP_CHUNK_SIZE]
+        result = await db.execute(
+            select(Tender.source_url).where(
+                Tender.source_name == source_name,
+                Tender.source_url.in_(chunk),
+            )
+        )
+        existing.update(result.scalars().all())
+
+    return existing
@@ -1,11 +1,210 @@
 """Filtering service for tender announcements."""
+import json
 import logging
-import re
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from typing import Optional, Dict, Any, FrozenSet, List, Sequence
+
+from app.services.filter_plan import FilterPlan, KeywordMatcher, RuleContext, compile_expr
 
 logger = logging.getLogger(__name__)
 
 
+class CompiledRules:
+    """One filter rule set, compiled for repeated and batch evaluation."""
+
+    def __init__(self, filter_rules: Dict[str, Any]) -> None:
+        """
+        Initialize compiled rules.
+
+        Args:
+            filter_rules: Filter rules dictionary (see FilterService.apply_filters)
+        """
+        self.exclude_keywords: List[str] = filter_rules.get("exclude_keywords") or []
+        self.include_keywords: List[str] = filter_rules.get("include_keywords") or []
+        self.title_exclude: List[str] = filter_rules.get("title_exclude") or []
+        self.title_include: List[str] = filter_rules.get("title_include") or []
+        self.min_budget: Optional[float] = filter_rules.get("min_budget")
+        self.max_budget: Optional[float] = filter_rules.get("max_budget")
+        self.plan: Optional[FilterPlan] = (
+            compile_expr(filter_rules["expr"]) if filter_rules.get("expr") else None
+        )
+
+        self._exclude_lowered = [(k, k.lower()) for k in self.exclude_keywords]
+        self._title_exclude_lowered = [(k, k.lower()) for k in self.title_exclude]
+        self._include_lowered = frozenset(k.lower() for k in self.include_keywords)
+        self._title_include_lowered = frozenset(k.lower() for k in self.title_include)
+
+        # One scan of the combined text and one of the title cover all four lists
+        self._text_matcher = KeywordMatcher(self.exclude_keywords + self.include_keywords)
+        self._title_matcher = KeywordMatcher(self.title_exclude + self.title_include)
+
+    def evaluate(self, title: str, content: str) -> tuple[bool, Optional[str]]:
+        """
+        Apply the rules that do not need extraction.
+
+        Keyword rules run first; the filter expression then rejects items
+        whose outcome is already False without extracted fields.
+
+        Args:
+            title: Tender title
+            content: Tender content
+
+        Returns:
+            Tuple of (is_filtered, filter_reason)
+        """
+        text_found: FrozenSet[str] = frozenset()
+        if self.exclude_keywords or self.include_keywords:
+            text_found = self._text_matcher.find(f"{title} {content}".lower())
+        title_found: FrozenSet[str] = frozenset()
+        if self.title_exclude or self.title_include:
+            title_found = self._title_matcher.find(title.lower())
+
+        # Check exclude keywords (in title or content); report the first listed
+        for keyword, lowered in self._exclude_lowered:
+            if lowered in text_found:
+                return True, f"Contains excluded keyword: {keyword}"
+
+        # Check title exclude keywords
+        for keyword, lowered in self._title_exclude_lowered:
+            if lowered in title_found:
+                return True, f"Title contains excluded keyword: {keyword}"
+
+        # Check include keywords (must have at least one)
+        if self.include_keywords and text_found.isdisjoint(self._include_lowered):
+            return True, f"Does not contain any required keywords: {self.include_keywords}"
+
+        # Check title include keywords
+        if self.title_include and title_found.isdisjoint(self._title_include_lowered):
+            return True, f"Title does not contain required keywords: {self.title_include}"
+
+        if self.plan is not None:
+            return self.plan.evaluate(RuleContext(title, content))
+
+        return False, None
+
+    def evaluate_extracted(
+        self,
+        title: str,
+        content: str,
+        extracted: Dict[str, Any],
+    ) -> tuple[bool, Optional[str]]:
+        """
+        Apply the rules that need extracted fields.
+
+        Args:
+            title: Tender title
+            content: Tender content
+            extracted: Extracted fields (TenderExtractModel as a dict)
+
+        Returns:
+            Tuple of (is_filtered, filter_reason)
+        """
+        is_filtered, reason = self.evaluate_budget(extracted.get("budget_amount"))
+        if is_filtered or self.plan is None or not self.plan.extracted_fields:
+            return is_filtered, reason
+
+        return self.plan.evaluate(RuleContext(title, content, extracted))
+
+    @property
+    def uses_content(self) -> bool:
+        """Whether the rules look at the content (not just the title)."""
+        return bool(
+            self.exclude_keywords
+            or self.include_keywords
+            or (self.plan is not None and self.plan.uses_content)
+        )
+
+    def evaluate_budget(self, budget_amount: Optional[float]) -> tuple[bool, Optional[str]]:
+        """
+        Apply the budget range.
+
+        Args:
+            budget_amount: Extracted budget amount (None is never filtered)
+
+        Returns:
+            Tuple of (is_filtered, filter_reason)
+        """
+        if budget_amount is None:
+            return False, None
+
+        # Check minimum budget
+        if self.min_budget is not None and budget_amount < self.min_budget:
+            return True, f"Budget {budget_amount} below minimum {self.min_budget}"
+
+        # Check maximum budget
+        if self.max_budget is not None and budget_amount > self.max_budget:
+            return True, f"Budget {budget_amount} above maximum {self.max_budget}"
+
+        return False, None
+
+    def evaluate_batch(
+        self,
+        titles: Sequence[str],
+        contents: Sequence[str],
+        budgets: Optional[Sequence[Optional[float]]] = None,
+        extracted: Optional[Sequence[Optional[Dict[str, Any]]]] = None,
+    ) -> List[tuple[bool, Optional[str]]]:
+        """
+        Apply keyword rules, then the budget range, to many tenders.
+
+        Matches what the scrape pipeline decides per item: keyword rules and
+        the filter expression's pre-extraction check first, then the budget
+        range and the full expression for items they keep.
+
+        Args:
+            titles: Tender titles
+            contents: Tender contents (ignored when ``uses_content`` is False)
+            budgets: Budget amounts in the same order (None to skip budget rules)
+            extracted: Extracted fields per tender for the filter expression
+                (None, or a None entry, for tenders without extracted data)
+
+        Returns:
+            (is_filtered, filter_reason) per tender, in input order
+        """
+        has_keywords = (
+            self.uses_content or self.title_exclude or self.title_include or self.plan is not None
+        )
+        if has_keywords:
+            results = [self.evaluate(title, content) for title, content in zip(titles, contents)]
+        else:
+            results = [(False, None)] * len(titles)
+
+        if budgets is not None and (self.min_budget is not None or self.max_budget is not None):
+            # Range check over the whole column; reasons are only built for misses
+            low = self.min_budget if self.min_budget is not None else float("-inf")
+            high = self.max_budget if self.max_budget is not None else float("inf")
+            for index, budget in enumerate(budgets):
+                if budget is not None and not low <= budget <= high and not results[index][0]:
+                    results[index] = self.evaluate_budget(budget)
+
+        if extracted is not None and self.plan is not None and self.plan.extracted_fields:
+            for index, fields in enumerate(extracted):
+                if fields is not None and not results[index][0]:
+                    results[index] = self.plan.evaluate(
+                        RuleContext(titles[index], contents[index], fields)
+                    )
+        return results
+
+
+@lru_cache(maxsize=256)
+def _compile_rules_json(rules_json: str) -> CompiledRules:
+    """Compile rules from their canonical JSON (the cache key)."""
+    return CompiledRules(json.loads(rules_json))
+
+
+def compile_rules(filter_rules: Dict[str, Any]) -> CompiledRules:
+    """
+    Return compiled rules, compiling each distinct rule set once.
+
+    Args:
+        filter_rules: Filter rules dictionary
+
+    Returns:
+        Compiled rules
+    """
+    return _compile_rules_json(json.dumps(filter_rules, sort_keys=True, ensure_ascii=False))
+
+
 class FilterService:
     """Service for filtering tender announcements based on rules."""
 
@@ -36,40 +235,16 @@ class FilterService:
             "title_exclude": ["keyword6"],  # Title must not contain any
             "min_budget": 100000,  # Minimum budget (optional, requires extraction first)
             "max_budget": 5000000,  # Maximum budget (optional)
+            "expr": {"all": [...]},  # Filter expression, see filter_plan.compile_expr
         }
+
+        Items an ``expr`` already rejects without extracted fields are
+        filtered here, before extraction.
         """
         if not filter_rules:
             return False, None
 
-        combined_text = f"{title} {content}".lower()
-
-        # Check exclude keywords (in title or content)
-        exclude_keywords = filter_rules.get("exclude_keywords", [])
-        for keyword in exclude_keywords:
-            if keyword.lower() in combined_text:
-                return True, f"Contains excluded keyword: {keyword}"
-
-        # Check title exclude keywords
-        title_exclude = filter_rules.get("title_exclude", [])
-        for keyword in title_exclude:
-            if keyword.lower() in title.lower():
-                return True, f"Title contains excluded keyword: {keyword}"
-
-        # Check include keywords (must have at least one)
-        include_keywords = filter_rules.get("include_keywords", [])
-        if include_keywords:
-            has_keyword = any(keyword.lower() in combined_text for keyword in include_keywords)
-            if not has_keyword:
-                return True, f"Does not contain any required keywords: {include_keywords}"
-
-        # Check title include keywords
-        title_include = filter_rules.get("title_include", [])
-        if title_include:
-            has_keyword = any(keyword.lower() in title.lower() for keyword in title_include)
-            if not has_keyword:
-                return True, f"Title does not contain required keywords: {title_include}"
-
-        return False, None
+        return compile_rules(filter_rules).evaluate(title, content)
 
     @staticmethod
     def apply_budget_filters(
@@ -89,17 +264,57 @@ class FilterService:
         if not filter_rules or budget_amount is None:
             return False, None
 
-        # Check minimum budget
-        min_budget = filter_rules.get("min_budget")
-        if min_budget is not None and budget_amount < min_budget:
-            return True, f"Budget {budget_amount} below minimum {min_budget}"
+        return compile_rules(filter_rules).evaluate_budget(budget_amount)
 
-        # Check maximum budget
-        max_budget = filter_rules.get("max_budget")
-        if max_budget is not None and budget_amount > max_budget:
-            return True, f"Budget {budget_amount} above maximum {max_budget}"
+    @staticmethod
+    def apply_extracted_filters(
+        title: str,
+        content: str,
+        extracted: Dict[str, Any],
+        filter_rules: Optional[Dict[str, Any]],
+    ) -> tuple[bool, Optional[str]]:
+        """
+        Apply budget filters and the filter expression after extraction.
 
-        return False, None
+        Args:
+            title: Tender title
+            content: Tender content
+            extracted: Extracted fields (TenderExtractModel as a dict)
+            filter_rules: Filter rules dictionary
+
+        Returns:
+            Tuple of (is_filtered, filter_reason)
+        """
+        if not filter_rules:
+            return False, None
+
+        return compile_rules(filter_rules).evaluate_extracted(title, content, extracted)
+
+    @staticmethod
+    def apply_filters_batch(
+        titles: Sequence[str],
+        contents: Sequence[str],
+        budgets: Optional[Sequence[Optional[float]]],
+        filter_rules: Optional[Dict[str, Any]],
+        extracted: Optional[Sequence[Optional[Dict[str, Any]]]] = None,
+    ) -> List[tuple[bool, Optional[str]]]:
+        """
+        Apply keyword and budget filters to many tenders at once.
+
+        Args:
+            titles: Tender titles
+            contents: Tender contents
+            budgets: Budget amounts in the same order (None to skip budget rules)
+            filter_rules: Filter rules dictionary
+            extracted: Extracted fields per tender for the filter expression
+
+        Returns:
+            (is_filtered, filter_reason) per tender, in input order
+        """
+        if not filter_rules:
+            return [(False, None)] * len(titles)
+
+        return compile_rules(filter_rules).evaluate_batch(titles, contents, budgets, extracted)
 
 
 # Create singleton instance
@@ -0,0 +1,524 @@
+"""Filter expressions (``filter_rules["expr"]``) compiled into evaluation plans."""
+import re
+from datetime import datetime, timezone
+from typing import Any, Dict, FrozenSet, List, Optional, Set
+from zoneinfo import ZoneInfo
+
+from app.config import settings
+
+# Fields available before extraction, and the extracted fields predicates may use
+TEXT_FIELDS = ("title", "content", "text")
+EXTRACTED_FIELDS = (
+    "project_name",
+    "budget_amount",
+    "budget_currency",
+    "deadline",
+    "contact_person",
+    "contact_phone",
+    "contact_email",
+    "location",
+)
+
+# Groups re-rank their children after this many evaluations
+_REORDER_EVERY = 256
+
+# Zone of naive deadlines (announcements state local times)
+_LOCAL_ZONE = ZoneInfo(settings.filter_timezone)
+
+
+class KeywordMatcher:
+    """
+    Finds which of a set of keywords occur in a text, in one regex scan.
+
+    Keywords are lowercased and merged into a single regex shaped like a
+    trie, so each scan position is checked against all keywords at once
+    instead of running one substring search per keyword. A match reports the
+    longest keyword starting at its position; keywords contained in it are
+    added from a precomputed table, so overlapping keywords are all found.
+    """
+
+    def __init__(self, keywords: List[str]) -> None:
+        """
+        Initialize matcher.
+
+        Args:
+            keywords: Keywords to look for (case-insensitive)
+        """
+        lowered = sorted({keyword.lower() for keyword in keywords})
+        # An empty keyword is contained in every text
+        self._always: FrozenSet[str] = frozenset(k for k in lowered if not k)
+        words = [k for k in lowered if k]
+        self._pattern = re.compile(self._trie_pattern(words)) if words else None
+        self._contained = {
+            word: frozenset(other for other in words if other in word) for word in words
+        }
+
+    def find(self, text: str) -> FrozenSet[str]:
+        """
+        Return the lowercased keywords occurring in text.
+
+        Args:
+            text: Text that is already lowercased
+
+        Returns:
+            Keywords found
+        """
+        if self._pattern is None:
+            return self._always
+
+        found = set(self._always)
+        search = self._pattern.search
+        match = search(text)
+        while match is not None:
+            found |= self._contained[match.group()]
+            match = search(text, match.start() + 1)
+        return frozenset(found)
+
+    @staticmethod
+    def _trie_pattern(words: List[str]) -> str:
+        """Regex matching the longest of words, with common prefixes shared."""
+        trie: Dict[str, Any] = {}
+        for word in words:
+            node = trie
+            for char in word:
+                node = node.setdefault(char, {})
+            node[""] = {}
+
+        def build(node: Dict[str, Any]) -> str:
+            branches = [re.escape(char) + build(child) for char, child in node.items() if char]
+            if not branches:
+                return ""
+            body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+            return f"(?:{body})?" if "" in node else body
+
+        return build(trie)
+
+
+class FilterRuleError(ValueError):
+    """Raised when a filter expression is malformed."""
+
+
+class RuleContext:
+    """
+    One tender as seen by a plan.
+
+    ``extracted`` is None before extraction; predicates on extracted fields
+    are then unknown. Lowercased texts and predicate results are cached, so
+    reporting why an item failed does not evaluate anything twice.
+    """
+
+    def __init__(
+        self,
+        title: str,
+        content: str,
+        extracted: Optional[Dict[str, Any]] = None,
+        now: Optional[datetime] = None,
+    ) -> None:
+        """
+        Initialize context.
+
+        Args:
+            title: Tender title
+            content: Tender content
+            extracted: Extracted fields (None before extraction)
+            now: Reference time for deadline windows (defaults to now)
+        """
+        self.title = title
+        self.content = content
+        self.extracted = extracted
+        self.now = now or datetime.now(timezone.utc)
+        self.results: Dict[int, Optional[bool]] = {}
+        self._lowered: Dict[str, str] = {}
+
+    def text(self, field: str) -> str:
+        """Raw value of a text field."""
+        if field == "title":
+            return self.title
+        if field == "content":
+            return self.content
+        return f"{self.title} {self.content}"
+
+    def lowered(self, field: str) -> str:
+        """Lowercased value of a text field, computed once."""
+        value = self._lowered.get(field)
+        if value is None:
+            value = self._lowered[field] = self.text(field).lower()
+        return value
+
+
+class PlanNode:
+    """
+    Node of a compiled plan.
+
+    ``evaluate`` uses three-valued logic: True, False, or None when the result
+    depends on extracted fields that are not known (yet). Unknown values never
+    turn a False into True, so a False before extraction is final.
+    """
+
+    cost = 1.0
+    label = ""
+
+    def evaluate(self, context: RuleContext) -> Optional[bool]:
+        """Evaluate once per context (results are cached on the context)."""
+        key = id(self)
+        if key not in context.results:
+            context.results[key] = self._evaluate(context)
+        return context.results[key]
+
+    def explain(self, context: RuleContext) -> str:
+        """Describe the part of the expression that made it False."""
+        return self.label
+
+    def fields(self) -> Set[str]:
+        """Fields the node reads."""
+        return set()
+
+    def _evaluate(self, context: RuleContext) -> Optional[bool]:
+        raise NotImplementedError
+
+
+class _Group(PlanNode):
+    """Shared ordering logic for ``all`` and ``any``."""
+
+    # Child result that decides the group (False for all, True for any)
+    decisive = False
+
+    def __init__(self, children: List[PlanNode], label: str) -> None:
+        self.children = sorted(children, key=lambda child: child.cost)
+        self.cost = sum(child.cost for child in children)
+        self.label = label
+        self._evaluations = 0
+        self._decided = {id(child): 0 for child in children}
+
+    def fields(self) -> Set[str]:
+        return set().union(*(child.fields() for child in self.children))
+
+    def _evaluate(self, context: RuleContext) -> Optional[bool]:
+        self._evaluations += 1
+        if self._evaluations % _REORDER_EVERY == 0:
+            self._reorder()
+
+        unknown = False
+        for child in self.children:
+            result = child.evaluate(context)
+            if result is None:
+                unknown = True
+            elif result is self.decisive:
+                self._decided[id(child)] += 1
+                return self.decisive
+        return None if unknown else not self.decisive
+
+    def _reorder(self) -> None:
+        """
+        Run cheap children that decide the group most often first.
+
+        Ranks by cost per decision, using how often each child has decided
+        the group so far (smoothed so an unlucky start is not final).
+        """
+        total = self._evaluations + 2
+        self.children.sort(
+            key=lambda child: child.cost * total / (self._decided[id(child)] + 1)
+        )
+
+
+class AllNode(_Group):
+    """True when every child is True."""
+
+    decisive = False
+
+    def explain(self, context: RuleContext) -> str:
+        for child in self.children:
+            if child.evaluate(context) is False:
+                return child.explain(context)
+        return self.label
+
+
+class AnyNode(_Group):
+    """True when at least one child is True."""
+
+    decisive = True
+
+
+class NotNode(PlanNode):
+    """Negation (unknown stays unknown)."""
+
+    def __init__(self, child: PlanNode, label: str) -> None:
+        self.child = child
+        self.cost = child.cost
+        self.label = label
+
+    def fields(self) -> Set[str]:
+        return self.child.fields()
+
+    def _evaluate(self, context: RuleContext) -> Optional[bool]:
+        result = self.child.evaluate(context)
+        return None if result is None else not result
+
+
+class ContainsNode(PlanNode):
+    """Field contains any of the keywords (case-insensitive)."""
+
+    def __init__(self, field: str, keywords: List[str], label: str) -> None:
+        self.field = field
+        self.keywords = frozenset(keyword.lower() for keyword in keywords)
+        self.matcher = KeywordMatcher(keywords)
+        self.cost = _text_cost(field, 4.0)
+        self.label = label
+
+    def fields(self) -> Set[str]:
+        return {self.field}
+
+    def _evaluate(self, context: RuleContext) -> Optional[bool]:
+        if self.field in TEXT_FIELDS:
+            return bool(self.matcher.find(context.lowered(self.field)))
+        value = _extracted_value(context, self.field)
+        if value is None:
+            return None
+        return bool(self.matcher.find(str(value).lower()))
+
+
+class RegexNode(PlanNode):
+    """Field matches a regular expression (``re.search``)."""
+
+    def __init__(self, field: str, pattern: str, label: str) -> None:
+        try:
+            self.pattern = re.compile(pattern)
+        except re.error as e:
+            raise FilterRuleError(f"Invalid regex {pattern!r}: {e}") from e
+        self.field = field
+        self.cost = _text_cost(field, 8.0)
+        self.label = label
+
+    def fields(self) -> Set[str]:
+        return {self.field}
+
+    def _evaluate(self, context: RuleContext) -> Optional[bool]:
+        if self.field in TEXT_FIELDS:
+            return self.pattern.search(context.text(self.field)) is not None
+        value = _extracted_value(context, self.field)
+        if value is None:
+            return None
+        return self.pattern.search(str(value)) is not None
+
+
+class RangeNode(PlanNode):
+    """Numeric extracted field within [min, max]."""
+
+    def __init__(
+        self, field: str, low: Optional[float], high: Optional[float], label: str
+    ) -> None:
+        self.field = field
+        self.low = low
+        self.high = high
+        self.label = label
+
+    def fields(self) -> Set[str]:
+        return {self.field}
+
+    def _evaluate(self, context: RuleContext) -> Optional[bool]:
+        value = _extracted_value(context, self.field)
+        if value is None:
+            return None
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            return None
+        if self.low is not None and value < self.low:
+            return False
+        return self.high is None or value <= self.high
+
+
+class DeadlineWindowNode(PlanNode):
+    """Date field between ``min_days`` and ``max_days`` days from now."""
+
+    def __init__(
+        self,
+        field: str,
+        min_days: Optional[float],
+        max_days: Optional[float],
+        label: str,
+    ) -> None:
+        self.field = field
+        self.min_days = min_days
+        self.max_days = max_days
+        self.label = label
+
+    def fields(self) -> Set[str]:
+        return {self.field}
+
+    def _evaluate(self, context: RuleContext) -> Optional[bool]:
+        value = _extracted_value(context, self.field)
+        if isinstance(value, str):
+            try:
+                value = datetime.fromisoformat(value)
+            except ValueError:
+                return None
+        if not isinstance(value, datetime):
+            return None
+
+        now = context.now
+        if value.tzinfo is None:
+            # Naive deadlines are wall-clock times in the announcements' zone;
+            # compare them with the reference time on that clock
+            if now.tzinfo is not None:
+                now = now.astimezone(_LOCAL_ZONE)
+            now = now.replace(tzinfo=None)
+        elif now.tzinfo is None:
+            now = now.replace(tzinfo=timezone.utc)
+        days = (value - now).total_seconds() / 86400
+        if self.min_days is not None and days < self.min_days:
+            return False
+        return self.max_days is None or days <= self.max_days
+
+
+class FilterPlan:
+    """
+    A compiled filter expression.
+
+    The expression describes the tenders to keep; a tender is filtered out
+    when it evaluates to False. A result that is still unknown after
+    extraction (e.g. no deadline was found) keeps the tender, like budget
+    rules do for tenders without a budget.
+    """
+
+    def __init__(self, root: PlanNode) -> None:
+        """
+        Initialize plan.
+
+        Args:
+            root: Compiled expression
+        """
+        self.root = root
+        self.fields: Set[str] = root.fields()
+
+    @property
+    def uses_content(self) -> bool:
+        """Whether any predicate reads the content."""
+        return bool(self.fields & {"content", "text"})
+
+    @property
+    def extracted_fields(self) -> Set[str]:
+        """Extracted fields the plan reads."""
+        return self.fields & set(EXTRACTED_FIELDS)
+
+    def evaluate(self, context: RuleContext) -> tuple[bool, Optional[str]]:
+        """
+        Evaluate the plan.
+
+        Args:
+            context: Tender to evaluate
+
+        Returns:
+            Tuple of (is_filtered, filter_reason)
+        """
+        if self.root.evaluate(context) is False:
+            return True, f"Does not match filter expression: {self.root.explain(context)}"
+        return False, None
+
+
+def compile_expr(expr: Any) -> FilterPlan:
+    """
+    Compile a filter expression.
+
+    Expression format (JSON)::
+
+        {"all": [expr, ...]}                        # every expr holds
+        {"any": [expr, ...]}                        # at least one holds
+        {"not": expr}
+        {"field": "title", "contains": ["软件", "系统"]}  # any keyword, case-insensitive
+        {"field": "content", "regex": "预算金额[:：]"}
+        {"field": "location", "contains": ["北京"]}
+        {"field": "budget_amount", "min": 100000, "max": 5000000}
+        {"field": "deadline", "min_days": 0}         # deadline not passed
+        {"field": "deadline", "min_days": 3, "max_days": 30}
+
+    ``title``, ``content`` and ``text`` (title and content) are known before
+    extraction; the other fields come from extraction.
+
+    Args:
+        expr: Expression from ``filter_rules["expr"]``
+
+    Returns:
+        Compiled plan
+
+    Raises:
+        FilterRuleError: If the expression is malformed
+    """
+    return FilterPlan(_compile_node(expr))
+
+
+def _compile_node(expr: Any) -> PlanNode:
+    """Compile one expression node."""
+    if not isinstance(expr, dict) or not expr:
+        raise FilterRuleError(f"Expression must be a non-empty object: {expr!r}")
+
+    for operator, node_class in (("all", AllNode), ("any", AnyNode)):
+        if operator in expr:
+            children = expr[operator]
+            if len(expr) != 1 or not isinstance(children, list) or not children:
+                raise FilterRuleError(f'"{operator}" takes a non-empty list of expressions')
+            compiled = [_compile_node(child) for child in children]
+            return node_class(compiled, f"{operator}({', '.join(c.label for c in compiled)})")
+
+    if "not" in expr:
+        if len(expr) != 1:
+            raise FilterRuleError('"not" takes a single expression')
+        child = _compile_node(expr["not"])
+        return NotNode(child, f"not {child.label}")
+
+    field = expr.get("field")
+    if field not in TEXT_FIELDS and field not in EXTRACTED_FIELDS:
+        raise FilterRuleError(f"Unknown field: {field!r}")
+    operators = set(expr) - {"field"}
+
+    if operators == {"contains"}:
+        keywords = expr["contains"]
+        if not isinstance(keywords, list) or not all(isinstance(k, str) for k in keywords):
+            raise FilterRuleError('"contains" takes a list of strings')
+        return ContainsNode(field, keywords, f"{field} contains {keywords}")
+
+    if operators == {"regex"}:
+        if not isinstance(expr["regex"], str):
+            raise FilterRuleError('"regex" takes a string')
+        return RegexNode(field, expr["regex"], f"{field} matches {expr['regex']!r}")
+
+    if operators and operators <= {"min", "max"}:
+        if field != "budget_amount":
+            raise FilterRuleError(f'"min"/"max" apply to budget_amount, not {field}')
+        low, high = _numbers(expr, "min", "max")
+        return RangeNode(field, low, high, f"{field} in [{low}, {high}]")
+
+    if operators and operators <= {"min_days", "max_days"}:
+        if field != "deadline":
+            raise FilterRuleError(f'"min_days"/"max_days" apply to deadline, not {field}')
+        low, high = _numbers(expr, "min_days", "max_days")
+        return DeadlineWindowNode(field, low, high, f"{field} in [{low}, {high}] days")
+
+    raise FilterRuleError(f"Unsupported predicate for {field}: {sorted(operators)}")
+
+
+def _numbers(expr: Dict[str, Any], *keys: str) -> List[Optional[float]]:
+    """Read optional numeric bounds."""
+    values = []
+    for key in keys:
+        value = expr.get(key)
+        if value is not None and (isinstance(value, bool) or not isinstance(value, (int, float))):
+            raise FilterRuleError(f'"{key}" must be a number')
+        values.append(value)
+    return values
+
+
+def _text_cost(field: str, per_scan: float) -> float:
+    """Relative cost of scanning a field (titles are short)."""
+    if field == "title":
+        return per_scan / 4
+    if field in TEXT_FIELDS:
+        return per_scan
+    return 1.0
+
+
+def _extracted_value(context: RuleContext, field: str) -> Any:
+    """Extracted field value (None when unknown or not extracted yet)."""
+    if context.extracted is None:
+        return None
+    return context.extracted.get(field)
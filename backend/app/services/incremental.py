@@ -0,0 +1,250 @@
+"""Per-source incremental crawl state."""
+import base64
+import hashlib
+import math
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set
+
+from app.config import settings
+from app.services.scraper.base import ScrapedItem, published_before
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings, serializable to base64."""
+
+    def __init__(self, capacity: int, error_rate: float, data: Optional[bytes] = None) -> None:
+        """
+        Initialize filter.
+
+        Args:
+            capacity: Number of items the filter is sized for
+            error_rate: Target false-positive rate at capacity
+            data: Serialized bit array from a previous filter of the same size
+        """
+        self.capacity = max(1, capacity)
+        self.bits = max(8, int(-self.capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.bits / self.capacity * math.log(2)))
+        size = (self.bits + 7) // 8
+        self.data = bytearray(data) if data is not None and len(data) == size else bytearray(size)
+
+    def add(self, value: str) -> None:
+        """Add a value."""
+        for position in self._positions(value):
+            self.data[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, value: str) -> bool:
+        return all(self.data[p >> 3] & (1 << (p & 7)) for p in self._positions(value))
+
+    def _positions(self, value: str) -> List[int]:
+        """Bit positions for value (double hashing over one sha256 digest)."""
+        digest = hashlib.sha256(value.encode("utf-8")).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:16], "little") | 1
+        return [(first + i * second) % self.bits for i in range(self.hashes)]
+
+    def to_base64(self) -> str:
+        """Serialized bit array."""
+        return base64.b64encode(bytes(self.data)).decode("ascii")
+
+
+class IncrementalState:
+    """
+    Wrapper around ``SourceConfig.incremental_state``.
+
+    Tracks, for items a run actually stored:
+
+    - ``high_water_mark``: the newest ``published_at``; scrapers stop
+      paginating at pages older than it.
+    - ``latest_original_id``: the source's ID of the newest stored item.
+    - a rolling Bloom filter of recent URLs. Two generations are kept and the
+      older one is dropped once the current one reaches capacity, so the
+      filter covers roughly the last ``bloom_capacity`` to twice that many URLs.
+
+    The filter is only a hint. It holds URLs listed since the state was
+    created, old generations rotate out, and concurrent runs overwrite each
+    other's state, so a URL it has never seen may still be stored: stored
+    URLs are always looked up in the database. The filter only
+    short-circuits positives where a rare false positive is harmless, such
+    as deciding that a list page whose URLs were all seen before ends
+    pagination.
+    """
+
+    def __init__(
+        self,
+        data: Optional[Dict[str, Any]] = None,
+        bloom_capacity: Optional[int] = None,
+        bloom_error_rate: Optional[float] = None,
+    ) -> None:
+        """
+        Initialize state.
+
+        Args:
+            data: Stored state (None for a source that has never run)
+            bloom_capacity: URLs per filter generation (defaults to settings)
+            bloom_error_rate: Filter false-positive rate (defaults to settings)
+        """
+        self.data: Dict[str, Any] = dict(data or {})
+        self.bloom_capacity = bloom_capacity or settings.incremental_bloom_capacity
+        self.bloom_error_rate = bloom_error_rate or settings.incremental_bloom_error_rate
+
+        bloom = self.data.get("recent_urls") or {}
+        self._bloom_count = int(bloom.get("count", 0))
+        self._bloom_ready = bool(bloom)
+        self._current = self._load_filter(bloom.get("current"))
+        self._previous = self._load_filter(bloom["previous"]) if bloom.get("previous") else None
+
+    @property
+    def high_water_mark(self) -> Optional[datetime]:
+        """Newest stored publication time, if known."""
+        value = self.data.get("high_water_mark")
+        return datetime.fromisoformat(value) if value else None
+
+    @property
+    def latest_original_id(self) -> Optional[str]:
+        """Source ID of the newest stored item, if known."""
+        return self.data.get("latest_original_id")
+
+    def might_contain(self, url: str) -> bool:
+        """Whether url may have been seen (False before the first run)."""
+        if not self._bloom_ready:
+            return False
+        return url in self._current or (self._previous is not None and url in self._previous)
+
+    def all_seen(self, urls: Iterable[str]) -> bool:
+        """
+        Whether every URL is in the recent-URL filter.
+
+        A miss says nothing (the URL may still be stored) and a hit may be a
+        false positive, so use this only to skip work that is cheap to get
+        wrong; all of a page's URLs being false positives is vanishingly rare.
+        """
+        urls = list(urls)
+        return bool(urls) and all(self.might_contain(url) for url in urls)
+
+    async def known_urls(
+        self,
+        urls: Iterable[str],
+        lookup: Callable[[List[str]], Awaitable[Set[str]]],
+    ) -> Set[str]:
+        """
+        Return the stored subset of urls.
+
+        Every URL goes to the database: filter misses are not proof that a
+        URL is new, and filter hits may be false positives.
+
+        Args:
+            urls: Candidate URLs
+            lookup: Database lookup
+
+        Returns:
+            URLs already stored
+        """
+        candidates = list(dict.fromkeys(urls))
+        if not candidates:
+            return set()
+        return await lookup(candidates)
+
+    async def page_known_urls(
+        self,
+        urls: Iterable[str],
+        lookup: Callable[[List[str]], Awaitable[Set[str]]],
+    ) -> Set[str]:
+        """
+        Stored subset of a list page's URLs, for deciding where pagination stops.
+
+        A page whose URLs were all seen by earlier runs counts as known
+        without a query; otherwise the database answers.
+        """
+        urls = list(urls)
+        if self.all_seen(urls):
+            return set(urls)
+        return await self.known_urls(urls, lookup)
+
+    def remember(self, urls: Iterable[str]) -> None:
+        """Add stored URLs to the recent-URL filter, rotating it when full."""
+        for url in urls:
+            if url in self._current:
+                continue
+            if self._bloom_count >= self.bloom_capacity:
+                self._previous = self._current
+                self._current = self._load_filter(None)
+                self._bloom_count = 0
+            self._current.add(url)
+            self._bloom_count += 1
+        self._bloom_ready = True
+
+    def reached_mark(self, items: Iterable[ScrapedItem]) -> bool:
+        """Whether any item is not newer than the high-water mark (so the listing overlaps it)."""
+        mark = self.high_water_mark
+        return mark is not None and any(
+            item.published_at is not None and not published_before(mark, item.published_at)
+            for item in items
+        )
+
+    def advance(
+        self,
+        items: Iterable[ScrapedItem],
+        pending: Iterable[ScrapedItem] = (),
+        complete: bool = True,
+    ) -> None:
+        """
+        Move the high-water mark and latest ID past stored items.
+
+        Scrapers treat everything older than the mark as done, so the mark
+        never moves past an item that is still missing: it stays at or below
+        the oldest pending item, and does not move at all when the listing was
+        cut short before reaching the old mark (the unlisted items may lie
+        anywhere between the old mark and the last listed item).
+
+        Args:
+            items: Items written by the current run, in list order
+            pending: Listed items that are new but were not stored (e.g. failed)
+            complete: Whether the listing covered everything newer than the old mark
+        """
+        if not complete:
+            return
+
+        ceiling: Optional[datetime] = None
+        for item in pending:
+            if item.published_at is not None and (
+                ceiling is None or published_before(item.published_at, ceiling)
+            ):
+                ceiling = item.published_at
+
+        items = [
+            item
+            for item in items
+            if ceiling is None or not published_before(ceiling, item.published_at)
+        ]
+        mark = self.high_water_mark
+        newest: Optional[ScrapedItem] = None
+        for item in items:
+            if item.published_at is not None and (
+                mark is None or published_before(mark, item.published_at)
+            ):
+                mark, newest = item.published_at, item
+
+        if newest is None and items and all(item.published_at is None for item in items):
+            # Undated lists are newest first
+            newest = items[0]
+
+        if mark is not None:
+            self.data["high_water_mark"] = mark.isoformat()
+        if newest is not None and newest.original_id:
+            self.data["latest_original_id"] = newest.original_id
+
+    def to_dict(self) -> Dict[str, Any]:
+        """State to store on the source."""
+        data = dict(self.data)
+        if self._bloom_ready:
+            data["recent_urls"] = {
+                "count": self._bloom_count,
+                "current": self._current.to_base64(),
+                "previous": self._previous.to_base64() if self._previous else None,
+            }
+        return data
+
+    def _load_filter(self, encoded: Optional[str]) -> BloomFilter:
+        """Build a filter generation, from its serialized bits if given."""
+        data = base64.b64decode(encoded) if encoded else None
+        return BloomFilter(self.bloom_capacity, self.bloom_error_rate, data)
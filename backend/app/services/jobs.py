@@ -0,0 +1,236 @@
+"""Background job manager for source tasks."""
+import asyncio
+import logging
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.services.refilter import RefilterProgress, refilter_service
+from app.services.task import TaskProgress, task_service
+
+logger = logging.getLogger(__name__)
+
+JOB_PENDING = "pending"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+
+# Job kinds
+JOB_SCRAPE = "scrape"
+JOB_REFILTER = "refilter"
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+@dataclass
+class Job:
+    """A submitted source task (scrape or re-filter) and its live progress."""
+
+    id: str
+    source_id: int
+    source_name: str
+    limit: Optional[int] = None
+    kind: str = JOB_SCRAPE
+    status: str = JOB_PENDING
+    progress: Union[TaskProgress, RefilterProgress] = field(default_factory=TaskProgress)
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    created_at: datetime = field(default_factory=_utcnow)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    task: Optional[asyncio.Task] = field(default=None, repr=False)
+
+    @property
+    def is_active(self) -> bool:
+        """Whether the job is still pending or running."""
+        return self.status in (JOB_PENDING, JOB_RUNNING)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable job status."""
+        duration = None
+        if self.started_at:
+            duration = round(
+                ((self.finished_at or _utcnow()) - self.started_at).total_seconds(), 3
+            )
+
+        return {
+            "job_id": self.id,
+            "source_id": self.source_id,
+            "source_name": self.source_name,
+            "kind": self.kind,
+            "status": self.status,
+            "limit": self.limit,
+            **self.progress.to_dict(),
+            "error": self.error,
+            "created_at": self.created_at.isoformat(),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "duration_seconds": duration,
+            "result": self.result,
+        }
+
+
+class JobManager:
+    """
+    Runs source tasks in the background and tracks their status.
+
+    Submitting a source that already has a pending or running job of the
+    same kind returns that job instead of starting a second run. At most
+    ``max_workers`` jobs run at once, each on its own session and bounded by
+    ``timeout``. Jobs are kept in memory, so status is per process; finished
+    jobs beyond ``retention`` are dropped.
+    """
+
+    def __init__(self, max_workers: int, retention: int, timeout: float) -> None:
+        """
+        Initialize job manager.
+
+        Args:
+            max_workers: Maximum number of jobs running at once
+            retention: Number of jobs kept for status queries
+            timeout: Per-job timeout in seconds
+        """
+        self.retention = max(1, retention)
+        self.timeout = timeout
+        self.jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._active_by_source: Dict[Tuple[str, int], Job] = {}
+        self._semaphore = asyncio.Semaphore(max(1, max_workers))
+
+    def submit(self, source_id: int, source_name: str, limit: int) -> Job:
+        """
+        Submit a task for a source, joining the active job if there is one.
+
+        Args:
+            source_id: Source configuration ID
+            source_name: Source name (for status display)
+            limit: Maximum items to scrape
+
+        Returns:
+            The new or already active job
+        """
+        return self._submit(
+            Job(id=uuid.uuid4().hex, source_id=source_id, source_name=source_name, limit=limit)
+        )
+
+    def submit_refilter(self, source_id: int, source_name: str) -> Job:
+        """
+        Submit a re-filter of a source's stored tenders, joining the active one if there is one.
+
+        Args:
+            source_id: Source configuration ID
+            source_name: Source name (for status display)
+
+        Returns:
+            The new or already active job
+        """
+        return self._submit(Job(
+            id=uuid.uuid4().hex,
+            source_id=source_id,
+            source_name=source_name,
+            kind=JOB_REFILTER,
+            progress=RefilterProgress(),
+        ))
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Look up a job by ID."""
+        return self.jobs.get(job_id)
+
+    def list(self) -> List[Job]:
+        """Jobs in submission order, newest first."""
+        return list(reversed(self.jobs.values()))
+
+    def _submit(self, job: Job) -> Job:
+        """Start job unless the source already has an active job of the same kind."""
+        key = (job.kind, job.source_id)
+        active = self._active_by_source.get(key)
+        if active is not None and active.is_active:
+            logger.info(f"Joining active {job.kind} job {active.id} for source {job.source_name}")
+            return active
+
+        self.jobs[job.id] = job
+        self._active_by_source[key] = job
+        job.task = asyncio.create_task(self._run(job))
+        self._prune()
+        return job
+
+    async def wait(self, job: Job) -> Job:
+        """Wait for a job to finish."""
+        if job.task is not None:
+            await asyncio.shield(job.task)
+        return job
+
+    async def stop(self) -> None:
+        """Cancel all active jobs."""
+        tasks = [job.task for job in self.jobs.values() if job.task and not job.task.done()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _run(self, job: Job) -> None:
+        """Run the job once a worker slot is free."""
+        try:
+            async with self._semaphore:
+                job.status = JOB_RUNNING
+                job.started_at = _utcnow()
+                async with AsyncSessionLocal() as session:
+                    job.result = await asyncio.wait_for(
+                        self._execute(session, job),
+                        timeout=self.timeout,
+                    )
+                job.status = JOB_SUCCEEDED
+        except asyncio.TimeoutError:
+            job.status = JOB_FAILED
+            job.error = f"Timed out after {self.timeout}s"
+            logger.error(f"Job {job.id} for {job.source_name} timed out")
+        except asyncio.CancelledError:
+            job.status = JOB_FAILED
+            job.error = "Cancelled"
+            raise
+        except Exception as e:
+            job.status = JOB_FAILED
+            job.error = str(e)
+            logger.error(f"Job {job.id} for {job.source_name} failed: {e}")
+        finally:
+            job.finished_at = _utcnow()
+            if self._active_by_source.get((job.kind, job.source_id)) is job:
+                del self._active_by_source[(job.kind, job.source_id)]
+
+    @staticmethod
+    async def _execute(session: AsyncSession, job: Job) -> Dict[str, Any]:
+        """Run the job's work on session."""
+        if job.kind == JOB_REFILTER:
+            return await refilter_service.run_refilter(
+                session, job.source_id, progress=job.progress
+            )
+        return await task_service.run_source_task(
+            session,
+            job.source_id,
+            job.limit,
+            progress=job.progress,
+        )
+
+    def _prune(self) -> None:
+        """Drop the oldest finished jobs beyond the retention limit."""
+        excess = len(self.jobs) - self.retention
+        for job_id in list(self.jobs):
+            if excess <= 0:
+                break
+            if not self.jobs[job_id].is_active:
+                del self.jobs[job_id]
+                excess -= 1
+
+
+# Create singleton instance
+job_manager = JobManager(
+    max_workers=settings.task_max_concurrent_sources,
+    retention=settings.job_retention,
+    timeout=settings.task_source_timeout,
+)
@@ -0,0 +1,63 @@
+"""Keyset (cursor) pagination for tender listings."""
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Optional, Tuple
+
+from sqlalchemy import Select, desc, tuple_
+
+from app.models.tender import Tender
+
+
+def encode_cursor(created_at: datetime, tender_id: int) -> str:
+    """
+    Build an opaque cursor pointing after the given row.
+
+    Args:
+        created_at: Creation time of the last row on the page
+        tender_id: ID of the last row on the page
+
+    Returns:
+        URL-safe cursor token
+    """
+    payload = json.dumps([created_at.isoformat(), tender_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Parse a cursor produced by encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, tender_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), int(tender_id)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+
+
+def paginate_by_created_at(query: Select, limit: int, cursor: Optional[str] = None) -> Select:
+    """
+    Order newest first and continue after the cursor position.
+
+    The row comparison on (created_at, id) is served by the
+    ix_tenders_created_at_id index, so every page costs the same regardless
+    of how deep it is.
+
+    Args:
+        query: Tender select with filters applied
+        limit: Page size
+        cursor: Cursor from the previous page, if any
+
+    Returns:
+        Query for the page
+    """
+    if cursor:
+        created_at, tender_id = decode_cursor(cursor)
+        query = query.where(tuple_(Tender.created_at, Tender.id) < tuple_(created_at, tender_id))
+
+    return query.order_by(desc(Tender.created_at), desc(Tender.id)).limit(limit)
@@ -0,0 +1,214 @@
+"""Streaming pipeline of bounded asyncio stages."""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Marks the end of a stage's input
+_DONE = object()
+
+StageHandler = Callable[[Any], Awaitable[Optional[Any]]]
+BatchStageHandler = Callable[[List[Any]], Awaitable[List[Any]]]
+
+
+@dataclass
+class StageStats:
+    """Throughput counters for a single pipeline stage."""
+
+    name: str
+    workers: int = 1
+    items_in: int = 0
+    items_out: int = 0
+    errors: int = 0
+    busy_seconds: float = 0.0
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+
+    @property
+    def elapsed(self) -> float:
+        """Wall time from the stage's first item to its drain."""
+        if self.started_at is None or self.finished_at is None:
+            return 0.0
+        return self.finished_at - self.started_at
+
+    def summary(self) -> Dict[str, Any]:
+        """Serializable summary for task results."""
+        elapsed = self.elapsed
+        return {
+            "workers": self.workers,
+            "in": self.items_in,
+            "out": self.items_out,
+            "errors": self.errors,
+            "busy_seconds": round(self.busy_seconds, 3),
+            "elapsed_seconds": round(elapsed, 3),
+            "items_per_second": round(self.items_in / elapsed, 2) if elapsed > 0 else None,
+        }
+
+
+@dataclass
+class Stage:
+    """
+    A pool of workers consuming from a bounded input queue.
+
+    The handler returns the value to pass to the next stage, or None to drop
+    the item. Handler exceptions are logged and counted, and the item is dropped.
+
+    With batch_size > 1 the handler receives a list of whatever items are
+    already queued (up to batch_size, never waiting for more) and returns the
+    list of values to pass on.
+    """
+
+    name: str
+    handler: Union[StageHandler, BatchStageHandler]
+    workers: int = 1
+    queue_size: int = 20
+    batch_size: int = 1
+    stats: StageStats = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Initialize stats."""
+        self.workers = max(1, self.workers)
+        self.batch_size = max(1, self.batch_size)
+        self.stats = StageStats(name=self.name, workers=self.workers)
+
+
+class Pipeline:
+    """
+    Runs items from an async source through a chain of stages.
+
+    Each stage reads from its own bounded queue, so a slow stage applies
+    backpressure to the ones before it instead of buffering the whole run.
+    """
+
+    def __init__(self, stages: List[Stage], source_name: str = "source") -> None:
+        """
+        Initialize pipeline.
+
+        Args:
+            stages: Stages in processing order
+            source_name: Stats name for the item source
+        """
+        self.stages = stages
+        self.source_stats = StageStats(name=source_name)
+
+    async def run(self, source: AsyncIterator[Any]) -> None:
+        """
+        Feed items from source through all stages until drained.
+
+        Raises:
+            Exception: Re-raises any error raised by the source iterator
+        """
+        queues = [asyncio.Queue(maxsize=max(1, stage.queue_size)) for stage in self.stages]
+        tasks: List[asyncio.Task] = []
+        all_workers: List[asyncio.Task] = []
+
+        for index, stage in enumerate(self.stages):
+            out_queue = queues[index + 1] if index + 1 < len(queues) else None
+            workers = [
+                asyncio.create_task(self._worker(stage, queues[index], out_queue))
+                for _ in range(stage.workers)
+            ]
+            all_workers.extend(workers)
+            tasks.append(asyncio.create_task(self._supervise(stage, workers, out_queue)))
+
+        try:
+            first_queue = queues[0] if queues else None
+            consumers = self.stages[0].workers if self.stages else 0
+            await self._produce(source, first_queue, consumers)
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks + all_workers:
+                task.cancel()
+            await asyncio.gather(*tasks, *all_workers, return_exceptions=True)
+            raise
+
+    async def _produce(
+        self,
+        source: AsyncIterator[Any],
+        queue: Optional[asyncio.Queue],
+        consumers: int,
+    ) -> None:
+        """Push source items into the first queue, then signal completion."""
+        stats = self.source_stats
+        stats.started_at = time.monotonic()
+        try:
+            async for item in source:
+                stats.items_in += 1
+                stats.items_out += 1
+                if queue is not None:
+                    await queue.put(item)
+        finally:
+            stats.finished_at = time.monotonic()
+
+        if queue is not None:
+            for _ in range(consumers):
+                await queue.put(_DONE)
+
+    async def _supervise(
+        self,
+        stage: Stage,
+        workers: List[asyncio.Task],
+        out_queue: Optional[asyncio.Queue],
+    ) -> None:
+        """Wait for a stage's workers, then signal the next stage."""
+        await asyncio.gather(*workers)
+        stage.stats.finished_at = time.monotonic()
+
+        if out_queue is not None:
+            next_stage = self.stages[self.stages.index(stage) + 1]
+            for _ in range(next_stage.workers):
+                await out_queue.put(_DONE)
+
+    async def _worker(
+        self,
+        stage: Stage,
+        in_queue: asyncio.Queue,
+        out_queue: Optional[asyncio.Queue],
+    ) -> None:
+        """Process items from in_queue until the end marker arrives."""
+        stats = stage.stats
+        done = False
+        while not done:
+            item = await in_queue.get()
+            if item is _DONE:
+                return
+
+            batch = [item]
+            while len(batch) < stage.batch_size and not in_queue.empty():
+                item = in_queue.get_nowait()
+                if item is _DONE:
+                    done = True
+                    break
+                batch.append(item)
+
+            if stats.started_at is None:
+                stats.started_at = time.monotonic()
+            stats.items_in += len(batch)
+
+            started = time.monotonic()
+            try:
+                if stage.batch_size > 1:
+                    results = await stage.handler(batch)
+                else:
+                    results = [await stage.handler(batch[0])]
+            except Exception as e:
+                logger.error(f"Pipeline stage '{stage.name}' failed on {len(batch)} item(s): {e}")
+                stats.errors += len(batch)
+                results = []
+            finally:
+                stats.busy_seconds += time.monotonic() - started
+
+            for result in results:
+                if result is None:
+                    continue
+                stats.items_out += 1
+                if out_queue is not None:
+                    await out_queue.put(result)
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Per-stage throughput summary."""
+        stats = [self.source_stats] + [stage.stats for stage in self.stages]
+        return {stage_stats.name: stage_stats.summary() for stage_stats in stats}
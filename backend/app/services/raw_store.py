@@ -0,0 +1,88 @@
+"""Content-addressed store for raw detail HTML."""
+import hashlib
+import threading
+from typing import Any, Dict, Iterable, Optional
+
+import zstandard
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import dialect_insert
+from app.models.tender import RawDocument
+
+# zstd contexts are not safe for concurrent use; pack_document runs in worker threads
+_local = threading.local()
+_decompressor = zstandard.ZstdDecompressor()
+
+
+def _compressor() -> zstandard.ZstdCompressor:
+    """This thread's compressor."""
+    compressor = getattr(_local, "compressor", None)
+    if compressor is None:
+        compressor = _local.compressor = zstandard.ZstdCompressor(
+            level=settings.raw_html_compression_level
+        )
+    return compressor
+
+
+def pack_document(html: str) -> Dict[str, Any]:
+    """
+    Compress an HTML document for storage.
+
+    Safe to call from worker threads (e.g. ``asyncio.to_thread``).
+
+    Args:
+        html: Raw HTML
+
+    Returns:
+        RawDocument column values (hash, data, size)
+    """
+    encoded = html.encode("utf-8")
+    return {
+        "hash": hashlib.sha256(encoded).hexdigest(),
+        "data": _compressor().compress(encoded),
+        "size": len(encoded),
+    }
+
+
+def unpack_document(data: bytes) -> str:
+    """Decompress a stored document back to HTML."""
+    return _decompressor.decompress(data).decode("utf-8")
+
+
+async def store_documents(db: AsyncSession, documents: Iterable[Dict[str, Any]]) -> None:
+    """
+    Insert packed documents, skipping hashes that are already stored.
+
+    Args:
+        db: Database session
+        documents: Values from pack_document
+    """
+    documents = list(documents)
+    if not documents:
+        return
+
+    stmt = (
+        dialect_insert(db, RawDocument)
+        .values(documents)
+        .on_conflict_do_nothing(index_elements=["hash"])
+    )
+    await db.execute(stmt)
+
+
+async def load_document(db: AsyncSession, digest: str) -> Optional[str]:
+    """
+    Load and decompress a stored document.
+
+    Args:
+        db: Database session
+        digest: Document hash
+
+    Returns:
+        HTML, or None if no document is stored under the hash
+    """
+    data = await db.scalar(select(RawDocument.data).where(RawDocument.hash == digest))
+    if data is None:
+        return None
+    return unpack_document(data)
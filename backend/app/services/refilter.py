@@ -0,0 +1,176 @@
+"""Re-apply a source's filter rules to its stored tenders."""
+import logging
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import String, cast, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.tender import SourceConfig, Tender
+from app.services.filter import compile_rules
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RefilterProgress:
+    """Live counters for a running re-filter."""
+
+    scanned: int = 0  # Tenders evaluated
+    updated: int = 0  # Tenders whose is_filtered/filter_reason changed
+    filtered: int = 0  # Tenders filtered out under the current rules
+    unextracted: int = 0  # Tenders kept under the current rules that have no extracted data
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Counters as a dict."""
+        return asdict(self)
+
+
+class RefilterService:
+    """Recomputes ``is_filtered``/``filter_reason`` for stored tenders in chunks."""
+
+    def __init__(self, chunk_size: int) -> None:
+        """
+        Initialize service.
+
+        Args:
+            chunk_size: Rows read, evaluated and updated per round trip
+        """
+        self.chunk_size = max(1, chunk_size)
+
+    async def run_refilter(
+        self,
+        db: AsyncSession,
+        source_id: int,
+        progress: Optional[RefilterProgress] = None,
+    ) -> Dict[str, Any]:
+        """
+        Re-filter a source by ID (the entry point for background jobs).
+
+        Args:
+            db: Database session
+            source_id: Source configuration ID
+            progress: Optional counters updated while the re-filter runs
+
+        Returns:
+            Counts as returned by refilter_source
+        """
+        source = await db.get(SourceConfig, source_id)
+        if source is None:
+            raise ValueError(f"Source config {source_id} not found")
+        return await self.refilter_source(db, source, progress)
+
+    async def refilter_source(
+        self,
+        db: AsyncSession,
+        source: SourceConfig,
+        progress: Optional[RefilterProgress] = None,
+    ) -> Dict[str, Any]:
+        """
+        Evaluate the source's current filter rules over all of its tenders.
+
+        Rows are read in primary-key order with keyset pagination, evaluated
+        as a batch, and only rows whose decision changed are written, with
+        one bulk UPDATE and commit per chunk. Budget rules and the filter
+        expression use the stored extracted columns; tenders that were never
+        extracted have none and are judged on keywords only, as in the
+        scrape pipeline.
+
+        Tenders rejected before extraction were never extracted, so a rule
+        change that now keeps them leaves them without extracted fields.
+        They are counted as ``unextracted`` (together with tenders whose
+        extraction failed) rather than extracted here, which would call the
+        model for every newly kept tender.
+
+        Args:
+            db: Database session
+            source: Source whose tenders to re-filter
+            progress: Optional counters updated after every chunk
+
+        Returns:
+            Counts of scanned, updated, (now) filtered and kept-but-unextracted tenders
+        """
+        if progress is None:
+            progress = RefilterProgress()
+
+        # Read source attributes up front; commits below expire the instance
+        source_id, source_name = source.id, source.name
+        rules = compile_rules(source.filter_rules) if source.filter_rules else None
+        columns = [
+            Tender.id,
+            Tender.title,
+            Tender.budget_amount,
+            Tender.is_filtered,
+            Tender.filter_reason,
+            # A Python None is stored as JSON null, not SQL NULL
+            or_(
+                Tender.extracted_data.is_(None),
+                cast(Tender.extracted_data, String) == "null",
+            ).label("unextracted"),
+        ]
+        if rules is not None and rules.uses_content:
+            columns.append(Tender.content)
+        # Stored extracted columns the filter expression reads
+        plan_fields = sorted(rules.plan.extracted_fields) if rules and rules.plan else []
+        columns.extend(
+            getattr(Tender, field) for field in plan_fields if field != "budget_amount"
+        )
+
+        last_id = 0
+        while True:
+            result = await db.execute(
+                select(*columns)
+                .where(Tender.source_name == source_name, Tender.id > last_id)
+                .order_by(Tender.id)
+                .limit(self.chunk_size)
+            )
+            rows = result.all()
+            if not rows:
+                break
+            last_id = rows[-1].id
+
+            if rules is None:
+                decisions = [(False, None)] * len(rows)
+            else:
+                decisions = rules.evaluate_batch(
+                    [row.title for row in rows],
+                    [row.content for row in rows] if rules.uses_content else [""] * len(rows),
+                    [
+                        float(row.budget_amount) if row.budget_amount is not None else None
+                        for row in rows
+                    ],
+                    [
+                        {field: getattr(row, field) for field in plan_fields} for row in rows
+                    ] if plan_fields else None,
+                )
+
+            changes: List[Dict[str, Any]] = []
+            for row, (is_filtered, filter_reason) in zip(rows, decisions):
+                progress.filtered += is_filtered
+                if not is_filtered and row.unextracted:
+                    progress.unextracted += 1
+                if row.is_filtered != is_filtered or row.filter_reason != filter_reason:
+                    changes.append({
+                        "id": row.id,
+                        "is_filtered": is_filtered,
+                        "filter_reason": filter_reason,
+                    })
+
+            if changes:
+                await db.execute(update(Tender), changes)
+                await db.commit()
+
+            progress.scanned += len(rows)
+            progress.updated += len(changes)
+
+        logger.info(
+            f"Re-filtered {source_name}: {progress.scanned} scanned, "
+            f"{progress.updated} updated, {progress.filtered} filtered, "
+            f"{progress.unextracted} kept without extracted data"
+        )
+        return {"source_id": source_id, **progress.to_dict()}
+
+
+# Create singleton instance
+refilter_service = RefilterService(chunk_size=settings.refilter_chunk_size)
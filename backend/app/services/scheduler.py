@@ -0,0 +1,210 @@
+"""In-process cron scheduler for source tasks."""
+import asyncio
+import logging
+import random
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, Optional
+from zoneinfo import ZoneInfo
+from croniter import croniter
+from sqlalchemy import select
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models.tender import SourceConfig
+from app.services.jobs import job_manager
+
+logger = logging.getLogger(__name__)
+
+SourceRunner = Callable[[int], Awaitable[object]]
+ScheduleLoader = Callable[[], Awaitable[Dict[int, str]]]
+
+
+@dataclass
+class _ScheduleEntry:
+    """Cron state for one source."""
+
+    source_id: int
+    cron: str
+    next_run: datetime
+
+
+class CronScheduler:
+    """
+    Fires source tasks according to ``SourceConfig.schedule_cron``.
+
+    - Missed runs are coalesced: after a late tick (or a long run) the source
+      fires once and its next run is computed from the current time.
+    - At most one run per source is in flight in this process; a due run is
+      skipped while the previous one is still going. Runs go through the job
+      manager, so a scheduled run also joins a job submitted via the API.
+    - Each run starts after a random delay of up to ``jitter_seconds`` so
+      sources sharing an expression do not hit the network at the same instant.
+
+    Only one process should run the scheduler (see ``settings.scheduler_enabled``).
+    """
+
+    def __init__(
+        self,
+        runner: Optional[SourceRunner] = None,
+        loader: Optional[ScheduleLoader] = None,
+        tick_seconds: float = 5.0,
+        refresh_seconds: float = 60.0,
+        jitter_seconds: float = 0.0,
+        timezone: str = "UTC",
+    ) -> None:
+        """
+        Initialize scheduler.
+
+        Args:
+            runner: Coroutine function running one source (defaults to a job_manager job)
+            loader: Coroutine function returning {source_id: cron} for active sources
+            tick_seconds: Interval between due checks
+            refresh_seconds: Interval between schedule reloads from the database
+            jitter_seconds: Maximum random delay before each run
+            timezone: Timezone cron expressions are evaluated in
+        """
+        self.runner = runner or self._run_source
+        self.loader = loader or self._load_schedules
+        self.tick_seconds = tick_seconds
+        self.refresh_seconds = refresh_seconds
+        self.jitter_seconds = jitter_seconds
+        self.timezone = ZoneInfo(timezone)
+
+        self.entries: Dict[int, _ScheduleEntry] = {}
+        self.running: Dict[int, asyncio.Task] = {}
+
+        self._task: Optional[asyncio.Task] = None
+        self._last_refresh: Optional[datetime] = None
+
+    def start(self) -> None:
+        """Start the scheduler loop in the background."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._loop())
+            logger.info("Cron scheduler started")
+
+    async def stop(self) -> None:
+        """Stop the loop and cancel in-flight runs."""
+        tasks = list(self.running.values())
+        if self._task is not None:
+            tasks.append(self._task)
+            self._task = None
+
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.running.clear()
+        logger.info("Cron scheduler stopped")
+
+    def now(self) -> datetime:
+        """Current time in the scheduler timezone."""
+        return datetime.now(self.timezone)
+
+    async def _loop(self) -> None:
+        """Check for due sources every tick."""
+        while True:
+            try:
+                await self.tick(self.now())
+            except Exception as e:
+                logger.error(f"Scheduler tick failed: {e}", exc_info=True)
+            await asyncio.sleep(self.tick_seconds)
+
+    async def tick(self, now: datetime) -> None:
+        """Reload schedules if due, then start every source whose run is due."""
+        if (
+            self._last_refresh is None
+            or (now - self._last_refresh).total_seconds() >= self.refresh_seconds
+        ):
+            await self.refresh(now)
+
+        for entry in self.entries.values():
+            if entry.next_run > now:
+                continue
+
+            # Coalesce: however many runs were missed, fire once and move on
+            entry.next_run = self._next_run(entry.cron, now)
+
+            running = self.running.get(entry.source_id)
+            if running is not None and not running.done():
+                logger.info(f"Skipping scheduled run of source {entry.source_id}: still running")
+                continue
+
+            self.running[entry.source_id] = asyncio.create_task(self._fire(entry.source_id))
+
+    async def refresh(self, now: datetime) -> None:
+        """Sync schedule entries with the active sources."""
+        schedules = await self.loader()
+        self._last_refresh = now
+
+        for source_id in list(self.entries):
+            if source_id not in schedules:
+                del self.entries[source_id]
+
+        for source_id, cron in schedules.items():
+            entry = self.entries.get(source_id)
+            if entry is not None and entry.cron == cron:
+                continue
+            if not croniter.is_valid(cron):
+                logger.warning(f"Invalid cron expression for source {source_id}: {cron!r}")
+                self.entries.pop(source_id, None)
+                continue
+            self.entries[source_id] = _ScheduleEntry(
+                source_id=source_id,
+                cron=cron,
+                next_run=self._next_run(cron, now),
+            )
+
+    def _next_run(self, cron: str, after: datetime) -> datetime:
+        """Next fire time strictly after the given time."""
+        return croniter(cron, after).get_next(datetime)
+
+    async def _fire(self, source_id: int) -> None:
+        """Run one source after the jitter delay."""
+        try:
+            if self.jitter_seconds > 0:
+                await asyncio.sleep(random.uniform(0, self.jitter_seconds))
+            logger.info(f"Scheduled run starting for source {source_id}")
+            await self.runner(source_id)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Scheduled run failed for source {source_id}: {e}")
+        finally:
+            if self.running.get(source_id) is asyncio.current_task():
+                del self.running[source_id]
+
+    @staticmethod
+    async def _load_schedules() -> Dict[int, str]:
+        """Load cron expressions of active sources from the database."""
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(
+                select(SourceConfig.id, SourceConfig.schedule_cron).where(
+                    SourceConfig.is_active == True,
+                    SourceConfig.schedule_cron.is_not(None),
+                )
+            )
+            return {source_id: cron.strip() for source_id, cron in result.all() if cron.strip()}
+
+    @staticmethod
+    async def _run_source(source_id: int) -> None:
+        """Submit a source task to the job manager and wait for it."""
+        async with AsyncSessionLocal() as session:
+            source_name = await session.scalar(
+                select(SourceConfig.name).where(SourceConfig.id == source_id)
+            )
+
+        job = job_manager.submit(
+            source_id,
+            source_name or str(source_id),
+            settings.scheduler_run_limit,
+        )
+        await job_manager.wait(job)
+
+
+# Create singleton instance
+scheduler = CronScheduler(
+    tick_seconds=settings.scheduler_tick_seconds,
+    refresh_seconds=settings.scheduler_refresh_seconds,
+    jitter_seconds=settings.scheduler_jitter_seconds,
+    timezone=settings.scheduler_timezone,
+)
@@ -16,6 +16,7 @@ def create_ccgp_scraper() -> SimpleHttpScraper:
         "url_selector": "a",
         "content_selector": "div.vF_detail_content, div.article",
         "date_selector": "span.time",
+        "detail_concurrency": 5,
     }
 
     return SimpleHttpScraper(
@@ -1,10 +1,24 @@
 """Base scraper abstract class."""
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, Awaitable, Callable, Iterable, List, Dict, Any, Optional, Set
 from dataclasses import dataclass
 from datetime import datetime
 
 
+# Async callable returning the subset of the given URLs already stored
+KnownUrlsLookup = Callable[[Iterable[str]], Awaitable[Set[str]]]
+
+
+def published_before(published_at: Optional[datetime], since: Optional[datetime]) -> bool:
+    """Whether published_at is strictly before since (naive and aware compare as wall time)."""
+    if published_at is None or since is None:
+        return False
+    if (published_at.tzinfo is None) != (since.tzinfo is None):
+        published_at = published_at.replace(tzinfo=None)
+        since = since.replace(tzinfo=None)
+    return published_at < since
+
+
 @dataclass
 class ScrapedItem:
     """Data class for scraped tender announcement."""
@@ -55,6 +69,51 @@ class BaseScraper(ABC):
         """
         pass
 
+    async def scrape_list(
+        self,
+        limit: int = 10,
+        known_urls: Optional[KnownUrlsLookup] = None,
+        since: Optional[datetime] = None,
+    ) -> List[ScrapedItem]:
+        """
+        Scrape list entries without fetching their detail pages.
+
+        Callers can drop already-known URLs before calling iter_details(). The
+        default implementation has no separate list phase and returns scrape().
+
+        Args:
+            limit: Maximum number of items to scrape
+            known_urls: Optional lookup of already stored URLs, used by
+                paginating scrapers to stop at the first fully known page
+            since: Optional high-water mark; pages with only older (or known)
+                items end the crawl
+
+        Returns:
+            List of scraped items (content may be empty until details are fetched)
+        """
+        return await self.scrape(limit=limit)
+
+    async def iter_details(self, items: List[ScrapedItem]) -> AsyncIterator[ScrapedItem]:
+        """
+        Fetch detail pages for list entries, yielding items as they complete.
+
+        Args:
+            items: Items returned by scrape_list()
+        """
+        for item in items:
+            yield item
+
+    async def iter_items(self, limit: int = 10) -> AsyncIterator[ScrapedItem]:
+        """
+        Yield scraped items as they become available.
+
+        Args:
+            limit: Maximum number of items to scrape
+        """
+        items = await self.scrape_list(limit=limit)
+        async for item in self.iter_details(items):
+            yield item
+
     @abstractmethod
     async def test_connection(self) -> bool:
         """
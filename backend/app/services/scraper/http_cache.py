@@ -0,0 +1,151 @@
+"""Persistent HTTP validator cache for scraped pages."""
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+import zstandard
+
+from app.config import settings
+from app.services.sqlite_cache import SqliteCache
+
+logger = logging.getLogger(__name__)
+
+# zstd contexts are not safe for concurrent use; the blocking helpers run in worker threads
+_local = threading.local()
+
+
+def _compressor() -> zstandard.ZstdCompressor:
+    """This thread's compressor."""
+    compressor = getattr(_local, "compressor", None)
+    if compressor is None:
+        compressor = _local.compressor = zstandard.ZstdCompressor()
+    return compressor
+
+
+def _decompressor() -> zstandard.ZstdDecompressor:
+    """This thread's decompressor."""
+    decompressor = getattr(_local, "decompressor", None)
+    if decompressor is None:
+        decompressor = _local.decompressor = zstandard.ZstdDecompressor()
+    return decompressor
+
+
+@dataclass
+class CachedPage:
+    """Validators and parsed result of a previously fetched page."""
+
+    url: str
+    fingerprint: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    body_hash: str
+    payload: Any
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Request headers that let the server answer 304 Not Modified."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HttpValidatorCache(SqliteCache):
+    """
+    SQLite-backed cache of ETag/Last-Modified validators keyed by URL.
+
+    Alongside the validators it keeps the hash of the response body and the
+    parsed result (zstd-compressed JSON), so a 304 response or an unchanged
+    body can be served without parsing the page again. The ``fingerprint``
+    identifies the parser settings; an entry parsed with different settings
+    is ignored. See ``SqliteCache`` for storage, expiry and eviction.
+    """
+
+    table = "http_cache"
+    key_column = "url"
+    value_columns = {
+        "fingerprint": "TEXT NOT NULL",
+        "etag": "TEXT",
+        "last_modified": "TEXT",
+        "body_hash": "TEXT NOT NULL",
+        "payload": "BLOB NOT NULL",
+    }
+
+    def __init__(self, path: str, ttl_seconds: int, max_entries: int) -> None:
+        """
+        Initialize cache.
+
+        Args:
+            path: SQLite database file path
+            ttl_seconds: Entry lifetime in seconds
+            max_entries: Maximum number of stored entries
+        """
+        super().__init__(path, ttl_seconds, max_entries)
+
+        self.not_modified = 0
+        self.unchanged = 0
+        self.changed = 0
+
+    async def get(self, url: str) -> Optional[CachedPage]:
+        """Return the cached page for url, or None."""
+        try:
+            return await asyncio.to_thread(self._get, url)
+        except sqlite3.Error as e:
+            logger.warning(f"HTTP cache read failed: {e}")
+            return None
+
+    async def set(self, page: CachedPage) -> None:
+        """Store page validators and parsed result."""
+        try:
+            await asyncio.to_thread(self._set, page)
+        except sqlite3.Error as e:
+            logger.warning(f"HTTP cache write failed: {e}")
+
+    def stats(self) -> Dict[str, int]:
+        """Revalidation counters for this process."""
+        return {
+            "not_modified": self.not_modified,
+            "unchanged": self.unchanged,
+            "changed": self.changed,
+        }
+
+    def _get(self, url: str) -> Optional[CachedPage]:
+        """Blocking lookup."""
+        row = self._fetch(url)
+        if row is None:
+            return None
+
+        fingerprint, etag, last_modified, body_hash, payload = row
+        return CachedPage(
+            url=url,
+            fingerprint=fingerprint,
+            etag=etag,
+            last_modified=last_modified,
+            body_hash=body_hash,
+            payload=json.loads(_decompressor().decompress(payload)),
+        )
+
+    def _set(self, page: CachedPage) -> None:
+        """Blocking write."""
+        payload = _compressor().compress(
+            json.dumps(page.payload, ensure_ascii=False).encode("utf-8")
+        )
+        self._store(
+            page.url,
+            (page.fingerprint, page.etag, page.last_modified, page.body_hash, payload),
+        )
+
+
+# Create singleton instance (None when disabled)
+http_cache: Optional[HttpValidatorCache] = None
+if settings.http_cache_enabled:
+    http_cache = HttpValidatorCache(
+        path=settings.http_cache_path,
+        ttl_seconds=settings.http_cache_ttl_seconds,
+        max_entries=settings.http_cache_max_entries,
+    )
@@ -0,0 +1,320 @@
+"""Application-scoped HTTP client shared by scrapers."""
+import asyncio
+import ipaddress
+import logging
+import socket
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import urlsplit
+from urllib.request import getproxies
+
+import httpcore
+import httpx
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+
+
+class CachingResolverBackend(httpcore.AsyncNetworkBackend):
+    """
+    Network backend that caches DNS lookups for ``ttl_seconds``.
+
+    Wraps another httpcore backend; only the host passed to ``connect_tcp``
+    is replaced by a cached address, so TLS still verifies the original host
+    name. All resolved addresses are kept and tried in order; when none of
+    them accepts the connection the cached entry is dropped so the next
+    attempt resolves again.
+    """
+
+    def __init__(self, backend: httpcore.AsyncNetworkBackend, ttl_seconds: float) -> None:
+        """
+        Initialize backend.
+
+        Args:
+            backend: Backend doing the actual network I/O
+            ttl_seconds: How long resolved addresses are reused
+        """
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self._addresses: Dict[Tuple[str, int], Tuple[float, List[str]]] = {}
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: Optional[float] = None,
+        local_address: Optional[str] = None,
+        socket_options: Optional[Iterable] = None,
+    ) -> httpcore.AsyncNetworkStream:
+        addresses = await self._resolve(host, port)
+        for index, address in enumerate(addresses):
+            try:
+                return await self.backend.connect_tcp(
+                    address,
+                    port,
+                    timeout=timeout,
+                    local_address=local_address,
+                    socket_options=socket_options,
+                )
+            except Exception as e:
+                if index + 1 < len(addresses):
+                    logger.debug(f"Connect to {host} via {address} failed, trying next: {e}")
+                    continue
+                self._addresses.pop((host, port), None)
+                raise
+        raise httpcore.ConnectError(f"No addresses found for {host}")
+
+    async def connect_unix_socket(
+        self,
+        path: str,
+        timeout: Optional[float] = None,
+        socket_options: Optional[Iterable] = None,
+    ) -> httpcore.AsyncNetworkStream:
+        return await self.backend.connect_unix_socket(
+            path, timeout=timeout, socket_options=socket_options
+        )
+
+    async def sleep(self, seconds: float) -> None:
+        await self.backend.sleep(seconds)
+
+    async def _resolve(self, host: str, port: int) -> List[str]:
+        """Return the cached addresses for host, resolving them when missing or expired."""
+        try:
+            ipaddress.ip_address(host)
+            return [host]
+        except ValueError:
+            pass
+
+        now = time.monotonic()
+        cached = self._addresses.get((host, port))
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        try:
+            infos = await asyncio.get_running_loop().getaddrinfo(
+                host, port, type=socket.SOCK_STREAM
+            )
+        except OSError as e:
+            raise httpcore.ConnectError(f"Could not resolve {host}: {e}") from e
+        addresses = list(dict.fromkeys(info[4][0] for info in infos))
+        if not addresses:
+            raise httpcore.ConnectError(f"No addresses found for {host}")
+
+        self._addresses[(host, port)] = (now + self.ttl_seconds, addresses)
+        return addresses
+
+
+@contextmanager
+def _map_httpcore_exceptions(request: httpx.Request) -> Iterator[None]:
+    """Re-raise httpcore errors as the httpx error of the same name."""
+    try:
+        yield
+    except httpcore.TimeoutException as e:
+        raise _httpx_error(e, request, httpx.TimeoutException) from e
+    except (httpcore.NetworkError, httpcore.ProtocolError, httpcore.ProxyError,
+            httpcore.UnsupportedProtocol) as e:
+        raise _httpx_error(e, request, httpx.TransportError) from e
+
+
+def _httpx_error(
+    error: Exception, request: httpx.Request, default: type
+) -> httpx.TransportError:
+    """httpx counterpart of an httpcore error (httpcore mirrors httpx's names)."""
+    for cls in type(error).__mro__:
+        mapped = getattr(httpx, cls.__name__, None)
+        if isinstance(mapped, type) and issubclass(mapped, httpx.TransportError):
+            return mapped(str(error), request=request)
+    return default(str(error), request=request)
+
+
+class _ResponseStream(httpx.AsyncByteStream):
+    """Response body read from an httpcore stream."""
+
+    def __init__(self, stream: AsyncIterable[bytes], request: httpx.Request) -> None:
+        self._stream = stream
+        self._request = request
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        with _map_httpcore_exceptions(self._request):
+            async for part in self._stream:
+                yield part
+
+    async def aclose(self) -> None:
+        if hasattr(self._stream, "aclose"):
+            await self._stream.aclose()
+
+
+class CachingResolverTransport(httpx.AsyncBaseTransport):
+    """
+    Transport over an httpcore connection pool using CachingResolverBackend.
+
+    httpx has no resolver hook, but httpcore pools accept a network backend,
+    so this builds the pool directly instead of patching the one inside
+    ``httpx.AsyncHTTPTransport``.
+    """
+
+    def __init__(self, limits: httpx.Limits, http2: bool, dns_ttl: float) -> None:
+        """
+        Initialize transport.
+
+        Args:
+            limits: Connection pool limits
+            http2: Negotiate HTTP/2 where servers support it
+            dns_ttl: Seconds resolved addresses are cached
+        """
+        self._pool = httpcore.AsyncConnectionPool(
+            ssl_context=httpx.create_ssl_context(),
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            http1=True,
+            http2=http2,
+            network_backend=CachingResolverBackend(httpcore.AnyIOBackend(), dns_ttl),
+        )
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        core_request = httpcore.Request(
+            method=request.method,
+            url=httpcore.URL(
+                scheme=request.url.raw_scheme,
+                host=request.url.raw_host,
+                port=request.url.port,
+                target=request.url.raw_path,
+            ),
+            headers=request.headers.raw,
+            content=request.stream,
+            extensions=request.extensions,
+        )
+        with _map_httpcore_exceptions(request):
+            response = await self._pool.handle_async_request(core_request)
+
+        return httpx.Response(
+            status_code=response.status,
+            headers=response.headers,
+            stream=_ResponseStream(response.stream, request),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._pool.aclose()
+
+
+class HttpClientRegistry:
+    """
+    Owns the pooled ``httpx.AsyncClient`` that all scrapers borrow.
+
+    Keeping one client for the whole process lets connections and TLS sessions
+    survive across runs. Requests to the same host are capped across all
+    scrapers by ``max_per_host``. The FastAPI lifespan starts and closes the
+    registry; outside the app the client is created on first use.
+    """
+
+    def __init__(
+        self,
+        max_connections: int,
+        max_keepalive: int,
+        keepalive_expiry: float,
+        max_per_host: int,
+        http2: bool,
+        dns_ttl: float,
+        timeout: float,
+    ) -> None:
+        """
+        Initialize registry.
+
+        Args:
+            max_connections: Maximum open connections in the pool
+            max_keepalive: Maximum idle keep-alive connections
+            keepalive_expiry: Seconds an idle connection is kept
+            max_per_host: Maximum concurrent requests per host
+            http2: Negotiate HTTP/2 where servers support it
+            dns_ttl: Seconds resolved addresses are cached (0 disables caching)
+            timeout: Request timeout in seconds
+        """
+        self.max_connections = max_connections
+        self.max_keepalive = max_keepalive
+        self.keepalive_expiry = keepalive_expiry
+        self.max_per_host = max(1, max_per_host)
+        self.http2 = http2
+        self.dns_ttl = dns_ttl
+        self.timeout = timeout
+
+        self._client: Optional[httpx.AsyncClient] = None
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The shared client, created on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = self._create_client()
+        return self._client
+
+    def start(self) -> None:
+        """Create the shared client."""
+        if self._client is None or self._client.is_closed:
+            self._client = self._create_client()
+        logger.info(f"HTTP client pool started (http2={self.http2})")
+
+    async def close(self) -> None:
+        """Close the shared client and its connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        self._host_semaphores.clear()
+
+    @asynccontextmanager
+    async def host_slot(self, url: str) -> AsyncIterator[None]:
+        """Hold one of the host's request slots for the duration of the block."""
+        host = urlsplit(url).netloc
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_per_host)
+            self._host_semaphores[host] = semaphore
+        async with semaphore:
+            yield
+
+    def _create_client(self) -> httpx.AsyncClient:
+        """
+        Build the pooled client.
+
+        httpx itself builds the default transport and the proxy transports
+        from HTTP(S)_PROXY/ALL_PROXY and NO_PROXY. The DNS-caching transport
+        is mounted for ``all://``, which is less specific than the scheme and
+        NO_PROXY mounts, so those requests keep httpx's own transports and
+        only direct connections use the cache. ALL_PROXY is itself keyed
+        ``all://`` and would be replaced by the mount, so the cache is not
+        installed when it is set (every request goes through the proxy).
+        """
+        limits = httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+        mounts = None
+        if self.dns_ttl > 0 and "all" not in getproxies():
+            mounts = {"all://": CachingResolverTransport(limits, self.http2, self.dns_ttl)}
+
+        return httpx.AsyncClient(
+            http2=self.http2,
+            limits=limits,
+            mounts=mounts,
+            timeout=self.timeout,
+            follow_redirects=True,
+            headers={"User-Agent": USER_AGENT},
+        )
+
+
+# Create singleton instance
+http_clients = HttpClientRegistry(
+    max_connections=settings.http_max_connections,
+    max_keepalive=settings.http_max_keepalive,
+    keepalive_expiry=settings.http_keepalive_expiry,
+    max_per_host=settings.http_max_per_host,
+    http2=settings.http_http2,
+    dns_ttl=settings.http_dns_ttl,
+    timeout=settings.scraper_timeout,
+)
@@ -1,21 +1,47 @@
 """Simple HTTP-based scraper implementation."""
+import asyncio
+import hashlib
+import json
 import logging
-from typing import List, Dict, Any, Optional
+import re
+from collections import deque
+from datetime import datetime
+from typing import AsyncIterator, Awaitable, Callable, Deque, List, Dict, Any, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
 import httpx
-from bs4 import BeautifulSoup
-from app.services.scraper.base import BaseScraper, ScrapedItem, ScraperConnectionError, ScraperParseError
+from app.services.scraper.base import (
+    BaseScraper,
+    KnownUrlsLookup,
+    ScrapedItem,
+    ScraperConnectionError,
+    ScraperParseError,
+    published_before,
+)
+from app.services.scraper.http_cache import CachedPage, HttpValidatorCache, http_cache
+from app.services.scraper.http_client import http_clients
+from app.services.scraper.parse_pool import parse_pool
+from app.services.scraper.parsers import ListEntry, PageParser, get_parser
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
 
 class SimpleHttpScraper(BaseScraper):
-    """HTTP scraper using httpx + BeautifulSoup."""
+    """HTTP scraper using httpx and a pluggable HTML parser (lxml by default)."""
 
-    def __init__(self, source_name: str, base_url: str, config: Dict[str, Any]) -> None:
+    def __init__(
+        self,
+        source_name: str,
+        base_url: str,
+        config: Dict[str, Any],
+        client: Optional[httpx.AsyncClient] = None,
+    ) -> None:
         """
         Initialize HTTP scraper.
 
+        The scraper borrows the application's pooled client (or the given
+        one) and never closes it, so connections outlive a single run.
+
         Expected config keys:
             - list_url: URL to scrape list of announcements
             - list_selector: CSS selector for list items
@@ -23,41 +49,105 @@ class SimpleHttpScraper(BaseScraper):
             - url_selector: CSS selector for detail URL
             - content_selector: CSS selector for content
             - date_selector: Optional CSS selector for published date
+            - original_id_pattern: Optional regex extracting the source's ID from
+              the detail URL (first group, or the whole match)
+            - detail_concurrency: Optional max concurrent detail requests per host
+            - detail_prefetch: Optional max detail pages fetched ahead of the
+              consumer in iter_details (default settings.pipeline_queue_size)
+            - next_page_selector: Optional CSS selector for the "next page" link
+            - page_url_template: Optional URL template for later pages, e.g.
+              "http://example.com/list/index_{page}.html"
+            - page_start: Page number of the second page in page_url_template (default 2)
+            - max_pages: Maximum list pages per run (default settings.scraper_max_pages
+              when pagination is configured, otherwise 1)
+            - parser: Optional parser backend, "lxml" or "bs4"
+              (default settings.scraper_parser)
         """
         super().__init__(source_name, base_url, config)
-        self.client = httpx.AsyncClient(
-            timeout=settings.scraper_timeout,
-            follow_redirects=True,
-            headers={
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-            },
+        self.client = client or http_clients.client
+        self.http_cache: Optional[HttpValidatorCache] = http_cache
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self.parser: PageParser = get_parser(
+            config, config.get("parser", settings.scraper_parser)
         )
 
     async def scrape(self, limit: int = 10) -> List[ScrapedItem]:
         """Scrape tender announcements."""
+        items = await self.scrape_list(limit)
+
+        # Fetch detail pages concurrently, preserving list order
+        await self._fetch_details(items)
+
+        return items
+
+    async def iter_details(self, items: List[ScrapedItem]) -> AsyncIterator[ScrapedItem]:
+        """
+        Yield items in list order as soon as each detail page is fetched.
+
+        Detail requests run ahead of the consumer by at most ``detail_prefetch``
+        items (bounded per host as well), so later pages download while earlier
+        items are processed downstream without holding every body in memory.
+        """
+        window = max(1, self.config.get("detail_prefetch", settings.pipeline_queue_size))
+        pending = iter(items)
+        tasks: Deque[Tuple[ScrapedItem, asyncio.Task]] = deque()
+
+        def start_next() -> None:
+            item = next(pending, None)
+            if item is not None:
+                tasks.append((item, asyncio.create_task(self._fill_detail(item))))
+
         try:
-            list_url = self.config.get("list_url", self.base_url)
-            response = await self.client.get(list_url)
-            response.raise_for_status()
+            for _ in range(window):
+                start_next()
+            while tasks:
+                item, task = tasks.popleft()
+                await task
+                yield item
+                start_next()
+        finally:
+            for _, task in tasks:
+                task.cancel()
+            await asyncio.gather(*(task for _, task in tasks), return_exceptions=True)
 
-            soup = BeautifulSoup(response.text, "lxml")
-            items = []
+    async def scrape_list(
+        self,
+        limit: int = 10,
+        known_urls: Optional[KnownUrlsLookup] = None,
+        since: Optional[datetime] = None,
+    ) -> List[ScrapedItem]:
+        """
+        Fetch list pages and parse their entries (without detail content).
+
+        Follows pagination until ``limit`` items are collected, ``max_pages``
+        is reached, or a page holds nothing new: every entry is either already
+        stored (per ``known_urls``) or published before ``since``.
+        """
+        try:
+            items: List[ScrapedItem] = []
+            page_url: Optional[str] = self.config.get("list_url", self.base_url)
+            max_pages = self._max_pages()
 
-            # Find list items
-            list_selector = self.config["list_selector"]
-            item_elements = soup.select(list_selector)[:limit]
+            for page in range(1, max_pages + 1):
+                parsed = await self._get_parsed(
+                    page_url,
+                    self._fingerprint("list"),
+                    self._parse_list_response,
+                )
+                page_items = [self._item_from_entry(entry) for entry in parsed["entries"]]
+                items.extend(page_items[: limit - len(items)])
 
-            logger.info(f"Found {len(item_elements)} items from {self.source_name}")
+                if len(items) >= limit or page == max_pages or not page_items:
+                    break
+                if await self._is_exhausted(page_items, known_urls, since):
+                    logger.info(f"Stopping {self.source_name} at page {page}: nothing new")
+                    break
 
-            for element in item_elements:
-                try:
-                    item = await self._parse_list_item(element)
-                    if item:
-                        items.append(item)
-                except Exception as e:
-                    logger.warning(f"Failed to parse item: {e}")
-                    continue
+                page_url = self._next_page_url(parsed["next_url"], page + 1)
+                if not page_url:
+                    break
 
+            logger.info(f"Found {len(items)} items from {self.source_name}")
             return items
 
         except httpx.HTTPError as e:
@@ -65,24 +155,154 @@ class SimpleHttpScraper(BaseScraper):
         except Exception as e:
             raise ScraperParseError(f"Parse error: {e}") from e
 
-    async def _parse_list_item(self, element: BeautifulSoup) -> Optional[ScrapedItem]:
-        """Parse a single list item."""
-        # Extract title
-        title_selector = self.config["title_selector"]
-        title_elem = element.select_one(title_selector)
-        if not title_elem:
-            return None
-        title = title_elem.get_text(strip=True)
+    async def _parse_list_response(self, response: httpx.Response) -> Dict[str, Any]:
+        """Parse a fetched list page."""
+        return self._parse_list(response.text, str(response.url))
 
-        # Extract URL
-        url_selector = self.config["url_selector"]
-        url_elem = element.select_one(url_selector)
-        if not url_elem:
-            return None
+    def _parse_list(self, html: str, page_url: str) -> Dict[str, Any]:
+        """Parse a list page into cacheable entries and the next-page link."""
+        list_entries, next_href = self.parser.parse_list(html)
+        entries = []
 
-        href = url_elem.get("href")
-        if not href:
-            return None
+        for list_entry in list_entries:
+            try:
+                item = self._item_from_list_entry(list_entry)
+                entries.append({
+                    "title": item.title,
+                    "url": item.url,
+                    "original_id": item.original_id,
+                    "published_at": (
+                        item.published_at.isoformat() if item.published_at else None
+                    ),
+                })
+            except Exception as e:
+                logger.warning(f"Failed to parse item: {e}")
+                continue
+
+        next_url = urljoin(page_url, next_href) if next_href else None
+        return {"entries": entries, "next_url": next_url}
+
+    @staticmethod
+    def _item_from_entry(entry: Dict[str, Any]) -> ScrapedItem:
+        """Rebuild a list item from its cached entry."""
+        return ScrapedItem(
+            title=entry["title"],
+            content="",
+            url=entry["url"],
+            original_id=entry.get("original_id"),
+            published_at=(
+                datetime.fromisoformat(entry["published_at"]) if entry["published_at"] else None
+            ),
+        )
+
+    def _max_pages(self) -> int:
+        """Number of list pages a run may read."""
+        paginated = "next_page_selector" in self.config or "page_url_template" in self.config
+        default = settings.scraper_max_pages if paginated else 1
+        return max(1, int(self.config.get("max_pages", default)))
+
+    def _next_page_url(self, next_url: Optional[str], page: int) -> Optional[str]:
+        """URL of the given (1-based) list page."""
+        if next_url:
+            return next_url
+        template = self.config.get("page_url_template")
+        if template:
+            page_start = int(self.config.get("page_start", 2))
+            return template.format(page=page_start + page - 2)
+        return None
+
+    @staticmethod
+    async def _is_exhausted(
+        items: List[ScrapedItem],
+        known_urls: Optional[KnownUrlsLookup],
+        since: Optional[datetime],
+    ) -> bool:
+        """Whether every item on a page is already stored or older than since."""
+        if known_urls is None and since is None:
+            return False
+
+        known = await known_urls(item.url for item in items) if known_urls else set()
+        return all(
+            item.url in known or published_before(item.published_at, since)
+            for item in items
+        )
+
+    async def _get_parsed(
+        self,
+        url: str,
+        fingerprint: str,
+        parse: Callable[[httpx.Response], Awaitable[Any]],
+    ) -> Any:
+        """
+        GET a page and parse it, revalidating against the HTTP cache.
+
+        A cached entry sends If-None-Match / If-Modified-Since; on 304, or when
+        the new body hashes the same as the cached one, the cached parse result
+        is returned without parsing. Failed responses are never cached.
+
+        Args:
+            url: Page URL
+            fingerprint: Identifies the parser settings the result depends on
+            parse: Coroutine function turning the response into a JSON-serializable result
+
+        Returns:
+            Parse result
+        """
+        cached = await self.http_cache.get(url) if self.http_cache else None
+        if cached is not None and cached.fingerprint != fingerprint:
+            cached = None
+
+        headers = cached.conditional_headers() if cached else {}
+        async with http_clients.host_slot(url):
+            response = await self.client.get(url, headers=headers)
+
+        if cached is not None and response.status_code == 304:
+            self.http_cache.not_modified += 1
+            return cached.payload
+
+        response.raise_for_status()
+        if self.http_cache is None:
+            return await parse(response)
+
+        body_hash = hashlib.sha256(response.content).hexdigest()
+        if cached is not None and cached.body_hash == body_hash:
+            self.http_cache.unchanged += 1
+            payload = cached.payload
+        else:
+            self.http_cache.changed += 1
+            payload = await parse(response)
+
+        await self.http_cache.set(
+            CachedPage(
+                url=url,
+                fingerprint=fingerprint,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                body_hash=body_hash,
+                payload=payload,
+            )
+        )
+        return payload
+
+    def _fingerprint(self, kind: str) -> str:
+        """Hash of the config keys a parse result depends on."""
+        keys = {
+            "list": (
+                "list_selector",
+                "title_selector",
+                "url_selector",
+                "date_selector",
+                "next_page_selector",
+                "original_id_pattern",
+            ),
+            "detail": ("content_selector",),
+        }[kind]
+        parts = [kind, self.base_url, self.parser.name, *(self.config.get(key) for key in keys)]
+        return hashlib.sha256(json.dumps(parts).encode("utf-8")).hexdigest()[:16]
+
+    def _item_from_list_entry(self, entry: ListEntry) -> ScrapedItem:
+        """Build a list item (detail content is fetched separately)."""
+        href = entry.href
 
         # Make absolute URL
         if href.startswith("http"):
@@ -92,50 +312,71 @@ class SimpleHttpScraper(BaseScraper):
         else:
             url = self.base_url.rstrip("/") + "/" + href
 
-        # Extract content from detail page
-        content, raw_html = await self._fetch_detail(url)
-
         # Extract published date if configured
-        published_at = None
-        if "date_selector" in self.config:
-            date_elem = element.select_one(self.config["date_selector"])
-            if date_elem:
-                date_str = date_elem.get_text(strip=True)
-                published_at = self._parse_date(date_str)
+        published_at = self._parse_date(entry.date_text) if entry.date_text else None
+
+        # Extract the source's own ID if configured
+        original_id = None
+        if "original_id_pattern" in self.config:
+            match = re.search(self.config["original_id_pattern"], url)
+            if match:
+                original_id = match.group(1) if match.groups() else match.group(0)
 
         return ScrapedItem(
-            title=title,
-            content=content,
+            title=entry.title,
+            content="",
             url=url,
+            original_id=original_id,
             published_at=published_at,
-            raw_html=raw_html,
         )
 
-    async def _fetch_detail(self, url: str) -> tuple[str, str]:
-        """Fetch detail page content."""
-        try:
-            response = await self.client.get(url)
-            response.raise_for_status()
+    async def _fetch_details(self, items: List[ScrapedItem]) -> None:
+        """
+        Fetch detail pages for items concurrently.
 
-            soup = BeautifulSoup(response.text, "lxml")
+        Requests are bounded per host by the ``detail_concurrency`` config key
+        (defaults to ``settings.scraper_detail_concurrency``). Each item is
+        filled in place, so list order is kept and a failed detail page only
+        leaves that item's content empty.
+        """
+        await asyncio.gather(*(self._fill_detail(item) for item in items))
 
-            # Extract content
-            content_selector = self.config["content_selector"]
-            content_elem = soup.select_one(content_selector)
+    async def _fill_detail(self, item: ScrapedItem) -> None:
+        """Fetch detail page for a single item under its host's semaphore."""
+        async with self._host_semaphore(item.url):
+            item.content, item.raw_html = await self._fetch_detail(item.url)
 
-            if content_elem:
-                content = content_elem.get_text(separator="\n", strip=True)
-                raw_html = str(content_elem)
-            else:
-                content = soup.get_text(separator="\n", strip=True)
-                raw_html = response.text
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        """Get (or create) the concurrency semaphore for the URL's host."""
+        host = urlsplit(url).netloc
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            limit = self.config.get("detail_concurrency", settings.scraper_detail_concurrency)
+            semaphore = asyncio.Semaphore(max(1, int(limit)))
+            self._host_semaphores[host] = semaphore
+        return semaphore
 
+    async def _fetch_detail(self, url: str) -> tuple[str, str]:
+        """Fetch detail page content."""
+        try:
+            content, raw_html = await self._get_parsed(
+                url,
+                self._fingerprint("detail"),
+                self._parse_detail,
+            )
             return content, raw_html
 
         except Exception as e:
             logger.warning(f"Failed to fetch detail from {url}: {e}")
             return "", ""
 
+    async def _parse_detail(self, response: httpx.Response) -> List[str]:
+        """Extract [content, raw_html] from a detail page, in the parse pool if large."""
+        content, raw_html = await parse_pool.parse_detail(
+            response.content, response.encoding, self.config, self.parser.name
+        )
+        return [content, raw_html]
+
     def _parse_date(self, date_str: str) -> Optional[Any]:
         """Parse date string to datetime."""
         try:
@@ -148,11 +389,11 @@ class SimpleHttpScraper(BaseScraper):
         """Test connection to source."""
         try:
             list_url = self.config.get("list_url", self.base_url)
-            response = await self.client.get(list_url)
+            async with http_clients.host_slot(list_url):
+                response = await self.client.get(list_url)
             return response.status_code == 200
         except Exception:
             return False
 
     async def close(self) -> None:
-        """Close HTTP client."""
-        await self.client.aclose()
+        """Release the scraper (the borrowed client stays open for other runs)."""
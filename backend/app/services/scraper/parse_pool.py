@@ -0,0 +1,102 @@
+"""Process pool for parsing large detail pages off the event loop."""
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Optional, Tuple
+
+from app.config import settings
+from app.services.scraper.parsers import extract_detail
+
+logger = logging.getLogger(__name__)
+
+
+class ParsePool:
+    """
+    Runs detail-page parsing in worker processes.
+
+    Workers receive only the response body, its encoding and the content
+    selector, and send back ``(content, raw_html)``, so parsing a large page
+    no longer blocks the event loop and runs on other cores. Pages smaller
+    than ``offload_bytes`` are parsed inline, where the process round trip
+    would cost more than the parse. With ``workers`` set to 0 every page is
+    parsed inline. Like the HTTP client registry, the FastAPI lifespan starts
+    and closes the pool; outside the app it is created on first use.
+    """
+
+    def __init__(self, workers: int, offload_bytes: int) -> None:
+        """
+        Initialize pool.
+
+        Args:
+            workers: Number of worker processes (0 disables the pool)
+            offload_bytes: Minimum body size sent to a worker
+        """
+        self.workers = max(0, workers)
+        self.offload_bytes = max(0, offload_bytes)
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def start(self) -> None:
+        """Create the worker pool."""
+        if self.workers and self._executor is None:
+            self._executor = self._create_executor()
+            logger.info(f"Parse pool started with {self.workers} workers")
+
+    async def close(self) -> None:
+        """Shut down the workers, dropping queued work, without blocking the event loop."""
+        if self._executor is not None:
+            executor, self._executor = self._executor, None
+            await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)
+
+    async def parse_detail(
+        self,
+        body: bytes,
+        encoding: str,
+        config: Dict[str, Any],
+        backend: str,
+    ) -> Tuple[str, str]:
+        """
+        Extract content and raw HTML from a detail page body.
+
+        Args:
+            body: Response body
+            encoding: Encoding to decode body with
+            config: Scraper config (only the content selector is sent)
+            backend: Parser backend name
+
+        Returns:
+            (content, raw_html)
+        """
+        selectors = {"content_selector": config["content_selector"]}
+        if not self.workers or len(body) < self.offload_bytes:
+            return extract_detail(body, encoding, selectors, backend)
+
+        if self._executor is None:
+            self.start()
+        executor = self._executor
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                executor, extract_detail, body, encoding, selectors, backend
+            )
+        except BrokenProcessPool:
+            # A worker died (e.g. out of memory); replace the pool for later pages
+            if self._executor is executor:
+                logger.warning("Parse pool broken, restarting it and parsing in a thread")
+                self._executor = None
+                executor.shutdown(wait=False, cancel_futures=True)
+            return await asyncio.to_thread(extract_detail, body, encoding, selectors, backend)
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        """Build the executor; spawned workers only import the parser module."""
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+
+# Create singleton instance
+parse_pool = ParsePool(
+    workers=settings.scraper_parse_workers,
+    offload_bytes=settings.scraper_parse_offload_bytes,
+)
@@ -0,0 +1,287 @@
+"""HTML parser backends for list and detail pages."""
+import json
+import logging
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from bs4 import BeautifulSoup
+from cssselect import HTMLTranslator, SelectorError
+from lxml import etree
+from lxml.cssselect import CSSSelector
+
+logger = logging.getLogger(__name__)
+
+# Config keys holding CSS selectors
+SELECTOR_KEYS = (
+    "list_selector",
+    "title_selector",
+    "url_selector",
+    "date_selector",
+    "content_selector",
+    "next_page_selector",
+)
+
+# Tags whose strings BeautifulSoup keeps out of get_text() (script, style, ...)
+_NON_TEXT_TAGS = frozenset({"script", "style", "template", "rt", "rp"})
+
+
+@dataclass
+class ListEntry:
+    """Raw fields of one list item, before URL and date normalization."""
+
+    title: str
+    href: str
+    date_text: Optional[str] = None
+
+
+class PageParser(ABC):
+    """Extracts list entries and detail content with a source's selectors."""
+
+    name = ""
+
+    def __init__(self, config: Dict[str, Any]) -> None:
+        """
+        Initialize parser.
+
+        Args:
+            config: Scraper config (selector keys are read once here)
+        """
+        self.config = config
+
+    @abstractmethod
+    def parse_list(self, html: str) -> Tuple[List[ListEntry], Optional[str]]:
+        """
+        Parse a list page.
+
+        Returns:
+            Entries in page order, and the next-page href (None if absent)
+        """
+
+    @abstractmethod
+    def parse_detail(self, html: str) -> Tuple[str, str]:
+        """
+        Parse a detail page.
+
+        Returns:
+            (content text, raw HTML of the content element or the whole page)
+        """
+
+
+class SoupParser(PageParser):
+    """BeautifulSoup + soupsieve backend (reference implementation)."""
+
+    name = "bs4"
+
+    def parse_list(self, html: str) -> Tuple[List[ListEntry], Optional[str]]:
+        soup = BeautifulSoup(html, "lxml")
+        entries = []
+        for element in soup.select(self.config["list_selector"]):
+            title_elem = element.select_one(self.config["title_selector"])
+            if not title_elem:
+                continue
+            url_elem = element.select_one(self.config["url_selector"])
+            if not url_elem or not url_elem.get("href"):
+                continue
+
+            date_text = None
+            if "date_selector" in self.config:
+                date_elem = element.select_one(self.config["date_selector"])
+                if date_elem:
+                    date_text = date_elem.get_text(strip=True)
+
+            entries.append(ListEntry(
+                title=title_elem.get_text(strip=True),
+                href=url_elem.get("href"),
+                date_text=date_text,
+            ))
+
+        next_href = None
+        if self.config.get("next_page_selector"):
+            next_elem = soup.select_one(self.config["next_page_selector"])
+            if next_elem is not None and next_elem.get("href"):
+                next_href = next_elem["href"]
+
+        return entries, next_href
+
+    def parse_detail(self, html: str) -> Tuple[str, str]:
+        soup = BeautifulSoup(html, "lxml")
+        content_elem = soup.select_one(self.config["content_selector"])
+        if content_elem:
+            return content_elem.get_text(separator="\n", strip=True), str(content_elem)
+        return soup.get_text(separator="\n", strip=True), html
+
+
+class LxmlParser(PageParser):
+    """
+    lxml backend with CSS selectors compiled to XPath once per config.
+
+    Produces the same titles, URLs, dates and content text as SoupParser: the
+    tree comes from the same libxml2 HTML parser, and text is joined the way
+    ``get_text`` does, leaving out comments and script/style/template/ruby
+    annotation text. The raw HTML of a matched content element is lxml's
+    serialization, so its markup formatting can differ from BeautifulSoup's.
+
+    Selectors inside a list item are evaluated relative to the item, so they
+    should only refer to the item's descendants (as all configs do).
+    """
+
+    name = "lxml"
+
+    def __init__(self, config: Dict[str, Any]) -> None:
+        super().__init__(config)
+        self._document_selectors = {
+            key: CSSSelector(config[key], translator="html")
+            for key in ("list_selector", "content_selector", "next_page_selector")
+            if config.get(key)
+        }
+        # Every comma-separated branch is scoped to the item's descendants,
+        # like BeautifulSoup's select_one on an element
+        translator = HTMLTranslator()
+        self._item_selectors = {
+            key: etree.XPath(translator.css_to_xpath(config[key], prefix="descendant::"))
+            for key in ("title_selector", "url_selector", "date_selector")
+            if config.get(key)
+        }
+
+    def parse_list(self, html: str) -> Tuple[List[ListEntry], Optional[str]]:
+        root = _parse_document(html)
+        if root is None:
+            return [], None
+
+        entries = []
+        for element in self._document_selectors["list_selector"](root):
+            title_elem = self._item_select_one(element, "title_selector")
+            if title_elem is None:
+                continue
+            url_elem = self._item_select_one(element, "url_selector")
+            if url_elem is None or not url_elem.get("href"):
+                continue
+
+            date_text = None
+            if "date_selector" in self.config:
+                date_elem = self._item_select_one(element, "date_selector")
+                if date_elem is not None:
+                    date_text = get_text(date_elem)
+
+            entries.append(ListEntry(
+                title=get_text(title_elem),
+                href=url_elem.get("href"),
+                date_text=date_text,
+            ))
+
+        next_href = None
+        next_selector = self._document_selectors.get("next_page_selector")
+        if next_selector is not None:
+            matches = next_selector(root)
+            if matches and matches[0].get("href"):
+                next_href = matches[0].get("href")
+
+        return entries, next_href
+
+    def parse_detail(self, html: str) -> Tuple[str, str]:
+        root = _parse_document(html)
+        if root is None:
+            return "", html
+
+        matches = self._document_selectors["content_selector"](root)
+        if matches:
+            content_elem = matches[0]
+            raw_html = etree.tostring(content_elem, encoding=str, method="html", with_tail=False)
+            return get_text(content_elem, separator="\n"), raw_html
+        return get_text(root, separator="\n"), html
+
+    def _item_select_one(self, element: etree._Element, key: str) -> Optional[etree._Element]:
+        """First match of a compiled item selector below element."""
+        matches = self._item_selectors[key](element)
+        return matches[0] if matches else None
+
+
+def _parse_document(html: str) -> Optional[etree._Element]:
+    """Parse an HTML document (None for an empty one)."""
+    try:
+        return etree.HTML(html)
+    except ValueError:
+        # Unicode input with an XML encoding declaration
+        return etree.HTML(html.encode("utf-8"), etree.HTMLParser(encoding="utf-8"))
+
+
+def _iter_strings(element: etree._Element) -> Iterator[str]:
+    """Text nodes below element in document order, as BeautifulSoup sees them."""
+    if element.text and element.tag not in _NON_TEXT_TAGS:
+        yield element.text
+    for child in element:
+        # Comments and processing instructions have no string tag
+        if isinstance(child.tag, str) and child.tag not in _NON_TEXT_TAGS:
+            yield from _iter_strings(child)
+        if child.tail:
+            yield child.tail
+
+
+def get_text(element: etree._Element, separator: str = "") -> str:
+    """Equivalent of BeautifulSoup's ``get_text(separator, strip=True)``."""
+    return separator.join(
+        stripped for stripped in (text.strip() for text in _iter_strings(element)) if stripped
+    )
+
+
+PARSER_BACKENDS = {
+    SoupParser.name: SoupParser,
+    LxmlParser.name: LxmlParser,
+}
+
+_parsers: Dict[str, PageParser] = {}
+
+
+def get_parser(config: Dict[str, Any], backend: str) -> PageParser:
+    """
+    Return the parser for a scraper config, compiling its selectors once.
+
+    Parsers are cached by backend and selector values. A config whose
+    selectors the lxml backend cannot compile falls back to BeautifulSoup.
+
+    Args:
+        config: Scraper config
+        backend: "lxml" or "bs4"
+
+    Returns:
+        Parser instance
+    """
+    if backend not in PARSER_BACKENDS:
+        raise ValueError(f"Unknown parser backend: {backend}")
+
+    key = json.dumps(
+        [backend, *(config.get(name) for name in SELECTOR_KEYS)],
+        ensure_ascii=False,
+    )
+    parser = _parsers.get(key)
+    if parser is None:
+        try:
+            parser = PARSER_BACKENDS[backend](config)
+        except (SelectorError, etree.XPathError) as e:
+            logger.warning(f"Selectors not supported by {backend}, using bs4: {e}")
+            parser = SoupParser(config)
+        _parsers[key] = parser
+    return parser
+
+
+def extract_detail(
+    body: bytes,
+    encoding: str,
+    config: Dict[str, Any],
+    backend: str,
+) -> Tuple[str, str]:
+    """
+    Decode and parse a detail page (entry point for parse pool workers).
+
+    Args:
+        body: Response body
+        encoding: Encoding to decode body with (undecodable bytes are replaced)
+        config: Scraper config with the content selector
+        backend: Parser backend name
+
+    Returns:
+        (content, raw_html)
+    """
+    html = body.decode(encoding, errors="replace")
+    return get_parser(config, backend).parse_detail(html)
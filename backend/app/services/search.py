@@ -0,0 +1,29 @@
+"""Keyword search expressions for tender queries."""
+from sqlalchemy import func
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.models.tender import Tender
+
+
+def keyword_condition(keyword: str) -> ColumnElement:
+    """
+    Match tenders whose title or content contains the keyword.
+
+    On PostgreSQL the ILIKE is served by the pg_trgm GIN indexes on title and
+    content. Trigram indexes need at least three characters to narrow the
+    search; shorter keywords still match but scan more of the index.
+    """
+    pattern = f"%{keyword}%"
+    return Tender.title.ilike(pattern) | Tender.content.ilike(pattern)
+
+
+def keyword_rank(keyword: str) -> ColumnElement:
+    """
+    Relevance score for keyword matches (PostgreSQL pg_trgm).
+
+    Title matches weigh twice as much as content matches. Only the start of
+    the content is scored to keep ranking cheap on long announcements.
+    """
+    title_score = func.word_similarity(keyword, Tender.title)
+    content_score = func.word_similarity(keyword, func.substr(Tender.content, 1, 2000))
+    return 2 * title_score + content_score
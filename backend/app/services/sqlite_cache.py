@@ -0,0 +1,145 @@
+"""SQLite-backed key/value store with TTL expiry and LRU eviction."""
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+
+class SqliteCache:
+    """
+    Base class for the persistent caches.
+
+    Uses a local SQLite file in WAL mode, so several worker processes on the
+    same host can share it. Entries expire after ``ttl_seconds`` and the least
+    recently used entries are evicted once ``max_entries`` is exceeded.
+    Eviction runs every ``evict_interval`` writes rather than on each one, so
+    the table may briefly hold up to that many extra entries.
+
+    Subclasses set ``table``, ``key_column`` and ``value_columns`` (column
+    name to SQL type) and call ``_fetch``/``_store`` from their blocking
+    helpers, which run in worker threads.
+    """
+
+    table: str
+    key_column: str = "key"
+    value_columns: Dict[str, str] = {}
+
+    def __init__(self, path: str, ttl_seconds: int, max_entries: int) -> None:
+        """
+        Initialize cache.
+
+        Args:
+            path: SQLite database file path
+            ttl_seconds: Entry lifetime in seconds
+            max_entries: Maximum number of stored entries
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        # About 1% overshoot, bounded so large caches still evict regularly
+        self.evict_interval = min(1000, max(1, self.max_entries // 100))
+
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._writes = 0
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use (caller holds the lock)."""
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            columns = "".join(
+                f"{name} {sql_type},\n" for name, sql_type in self.value_columns.items()
+            )
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {self.table} (
+                    {self.key_column} TEXT PRIMARY KEY,
+                    {columns}
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                f"CREATE INDEX IF NOT EXISTS ix_{self.table}_created_at "
+                f"ON {self.table} (created_at)"
+            )
+            conn.execute(
+                f"CREATE INDEX IF NOT EXISTS ix_{self.table}_accessed_at "
+                f"ON {self.table} (accessed_at)"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _fetch(self, key: str) -> Optional[Tuple[Any, ...]]:
+        """
+        Blocking lookup; refreshes the entry's access time.
+
+        Returns:
+            Value columns in ``value_columns`` order, or None on a miss
+        """
+        now = time.time()
+        names = ", ".join(self.value_columns)
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                f"SELECT {names}, created_at FROM {self.table} WHERE {self.key_column} = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+
+            *values, created_at = row
+            if now - created_at > self.ttl_seconds:
+                conn.execute(f"DELETE FROM {self.table} WHERE {self.key_column} = ?", (key,))
+                conn.commit()
+                return None
+
+            conn.execute(
+                f"UPDATE {self.table} SET accessed_at = ? WHERE {self.key_column} = ?",
+                (now, key),
+            )
+            conn.commit()
+        return tuple(values)
+
+    def _store(self, key: str, values: Sequence[Any]) -> None:
+        """Blocking write; runs TTL and size eviction every ``evict_interval`` writes."""
+        now = time.time()
+        names = ", ".join([self.key_column, *self.value_columns, "created_at", "accessed_at"])
+        placeholders = ", ".join("?" * (len(values) + 3))
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                f"INSERT OR REPLACE INTO {self.table} ({names}) VALUES ({placeholders})",
+                (key, *values, now, now),
+            )
+            self._writes += 1
+            if self._writes >= self.evict_interval:
+                self._writes = 0
+                self._evict(conn, now)
+            conn.commit()
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        """Drop expired entries, then the least recently used beyond max_entries."""
+        conn.execute(f"DELETE FROM {self.table} WHERE created_at < ?", (now - self.ttl_seconds,))
+        (count,) = conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()
+        if count > self.max_entries:
+            conn.execute(
+                f"DELETE FROM {self.table} WHERE {self.key_column} IN ("
+                f"SELECT {self.key_column} FROM {self.table} ORDER BY accessed_at LIMIT ?)",
+                (count - self.max_entries,),
+            )
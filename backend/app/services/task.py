@@ -1,12 +1,19 @@
 """Task service for running scraping and extraction pipeline."""
 import logging
-from typing import List, Optional
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any, Awaitable, Dict, List, Optional, Set
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.tender import Tender, SourceConfig
-from app.schemas.tender import TenderCreate
-from app.services.scraper.base import BaseScraper
+from app.config import settings
+from app.models.tender import SourceConfig
+from app.schemas.tender import TenderCreate, TenderExtractModel
+from app.services.dedup import find_existing_urls
+from app.services.incremental import IncrementalState
+from app.services.pipeline import Pipeline, Stage
+from app.services.writer import TenderBatchWriter
+from app.services.scraper.base import BaseScraper, KnownUrlsLookup, ScrapedItem
 from app.services.scraper.http_scraper import SimpleHttpScraper
 from app.services.scraper.adapters import create_ccgp_scraper
 from app.services.ai.extraction import extraction_service
@@ -15,6 +22,31 @@ from app.services.filter import filter_service
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _PendingTender:
+    """Scraped item travelling through the pipeline with its filter state."""
+
+    item: ScrapedItem
+    is_filtered: bool
+    filter_reason: Optional[str]
+    extracted_data: Optional[TenderExtractModel] = None
+
+
+@dataclass
+class TaskProgress:
+    """Live counters for a running source task."""
+
+    scraped: int = 0
+    duplicates: int = 0
+    processed: int = 0
+    filtered: int = 0
+    errors: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Counters as a dict."""
+        return asdict(self)
+
+
 class TaskService:
     """Service for executing scraping and extraction tasks."""
 
@@ -30,11 +62,31 @@ class TaskService:
         else:
             raise ValueError(f"Unsupported scraper type: {source_config.scraper_type}")
 
+    @staticmethod
+    async def _drop_known_items(
+        items: List[ScrapedItem],
+        known_urls: KnownUrlsLookup,
+    ) -> List[ScrapedItem]:
+        """Remove list entries whose URL is already stored or repeated, keeping order."""
+        existing = await known_urls(item.url for item in items)
+        seen = set(existing)
+
+        new_items = []
+        for item in items:
+            if item.url in seen:
+                logger.debug(f"Item already exists: {item.url}")
+                continue
+            seen.add(item.url)
+            new_items.append(item)
+
+        return new_items
+
     async def run_source_task(
         self,
         db: AsyncSession,
         source_id: int,
         limit: int = 10,
+        progress: Optional[TaskProgress] = None,
     ) -> dict:
         """
         Run scraping task for a specific source.
@@ -43,6 +95,7 @@ class TaskService:
             db: Database session
             source_id: Source configuration ID
             limit: Maximum items to scrape
+            progress: Optional counters updated while the task runs
 
         Returns:
             Task result summary
@@ -62,146 +115,222 @@ class TaskService:
         # Create scraper
         scraper = self.create_scraper(source)
 
-        try:
-            # Scrape items
-            logger.info(f"Starting scraping task for {source.name}")
-            scraped_items = await scraper.scrape(limit=limit)
-            logger.info(f"Scraped {len(scraped_items)} items from {source.name}")
-
-            # Process each item
-            processed = 0
-            filtered = 0
-            errors = 0
-
-            for item in scraped_items:
-                try:
-                    # Check if already exists
-                    existing = await db.execute(
-                        select(Tender).where(
-                            Tender.source_name == source.name,
-                            Tender.source_url == item.url,
-                        )
-                    )
-                    if existing.scalar_one_or_none():
-                        logger.debug(f"Item already exists: {item.url}")
-                        continue
-
-                    # Apply keyword filters first
-                    is_filtered, filter_reason = filter_service.apply_filters(
-                        title=item.title,
-                        content=item.content,
-                        filter_rules=source.filter_rules,
-                    )
+        source_name = source.name
+        filter_rules = source.filter_rules
+
+        if progress is None:
+            progress = TaskProgress()
 
-                    # Extract structured data
-                    extracted_data = None
-                    if not is_filtered:
-                        try:
-                            extracted_data = await extraction_service.extract(
-                                title=item.title,
-                                content=item.content,
-                            )
-                        except Exception as e:
-                            logger.warning(f"Extraction failed for {item.title}: {e}")
-
-                    # Apply budget filters if extraction succeeded
-                    if extracted_data and not is_filtered:
-                        is_budget_filtered, budget_reason = filter_service.apply_budget_filters(
-                            budget_amount=extracted_data.budget_amount,
-                            filter_rules=source.filter_rules,
-                        )
-                        if is_budget_filtered:
-                            is_filtered = True
-                            filter_reason = budget_reason
-
-                    # Create tender record
-                    tender = Tender(
-                        source_name=source.name,
-                        source_url=item.url,
-                        original_id=item.original_id,
-                        title=item.title,
-                        content=item.content,
-                        raw_html=item.raw_html,
-                        published_at=item.published_at,
-                        is_filtered=is_filtered,
-                        filter_reason=filter_reason,
+        async def apply_filters(item: ScrapedItem) -> Optional[_PendingTender]:
+            """Apply filters that do not need extraction."""
+            try:
+                is_filtered, filter_reason = filter_service.apply_filters(
+                    title=item.title,
+                    content=item.content,
+                    filter_rules=filter_rules,
+                )
+                return _PendingTender(item, is_filtered, filter_reason)
+            except Exception as e:
+                logger.error(f"Error processing item {item.url}: {e}")
+                progress.errors += 1
+                return None
+
+        def apply_extracted_filters(pending: _PendingTender) -> None:
+            """Apply budget filters and the filter expression if extraction succeeded."""
+            if not pending.extracted_data:
+                return
+            is_filtered, filter_reason = filter_service.apply_extracted_filters(
+                title=pending.item.title,
+                content=pending.item.content,
+                extracted=pending.extracted_data.model_dump(),
+                filter_rules=filter_rules,
+            )
+            if is_filtered:
+                pending.is_filtered = True
+                pending.filter_reason = filter_reason
+
+        async def extract(pending: _PendingTender) -> _PendingTender:
+            """Extract structured data and apply filters that need it."""
+            if pending.is_filtered:
+                return pending
+
+            item = pending.item
+            try:
+                pending.extracted_data = await extraction_service.extract(
+                    title=item.title,
+                    content=item.content,
+                )
+            except Exception as e:
+                logger.warning(f"Extraction failed for {item.title}: {e}")
+
+            apply_extracted_filters(pending)
+            return pending
+
+        async def extract_batch(batch: List[_PendingTender]) -> List[_PendingTender]:
+            """Extract queued tenders together, packing Gemini requests."""
+            todo = [pending for pending in batch if not pending.is_filtered]
+            if not todo:
+                return batch
+
+            try:
+                results = await extraction_service.extract_batch(
+                    [(pending.item.title, pending.item.content) for pending in todo]
+                )
+            except Exception as e:
+                logger.warning(f"Batch extraction failed for {len(todo)} items: {e}")
+                results = [None] * len(todo)
+
+            for pending, extracted_data in zip(todo, results):
+                pending.extracted_data = extracted_data
+                apply_extracted_filters(pending)
+            return batch
+
+        writer = TenderBatchWriter(
+            db,
+            batch_size=settings.pipeline_insert_batch_size,
+            commit_every=settings.pipeline_commit_every,
+        )
+        # URL -> is_filtered for rows handed to the writer but not yet written
+        written: Dict[str, bool] = {}
+
+        def record_inserted(inserted: Set[str]) -> None:
+            """Count rows the writer actually inserted."""
+            for url in inserted:
+                if written.pop(url):
+                    progress.filtered += 1
+                else:
+                    progress.processed += 1
+
+        async def persist(pending: _PendingTender) -> _PendingTender:
+            """Queue the tender record for the batched writer."""
+            item = pending.item
+            extracted_data = pending.extracted_data
+            try:
+                row = {
+                    "source_name": source_name,
+                    "source_url": item.url,
+                    "original_id": item.original_id,
+                    "title": item.title,
+                    "content": item.content,
+                    "raw_html": item.raw_html,
+                    "published_at": item.published_at,
+                    "is_filtered": pending.is_filtered,
+                    "filter_reason": pending.filter_reason,
+                }
+
+                # Add extracted fields
+                if extracted_data:
+                    row.update(
+                        project_name=extracted_data.project_name,
+                        budget_amount=extracted_data.budget_amount,
+                        budget_currency=extracted_data.budget_currency,
+                        deadline=extracted_data.deadline,
+                        contact_person=extracted_data.contact_person,
+                        contact_phone=extracted_data.contact_phone,
+                        contact_email=extracted_data.contact_email,
+                        location=extracted_data.location,
+                        extracted_data=extracted_data.model_dump(mode="json"),
                     )
 
-                    # Add extracted fields
-                    if extracted_data:
-                        tender.project_name = extracted_data.project_name
-                        tender.budget_amount = extracted_data.budget_amount
-                        tender.budget_currency = extracted_data.budget_currency
-                        tender.deadline = extracted_data.deadline
-                        tender.contact_person = extracted_data.contact_person
-                        tender.contact_phone = extracted_data.contact_phone
-                        tender.contact_email = extracted_data.contact_email
-                        tender.location = extracted_data.location
-                        tender.extracted_data = extracted_data.model_dump()
-
-                    db.add(tender)
-                    await db.flush()
-
-                    if is_filtered:
-                        filtered += 1
-                    else:
-                        processed += 1
-
-                except Exception as e:
-                    logger.error(f"Error processing item {item.url}: {e}")
-                    errors += 1
-                    continue
-
-            # Commit all changes
-            await db.commit()
+                written[item.url] = pending.is_filtered
+                record_inserted(await writer.add(row))
+
+            except Exception as e:
+                logger.error(f"Error processing item {item.url}: {e}")
+                progress.errors += 1
+
+            return pending
+
+        # Detail fetch -> filter -> extract -> persist, with bounded queues between
+        # stages so detail fetching overlaps with extraction and DB writes
+        queue_size = settings.pipeline_queue_size
+        extract_batch_size = settings.pipeline_extract_batch_size
+        pipeline = Pipeline(
+            stages=[
+                Stage("filter", apply_filters, queue_size=queue_size),
+                Stage(
+                    "extract",
+                    extract_batch if extract_batch_size > 1 else extract,
+                    workers=settings.pipeline_extract_workers,
+                    queue_size=queue_size,
+                    batch_size=extract_batch_size,
+                ),
+                # Single writer: AsyncSession is not safe for concurrent use
+                Stage("persist", persist, queue_size=queue_size),
+            ],
+            source_name="fetch",
+        )
+
+        try:
+            logger.info(f"Starting scraping task for {source_name}")
+            state = IncrementalState(source.incremental_state)
+
+            def lookup(candidates: List[str]) -> Awaitable[Set[str]]:
+                return find_existing_urls(db, source_name, candidates)
+
+            async def known_urls(urls) -> Set[str]:
+                """Stored URLs, always confirmed in the database."""
+                return await state.known_urls(urls, lookup)
+
+            async def page_known_urls(urls) -> Set[str]:
+                """Stored URLs of a list page; pages seen in full by earlier runs skip the query."""
+                return await state.page_known_urls(urls, lookup)
+
+            listed = await scraper.scrape_list(
+                limit=limit,
+                known_urls=page_known_urls,
+                since=state.high_water_mark,
+            )
+            new_items = await self._drop_known_items(listed, known_urls)
+            progress.scraped = len(listed)
+            progress.duplicates = len(listed) - len(new_items)
+            logger.info(
+                f"Listed {progress.scraped} items from {source_name}, "
+                f"{progress.duplicates} already known, fetching {len(new_items)}"
+            )
 
-            # Update source last run time
-            from datetime import datetime
+            await pipeline.run(scraper.iter_details(new_items))
+            record_inserted(await writer.flush())
+
+            # Rows skipped by ON CONFLICT were stored by a concurrent run
+            progress.duplicates += writer.conflicts
+            progress.errors += writer.errors
+
+            # Advance the high-water mark past items stored by this run (not
+            # past ones that failed, nor at all when the limit cut the listing
+            # short) and remember every listed URL that is now stored
+            new_urls = {item.url for item in new_items}
+            state.advance(
+                (item for item in listed if item.url in writer.inserted),
+                pending=(item for item in new_items if item.url not in writer.inserted),
+                complete=len(listed) < limit or state.reached_mark(listed),
+            )
+            state.remember(
+                item.url
+                for item in listed
+                if item.url not in new_urls or item.url in writer.inserted
+            )
+            source.incremental_state = state.to_dict()
+
+            # Update source last run time and commit remaining rows together
             source.last_run_at = datetime.now()
             await db.commit()
 
             logger.info(
-                f"Task completed for {source.name}: "
-                f"processed={processed}, filtered={filtered}, errors={errors}"
+                f"Task completed for {source_name}: processed={progress.processed}, "
+                f"filtered={progress.filtered}, errors={progress.errors}"
             )
+            logger.info(f"Extraction tiers (process totals): {extraction_service.stats()}")
 
             return {
-                "source_name": source.name,
-                "scraped": len(scraped_items),
-                "processed": processed,
-                "filtered": filtered,
-                "errors": errors,
+                "source_name": source_name,
+                **progress.to_dict(),
+                "stages": pipeline.summary(),
             }
 
         finally:
             await scraper.close()
 
-    async def run_all_active_sources(
-        self,
-        db: AsyncSession,
-        limit: int = 10,
-    ) -> List[dict]:
-        """Run tasks for all active sources."""
-        # Get all active sources
-        result = await db.execute(
-            select(SourceConfig).where(SourceConfig.is_active == True)
-        )
-        sources = result.scalars().all()
-
-        results = []
-        for source in sources:
-            try:
-                result = await self.run_source_task(db, source.id, limit)
-                results.append(result)
-            except Exception as e:
-                logger.error(f"Task failed for {source.name}: {e}")
-                results.append({
-                    "source_name": source.name,
-                    "error": str(e),
-                })
-
-        return results
-
 
 # Create singleton instance
 task_service = TaskService()
@@ -0,0 +1,157 @@
+"""Batched writer for tender rows."""
+import asyncio
+import logging
+from typing import Any, Dict, List, Set, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import dialect_insert
+from app.models.tender import Tender
+from app.services.raw_store import pack_document, store_documents
+
+logger = logging.getLogger(__name__)
+
+# Columns written for every row, so each multi-row INSERT has a uniform shape
+_COLUMNS = (
+    "source_name",
+    "source_url",
+    "original_id",
+    "title",
+    "content",
+    "project_name",
+    "budget_amount",
+    "budget_currency",
+    "deadline",
+    "contact_person",
+    "contact_phone",
+    "contact_email",
+    "location",
+    "raw_html_hash",
+    "extracted_data",
+    "is_filtered",
+    "filter_reason",
+    "published_at",
+)
+
+
+class TenderBatchWriter:
+    """
+    Accumulates tender rows and writes them with multi-row inserts.
+
+    Each batch is one ``INSERT ... ON CONFLICT (source_name, source_url) DO
+    NOTHING RETURNING source_url`` statement, so rows written by a concurrent
+    run are skipped instead of failing the batch. If a batch fails for another
+    reason, its rows are retried one by one to isolate the bad row.
+
+    A row's ``raw_html`` is compressed off the event loop and stored in the raw
+    document store in the same transaction, only for rows the insert actually
+    wrote; the tender row keeps only its hash.
+    """
+
+    def __init__(self, db: AsyncSession, batch_size: int = 50, commit_every: int = 1) -> None:
+        """
+        Initialize writer.
+
+        Args:
+            db: Database session
+            batch_size: Rows per INSERT statement
+            commit_every: Commit after this many batches (0 leaves commits to the caller)
+        """
+        self.db = db
+        self.batch_size = max(1, batch_size)
+        self.commit_every = max(0, commit_every)
+
+        self.inserted: Set[str] = set()
+        self.conflicts = 0
+        self.errors = 0
+        self.batches = 0
+
+        self._rows: List[Dict[str, Any]] = []
+        self._documents: Dict[str, Dict[str, Any]] = {}
+        self._uncommitted_batches = 0
+
+    async def add(self, row: Dict[str, Any]) -> Set[str]:
+        """
+        Queue a row, writing the batch once it is full.
+
+        Returns:
+            URLs inserted by this call (empty unless a batch was written)
+        """
+        raw_html = row.get("raw_html")
+        if raw_html:
+            document = await asyncio.to_thread(pack_document, raw_html)
+            self._documents[document["hash"]] = document
+            row = {**row, "raw_html_hash": document["hash"]}
+
+        self._rows.append({column: row.get(column) for column in _COLUMNS})
+        if len(self._rows) >= self.batch_size:
+            return await self.flush()
+        return set()
+
+    async def flush(self) -> Set[str]:
+        """
+        Write all queued rows.
+
+        Returns:
+            URLs inserted by this flush
+        """
+        if not self._rows:
+            return set()
+
+        rows, self._rows = self._rows, []
+        documents, self._documents = self._documents, {}
+        failed = 0
+        try:
+            async with self.db.begin_nested():
+                inserted = await self._insert(rows, documents)
+        except Exception as e:
+            logger.warning(f"Batch insert of {len(rows)} tenders failed, retrying per row: {e}")
+            inserted, failed = await self._insert_rows_individually(rows, documents)
+
+        self.inserted.update(inserted)
+        self.conflicts += len(rows) - len(inserted) - failed
+        self.errors += failed
+        self.batches += 1
+
+        self._uncommitted_batches += 1
+        if self.commit_every and self._uncommitted_batches >= self.commit_every:
+            await self.db.commit()
+            self._uncommitted_batches = 0
+
+        return inserted
+
+    async def _insert(
+        self,
+        rows: List[Dict[str, Any]],
+        documents: Dict[str, Dict[str, Any]],
+    ) -> Set[str]:
+        """Run one multi-row insert, store raw documents of the rows inserted and return their URLs."""
+        stmt = (
+            dialect_insert(self.db, Tender)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=["source_name", "source_url"])
+            .returning(Tender.source_url, Tender.raw_html_hash)
+        )
+        result = await self.db.execute(stmt)
+        inserted = result.all()
+
+        # Rows skipped by ON CONFLICT keep the existing row's document
+        hashes = {digest for _, digest in inserted if digest}
+        await store_documents(self.db, [documents[digest] for digest in hashes])
+        return {url for url, _ in inserted}
+
+    async def _insert_rows_individually(
+        self,
+        rows: List[Dict[str, Any]],
+        documents: Dict[str, Dict[str, Any]],
+    ) -> Tuple[Set[str], int]:
+        """Insert rows one at a time, skipping the ones that fail."""
+        inserted: Set[str] = set()
+        failed = 0
+        for row in rows:
+            try:
+                async with self.db.begin_nested():
+                    inserted.update(await self._insert([row], documents))
+            except Exception as e:
+                logger.error(f"Error inserting tender {row['source_url']}: {e}")
+                failed += 1
+        return inserted, failed
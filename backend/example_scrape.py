@@ -9,6 +9,8 @@ load_dotenv()
 from app.database import AsyncSessionLocal
 from app.models.tender import SourceConfig
 from app.services.scraper.adapters import create_ccgp_scraper
+from app.services.scraper.http_client import http_clients
+from app.services.scraper.parse_pool import parse_pool
 from app.services.ai.extraction import extraction_service
 
 
@@ -61,6 +63,8 @@ async def main():
 
     finally:
         await scraper.close()
+        await http_clients.close()
+        await parse_pool.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,132 @@
+"""Tests for batched Gemini extraction."""
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from app.schemas.tender import TenderExtractModel
+from tenacity import wait_none
+
+from app.services.ai.extraction import ExtractionService
+
+
+def make_service(monkeypatch, respond):
+    """Service without rules or cache whose batch model answers with respond(ids)."""
+    service = ExtractionService(rules=None)
+    service.cache = None
+    prompts = []
+
+    async def generate(prompt):
+        ids = [line.split()[2] for line in prompt.splitlines() if line.startswith("=== 公告")]
+        prompts.append(ids)
+        return SimpleNamespace(text=respond(ids))
+
+    async def single(title, content):
+        return TenderExtractModel(project_name=f"single:{title}")
+
+    monkeypatch.setattr(service.batch_model, "generate_content_async", generate)
+    monkeypatch.setattr(service, "_extract", single)
+    return service, prompts
+
+
+@pytest.mark.asyncio
+async def test_batch_is_packed_into_one_request(monkeypatch):
+    """Elements are matched to documents by id, whatever their order."""
+    def respond(ids):
+        elements = [{"id": int(i), "project_name": f"项目{i}", "budget_amount": 100} for i in ids]
+        return "```json\n" + json.dumps(elements[::-1], ensure_ascii=False) + "\n```"
+
+    service, prompts = make_service(monkeypatch, respond)
+    results = await service.extract_batch([(f"标题{i}", "内容") for i in range(3)])
+
+    assert prompts == [["1", "2", "3"]]
+    assert [r.project_name for r in results] == ["项目1", "项目2", "项目3"]
+    stats = service.stats()
+    assert stats["model_calls"] == 1
+    assert stats["batch_calls"] == 1
+    assert stats["items_per_batch"] == 3
+
+
+@pytest.mark.asyncio
+async def test_missing_and_invalid_elements_are_retried(monkeypatch):
+    """Elements that are absent or fail validation go to a smaller request."""
+    def respond(ids):
+        if len(ids) == 4:
+            return json.dumps([
+                {"id": "1", "project_name": "A"},
+                {"id": "2", "budget_amount": -5},
+                {"id": "4", "project_name": "D"},
+            ])
+        return json.dumps([{"id": i, "project_name": f"retry{i}"} for i in ids])
+
+    service, prompts = make_service(monkeypatch, respond)
+    results = await service.extract_batch([(f"t{i}", "c") for i in range(4)])
+
+    assert prompts == [["1", "2", "3", "4"], ["1", "2"]]
+    assert [r.project_name for r in results] == ["A", "retry1", "retry2", "D"]
+
+
+@pytest.mark.asyncio
+async def test_failed_request_is_split(monkeypatch):
+    """An unusable answer is halved, down to single-item calls."""
+    def respond(ids):
+        if len(ids) > 2:
+            return '[{"id": 1, "project_name": "trunc'
+        return "not json"
+
+    service, prompts = make_service(monkeypatch, respond)
+    results = await service.extract_batch([(f"t{i}", "c") for i in range(4)])
+
+    assert prompts[0] == ["1", "2", "3", "4"]
+    assert [r.project_name for r in results] == ["single:t0", "single:t1", "single:t2", "single:t3"]
+    assert service.stats()["model_failures"] == 3
+
+
+@pytest.mark.asyncio
+async def test_api_error_is_retried_not_split(monkeypatch):
+    """Transient API errors resend the same batch instead of splitting it."""
+    monkeypatch.setattr(ExtractionService._generate_batch.retry, "wait", wait_none())
+    attempts = []
+
+    def respond(ids):
+        attempts.append(ids)
+        if len(attempts) < 3:
+            raise RuntimeError("429 Resource exhausted")
+        return json.dumps([{"id": i, "project_name": f"项目{i}"} for i in ids])
+
+    service, prompts = make_service(monkeypatch, respond)
+    results = await service.extract_batch([(f"t{i}", "c") for i in range(4)])
+
+    assert prompts == [["1", "2", "3", "4"]] * 3
+    assert [r.project_name for r in results] == ["项目1", "项目2", "项目3", "项目4"]
+    stats = service.stats()
+    assert stats["model_failures"] == 0
+    assert stats["model_calls"] == stats["batch_calls"] == 1
+
+
+@pytest.mark.asyncio
+async def test_exhausted_retries_give_up_on_batch(monkeypatch):
+    """A batch whose API errors outlast the retries is dropped, not split."""
+    monkeypatch.setattr(ExtractionService._generate_batch.retry, "wait", wait_none())
+
+    def respond(ids):
+        raise RuntimeError("429 Resource exhausted")
+
+    service, prompts = make_service(monkeypatch, respond)
+    results = await service.extract_batch([(f"t{i}", "c") for i in range(4)])
+
+    assert all(len(ids) == 4 for ids in prompts)
+    assert results == [None] * 4
+    assert service.stats()["model_failures"] == 1
+
+
+def test_packing_respects_item_and_token_limits(monkeypatch):
+    """Batches close at the item cap or when the token estimate would overflow."""
+    service, _ = make_service(monkeypatch, lambda ids: "[]")
+    service.batch_max_items = 3
+    service.batch_max_tokens = 1000
+
+    documents = [(i, "t", "x" * size) for i, size in enumerate([100, 100, 100, 100, 900, 100])]
+    batches = service._pack(documents)
+
+    assert [[d[0] for d in batch] for batch in batches] == [[0, 1, 2], [3], [4], [5]]
@@ -0,0 +1,29 @@
+"""Tests for deduplication lookups."""
+import pytest
+
+from app.models.tender import Tender
+from app.services.dedup import find_existing_urls
+
+
+@pytest.mark.asyncio
+async def test_find_existing_urls(test_db):
+    """Only URLs stored for the same source are reported."""
+    test_db.add_all([
+        Tender(source_name="源1", source_url="https://example.com/1", title="项目1", content="内容"),
+        Tender(source_name="源2", source_url="https://example.com/2", title="项目2", content="内容"),
+    ])
+    await test_db.commit()
+
+    existing = await find_existing_urls(
+        test_db,
+        "源1",
+        ["https://example.com/1", "https://example.com/2", "https://example.com/3"],
+    )
+
+    assert existing == {"https://example.com/1"}
+
+
+@pytest.mark.asyncio
+async def test_find_existing_urls_empty(test_db):
+    """No query results for an empty candidate list."""
+    assert await find_existing_urls(test_db, "源1", []) == set()
@@ -0,0 +1,93 @@
+"""Tests for the extraction result cache."""
+import time
+import pytest
+
+from app.services.ai.cache import ExtractionCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a cache backed by a temporary SQLite file."""
+    cache = ExtractionCache(
+        path=str(tmp_path / "cache" / "extraction.sqlite3"),
+        ttl_seconds=3600,
+        max_entries=3,
+    )
+    yield cache
+    cache.close()
+
+
+class TestExtractionCache:
+    """Test cases for ExtractionCache."""
+
+    def test_key_normalizes_whitespace(self):
+        """Formatting-only differences share a key; model and prompt do not."""
+        key = ExtractionCache.make_key("项目 公告", "内容\n第一行", "model-a", "v1")
+
+        assert ExtractionCache.make_key(" 项目  公告", "内容 第一行 ", "model-a", "v1") == key
+        assert ExtractionCache.make_key("项目 公告", "内容\n第一行", "model-b", "v1") != key
+        assert ExtractionCache.make_key("项目 公告", "内容\n第一行", "model-a", "v2") != key
+
+    @pytest.mark.asyncio
+    async def test_get_and_set(self, cache):
+        """Stored values are returned and counted as hits."""
+        assert await cache.get("a") is None
+
+        await cache.set("a", {"project_name": "办公设备采购", "budget_amount": 500000.0})
+        assert await cache.get("a") == {"project_name": "办公设备采购", "budget_amount": 500000.0}
+
+        assert cache.stats() == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self, cache):
+        """Entries beyond max_entries are evicted by access time."""
+        for key in ("a", "b", "c"):
+            await cache.set(key, {"key": key})
+            time.sleep(0.01)
+
+        await cache.get("a")
+        await cache.set("d", {"key": "d"})
+
+        assert await cache.get("b") is None
+        assert await cache.get("a") == {"key": "a"}
+        assert await cache.get("d") == {"key": "d"}
+
+    @pytest.mark.asyncio
+    async def test_eviction_runs_every_interval(self, tmp_path):
+        """Large caches evict in batches instead of counting rows on every write."""
+        cache = ExtractionCache(
+            path=str(tmp_path / "batched.sqlite3"), ttl_seconds=3600, max_entries=300
+        )
+        try:
+            assert cache.evict_interval == 3
+            for key in range(302):
+                await cache.set(str(key), {"key": key})
+
+            (count,) = cache._conn.execute("SELECT COUNT(*) FROM extraction_cache").fetchone()
+            assert count == 302
+
+            await cache.set("last", {"key": "last"})
+            (count,) = cache._conn.execute("SELECT COUNT(*) FROM extraction_cache").fetchone()
+            assert count == 300
+        finally:
+            cache.close()
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_miss(self, cache):
+        """Entries older than the TTL are not returned."""
+        cache.ttl_seconds = 0
+        await cache.set("a", {"key": "a"})
+        time.sleep(0.01)
+
+        assert await cache.get("a") is None
+
+    @pytest.mark.asyncio
+    async def test_shared_across_instances(self, cache):
+        """A second instance on the same file sees stored entries."""
+        await cache.set("a", {"key": "a"})
+
+        other = ExtractionCache(path=cache.path, ttl_seconds=3600, max_entries=3)
+        try:
+            assert await other.get("a") == {"key": "a"}
+        finally:
+            other.close()
@@ -1,6 +1,6 @@
 """Tests for filter service."""
 import pytest
-from app.services.filter import filter_service
+from app.services.filter import compile_rules, filter_service
 
 
 class TestFilterService:
@@ -126,3 +126,52 @@ class TestFilterService:
             filter_rules=filter_rules,
         )
         assert is_filtered is False
+
+
+def _reference_apply_filters(title, content, filter_rules):
+    """Keyword rules evaluated with one substring search per keyword."""
+    combined_text = f"{title} {content}".lower()
+    for keyword in filter_rules.get("exclude_keywords", []):
+        if keyword.lower() in combined_text:
+            return True, f"Contains excluded keyword: {keyword}"
+    for keyword in filter_rules.get("title_exclude", []):
+        if keyword.lower() in title.lower():
+            return True, f"Title contains excluded keyword: {keyword}"
+    include_keywords = filter_rules.get("include_keywords", [])
+    if include_keywords and not any(k.lower() in combined_text for k in include_keywords):
+        return True, f"Does not contain any required keywords: {include_keywords}"
+    title_include = filter_rules.get("title_include", [])
+    if title_include and not any(k.lower() in title.lower() for k in title_include):
+        return True, f"Title does not contain required keywords: {title_include}"
+    return False, None
+
+
+def test_compiled_rules_match_substring_search():
+    """Compiled matching gives the same result as per-keyword substring search."""
+    filter_rules = {
+        "exclude_keywords": ["开发", "软件开发", "流标", "C++", "废标"],
+        "include_keywords": ["软件", "件开", "IT", "(系统)"],
+        "title_exclude": ["终止", "更正公告"],
+        "title_include": ["采购", "招标", "公告"],
+    }
+    samples = [
+        ("软件开发项目招标公告", "预算100万元"),
+        ("某单位采购公告", "本项目采购办公软件"),
+        ("某单位采购公告", "采购 it 设备（C++ 编译器）"),
+        ("某单位采购更正公告", "采购软件"),
+        ("办公家具采购", "采购桌椅 (系统) 集成"),
+        ("家具", "软件"),
+        ("流标公告", ""),
+        ("", ""),
+    ]
+    for title, content in samples:
+        assert filter_service.apply_filters(title, content, filter_rules) == (
+            _reference_apply_filters(title, content, filter_rules)
+        ), title
+
+
+def test_compile_rules_is_cached():
+    """Equal rule sets share one compiled matcher."""
+    first = compile_rules({"include_keywords": ["软件", "系统"]})
+    assert compile_rules({"include_keywords": ["软件", "系统"]}) is first
+    assert compile_rules({"include_keywords": ["系统"]}) is not first
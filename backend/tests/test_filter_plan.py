@@ -0,0 +1,115 @@
+"""Tests for filter expressions."""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.services.filter import filter_service
+from app.services.filter_plan import FilterRuleError, RuleContext, compile_expr
+
+
+RULES = {
+    "expr": {
+        "all": [
+            {"field": "deadline", "min_days": 0},
+            {"any": [
+                {"field": "location", "contains": ["北京", "上海"]},
+                {"field": "title", "regex": "^全国"},
+            ]},
+            {"field": "text", "contains": ["软件", "系统"]},
+            {"not": {"field": "title", "contains": ["废标"]}},
+        ]
+    }
+}
+
+
+def test_expression_rejects_before_extraction_when_text_decides():
+    """Text-only failures are final before extraction; field checks wait for it."""
+    is_filtered, reason = filter_service.apply_filters("家具采购", "桌椅", RULES)
+    assert is_filtered is True
+    assert reason == "Does not match filter expression: text contains ['软件', '系统']"
+
+    is_filtered, reason = filter_service.apply_filters("软件采购废标公告", "", RULES)
+    assert is_filtered is True
+    assert "not title contains ['废标']" in reason
+
+    # Depends on location and deadline: decided after extraction
+    assert filter_service.apply_filters("软件采购", "预算100万元", RULES) == (False, None)
+
+
+def test_expression_uses_extracted_fields():
+    """Location and deadline predicates are applied to extracted data."""
+    future = datetime.now(timezone.utc) + timedelta(days=5)
+    past = datetime.now(timezone.utc) - timedelta(days=1)
+
+    def check(title, **extracted):
+        return filter_service.apply_extracted_filters(title, "", extracted, RULES)
+
+    assert check("软件采购", location="北京市海淀区", deadline=future) == (False, None)
+    assert check("软件采购", location="广州市", deadline=future)[0] is True
+    assert check("全国软件采购", location="广州市", deadline=future) == (False, None)
+    assert check("软件采购", location="上海市", deadline=past) == (
+        True, "Does not match filter expression: deadline in [0, None] days"
+    )
+    # Nothing extracted for a field: unknown, so the tender is kept
+    assert check("软件采购", location=None, deadline=None) == (False, None)
+
+
+def test_budget_range_and_naive_deadline():
+    """Budget ranges and naive deadlines are evaluated against extracted values."""
+    plan = compile_expr({"all": [
+        {"field": "budget_amount", "min": 100000},
+        {"field": "deadline", "max_days": 30},
+    ]})
+    now = datetime(2024, 12, 1, tzinfo=timezone.utc)
+
+    def evaluate(**extracted):
+        return plan.evaluate(RuleContext("标题", "", extracted, now=now))[0]
+
+    assert evaluate(budget_amount=200000, deadline=datetime(2024, 12, 10)) is False
+    assert evaluate(budget_amount=50000, deadline=datetime(2024, 12, 10)) is True
+    assert evaluate(budget_amount=200000, deadline="2025-06-01T00:00:00+00:00") is True
+    assert plan.extracted_fields == {"budget_amount", "deadline"}
+    assert plan.uses_content is False
+
+
+def test_groups_reorder_by_cost():
+    """Cheap predicates run first."""
+    plan = compile_expr({"all": [
+        {"field": "content", "regex": "预算"},
+        {"field": "title", "contains": ["采购"]},
+        {"field": "location", "contains": ["北京"]},
+    ]})
+    assert [child.label for child in plan.root.children] == [
+        "title contains ['采购']",
+        "location contains ['北京']",
+        "content matches '预算'",
+    ]
+
+
+@pytest.mark.parametrize("expr", [
+    {},
+    {"all": []},
+    {"field": "unknown", "contains": ["x"]},
+    {"field": "title", "regex": "("},
+    {"field": "title", "min": 1},
+    {"field": "deadline", "min_days": "soon"},
+    {"field": "title", "contains": "软件"},
+    {"not": {"field": "title"}},
+])
+def test_invalid_expressions_are_rejected(expr):
+    """Malformed expressions raise FilterRuleError."""
+    with pytest.raises(FilterRuleError):
+        compile_expr(expr)
+
+
+def test_naive_deadline_uses_local_clock():
+    """Naive deadlines are local (Asia/Shanghai) times, not UTC wall-clock times."""
+    plan = compile_expr({"field": "deadline", "min_days": 0})
+    # 2024-12-01 20:00 in Shanghai
+    now = datetime(2024, 12, 1, 12, 0, tzinfo=timezone.utc)
+
+    def evaluate(deadline):
+        return plan.evaluate(RuleContext("标题", "", {"deadline": deadline}, now=now))[0]
+
+    assert evaluate(datetime(2024, 12, 1, 18, 0)) is True  # Passed two hours ago
+    assert evaluate(datetime(2024, 12, 1, 22, 0)) is False
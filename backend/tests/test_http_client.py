@@ -0,0 +1,199 @@
+"""Tests for the shared HTTP client registry."""
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from app.services.scraper.http_client import CachingResolverBackend, HttpClientRegistry
+
+
+class RecordingBackend:
+    """Network backend stub recording the hosts it connects to."""
+
+    def __init__(self, fail: bool = False, failing_hosts=()) -> None:
+        self.hosts = []
+        self.fail = fail
+        self.failing_hosts = set(failing_hosts)
+
+    async def connect_tcp(self, host, port, timeout=None, local_address=None, socket_options=None):
+        self.hosts.append(host)
+        if self.fail or host in self.failing_hosts:
+            raise OSError("connection refused")
+        return object()
+
+
+@pytest.mark.asyncio
+async def test_resolver_caches_lookups(monkeypatch):
+    """Hosts are resolved once per TTL and connections use the cached address."""
+    lookups = []
+
+    async def getaddrinfo(host, port, type=0):
+        lookups.append(host)
+        return [(None, None, None, "", ("10.0.0.1", port))]
+
+    monkeypatch.setattr(asyncio.get_running_loop(), "getaddrinfo", getaddrinfo)
+    inner = RecordingBackend()
+    backend = CachingResolverBackend(inner, ttl_seconds=60)
+
+    await backend.connect_tcp("example.com", 443)
+    await backend.connect_tcp("example.com", 443)
+    await backend.connect_tcp("127.0.0.1", 443)
+
+    assert lookups == ["example.com"]
+    assert inner.hosts == ["10.0.0.1", "10.0.0.1", "127.0.0.1"]
+
+
+@pytest.mark.asyncio
+async def test_resolver_forgets_address_after_failed_connect(monkeypatch):
+    """A failed connect forces a fresh lookup next time."""
+    lookups = []
+
+    async def getaddrinfo(host, port, type=0):
+        lookups.append(host)
+        return [(None, None, None, "", ("10.0.0.1", port))]
+
+    monkeypatch.setattr(asyncio.get_running_loop(), "getaddrinfo", getaddrinfo)
+    backend = CachingResolverBackend(RecordingBackend(fail=True), ttl_seconds=60)
+
+    for _ in range(2):
+        with pytest.raises(OSError):
+            await backend.connect_tcp("example.com", 80)
+
+    assert lookups == ["example.com", "example.com"]
+
+
+@pytest.mark.asyncio
+async def test_resolver_fails_over_to_other_addresses(monkeypatch):
+    """Every resolved address is tried before the connect fails."""
+    lookups = []
+
+    async def getaddrinfo(host, port, type=0):
+        lookups.append(host)
+        return [
+            (None, None, None, "", ("10.0.0.1", port)),
+            (None, None, None, "", ("10.0.0.2", port)),
+        ]
+
+    monkeypatch.setattr(asyncio.get_running_loop(), "getaddrinfo", getaddrinfo)
+    inner = RecordingBackend(failing_hosts={"10.0.0.1"})
+    backend = CachingResolverBackend(inner, ttl_seconds=60)
+
+    await backend.connect_tcp("example.com", 443)
+    await backend.connect_tcp("example.com", 443)
+
+    assert lookups == ["example.com"]
+    assert inner.hosts == ["10.0.0.1", "10.0.0.2", "10.0.0.1", "10.0.0.2"]
+
+
+@pytest.mark.asyncio
+async def test_caching_transport_serves_requests():
+    """Direct requests go through the DNS-caching transport end to end."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = "你好".encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    registry = HttpClientRegistry(
+        max_connections=10,
+        max_keepalive=5,
+        keepalive_expiry=5.0,
+        max_per_host=2,
+        http2=False,
+        dns_ttl=60.0,
+        timeout=5.0,
+    )
+    try:
+        response = await registry.client.get(f"http://localhost:{server.server_port}/")
+        assert response.status_code == 200
+        assert response.text == "你好"
+    finally:
+        await registry.close()
+        server.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_all_proxy_is_not_bypassed(monkeypatch):
+    """With ALL_PROXY set, requests go through the proxy, not the DNS cache."""
+    proxied = []
+
+    class Proxy(BaseHTTPRequestHandler):
+        def do_GET(self):
+            proxied.append(self.path)
+            body = b"proxied"
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Proxy)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    for name in ("HTTP_PROXY", "HTTPS_PROXY", "NO_PROXY", "http_proxy", "https_proxy", "no_proxy"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("ALL_PROXY", f"http://127.0.0.1:{server.server_port}")
+    registry = HttpClientRegistry(
+        max_connections=10,
+        max_keepalive=5,
+        keepalive_expiry=5.0,
+        max_per_host=2,
+        http2=False,
+        dns_ttl=60.0,
+        timeout=5.0,
+    )
+    try:
+        response = await registry.client.get("http://tenders.example.invalid/list")
+        assert response.text == "proxied"
+        assert proxied == ["http://tenders.example.invalid/list"]
+    finally:
+        await registry.close()
+        server.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_registry_shares_client_and_limits_hosts():
+    """One client is reused until closed; requests per host are capped."""
+    registry = HttpClientRegistry(
+        max_connections=10,
+        max_keepalive=5,
+        keepalive_expiry=5.0,
+        max_per_host=2,
+        http2=True,
+        dns_ttl=60.0,
+        timeout=5.0,
+    )
+    client = registry.client
+    assert registry.client is client
+
+    in_flight = 0
+    max_in_flight = 0
+
+    async def request() -> None:
+        nonlocal in_flight, max_in_flight
+        async with registry.host_slot("http://example.com/page"):
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+    await asyncio.gather(*(request() for _ in range(5)))
+    assert max_in_flight == 2
+
+    await registry.close()
+    assert client.is_closed
+    assert registry.client is not client
+    await registry.close()
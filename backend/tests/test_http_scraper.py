@@ -0,0 +1,366 @@
+"""Tests for HTTP scraper."""
+import asyncio
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+import pytest
+import httpx
+
+from app.services.scraper import http_scraper
+from app.services.scraper.base import ScrapedItem
+from app.services.scraper.http_cache import CachedPage, HttpValidatorCache
+from app.services.scraper.http_scraper import SimpleHttpScraper
+from app.services.scraper.parse_pool import ParsePool
+from app.services.scraper.parsers import SoupParser
+
+
+LIST_HTML = """
+<html><body><ul class="list">
+  <li><a href="/detail/1.html">项目1招标公告</a><span class="time">2024-12-01</span></li>
+  <li><a href="/detail/2.html">项目2招标公告</a><span class="time">2024-12-02</span></li>
+  <li><a href="/detail/3.html">项目3招标公告</a><span class="time">2024-12-03</span></li>
+</ul></body></html>
+"""
+
+CONFIG = {
+    "list_url": "http://example.com/list",
+    "list_selector": "ul.list > li",
+    "title_selector": "a",
+    "url_selector": "a",
+    "content_selector": "div.content",
+    "date_selector": "span.time",
+    "detail_concurrency": 2,
+}
+
+
+def make_scraper(handler, http_cache=None) -> SimpleHttpScraper:
+    """Create a scraper backed by a mock transport."""
+    scraper = SimpleHttpScraper(
+        source_name="测试网站",
+        base_url="http://example.com",
+        config=CONFIG,
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    scraper.http_cache = http_cache
+    return scraper
+
+
+@pytest.fixture
+def http_cache(tmp_path):
+    """Create an HTTP validator cache backed by a temporary SQLite file."""
+    cache = HttpValidatorCache(
+        path=str(tmp_path / "http_cache.sqlite3"),
+        ttl_seconds=3600,
+        max_entries=100,
+    )
+    yield cache
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_scrape_fetches_details_concurrently():
+    """Detail pages are fetched concurrently, bounded per host, in list order."""
+    in_flight = 0
+    max_in_flight = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, max_in_flight
+        if request.url.path == "/list":
+            return httpx.Response(200, text=LIST_HTML)
+
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        # Later items respond first to check ordering
+        await asyncio.sleep(0.03 - int(request.url.path[-6]) * 0.01)
+        in_flight -= 1
+        number = request.url.path[-6]
+        return httpx.Response(200, text=f"<div class='content'>内容{number}</div>")
+
+    scraper = make_scraper(handler)
+    try:
+        items = await scraper.scrape(limit=10)
+    finally:
+        await scraper.close()
+
+    assert [item.title for item in items] == ["项目1招标公告", "项目2招标公告", "项目3招标公告"]
+    assert [item.content for item in items] == ["内容1", "内容2", "内容3"]
+    assert items[0].url == "http://example.com/detail/1.html"
+    assert items[0].published_at is not None
+    assert max_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_scrape_isolates_detail_errors():
+    """A failing detail page only leaves that item's content empty."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/list":
+            return httpx.Response(200, text=LIST_HTML)
+        if request.url.path == "/detail/2.html":
+            return httpx.Response(500)
+        return httpx.Response(200, text="<div class='content'>内容</div>")
+
+    scraper = make_scraper(handler)
+    try:
+        items = await scraper.scrape(limit=10)
+    finally:
+        await scraper.close()
+
+    assert len(items) == 3
+    assert [item.content for item in items] == ["内容", "", "内容"]
+
+
+@pytest.mark.asyncio
+async def test_large_detail_pages_are_parsed_in_process_pool(monkeypatch):
+    """Detail bodies above the offload size are decoded and parsed by workers."""
+    pool = ParsePool(workers=1, offload_bytes=1024)
+    monkeypatch.setattr(http_scraper, "parse_pool", pool)
+    filler = "<p>说明</p>" * 500
+    detail_html = f"<html><body><div class='content'>内容{filler}</div></body></html>"
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/list":
+            return httpx.Response(200, text=LIST_HTML)
+        return httpx.Response(
+            200,
+            content=detail_html.encode("gbk"),
+            headers={"Content-Type": "text/html; charset=gbk"},
+        )
+
+    scraper = make_scraper(handler)
+    try:
+        items = await scraper.scrape(limit=1)
+        assert pool._executor is not None
+    finally:
+        await scraper.close()
+        await pool.close()
+
+    inline = SoupParser(CONFIG).parse_detail(detail_html)
+    assert items[0].content == inline[0]
+    assert items[0].content.startswith("内容\n说明")
+
+
+@pytest.mark.asyncio
+async def test_scrape_list_skips_detail_requests():
+    """The list phase only requests the list page; details are fetched on demand."""
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.path)
+        if request.url.path == "/list":
+            return httpx.Response(200, text=LIST_HTML)
+        return httpx.Response(200, text="<div class='content'>内容</div>")
+
+    scraper = make_scraper(handler)
+    try:
+        items = await scraper.scrape_list(limit=10)
+        assert requested == ["/list"]
+        assert all(item.content == "" for item in items)
+
+        fetched = [item async for item in scraper.iter_details(items[1:])]
+    finally:
+        await scraper.close()
+
+    assert [item.title for item in fetched] == ["项目2招标公告", "项目3招标公告"]
+    assert [item.content for item in fetched] == ["内容", "内容"]
+    assert "/detail/1.html" not in requested
+
+
+@pytest.mark.asyncio
+async def test_conditional_get_serves_cached_list_on_304(http_cache):
+    """A second run revalidates with the ETag and reuses the parsed list on 304."""
+    conditional_headers = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        conditional_headers.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, text=LIST_HTML, headers={"ETag": '"v1"'})
+
+    for _ in range(2):
+        scraper = make_scraper(handler, http_cache)
+        try:
+            items = await scraper.scrape_list(limit=10)
+        finally:
+            await scraper.close()
+        assert [item.title for item in items] == ["项目1招标公告", "项目2招标公告", "项目3招标公告"]
+        assert items[0].published_at is not None
+
+    assert conditional_headers == [None, '"v1"']
+    assert http_cache.stats() == {"not_modified": 1, "unchanged": 0, "changed": 1}
+
+
+@pytest.mark.asyncio
+async def test_unchanged_detail_body_is_not_reparsed(http_cache):
+    """Without validators, an identical body reuses the cached parse result."""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, text="<div class='content'>内容1</div>")
+
+    scraper = make_scraper(handler, http_cache)
+    try:
+        first = await scraper._fetch_detail("http://example.com/detail/1.html")
+        second = await scraper._fetch_detail("http://example.com/detail/1.html")
+    finally:
+        await scraper.close()
+
+    assert first == second == ("内容1", '<div class="content">内容1</div>')
+    assert http_cache.stats() == {"not_modified": 0, "unchanged": 1, "changed": 1}
+
+
+@pytest.mark.asyncio
+async def test_http_cache_concurrent_round_trips(http_cache):
+    """Concurrent reads and writes from worker threads keep payloads intact."""
+    pages = [
+        CachedPage(
+            url=f"http://example.com/detail/{i}.html",
+            fingerprint="f",
+            etag=None,
+            last_modified=None,
+            body_hash=str(i),
+            payload={"content": f"内容{i}" * 200},
+        )
+        for i in range(40)
+    ]
+
+    await asyncio.gather(*(http_cache.set(page) for page in pages))
+    cached = await asyncio.gather(*(http_cache.get(page.url) for page in pages))
+
+    assert cached == pages
+
+
+@pytest.mark.asyncio
+async def test_iter_details_bounds_prefetch():
+    """Detail fetches run at most detail_prefetch items ahead of the consumer."""
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.path)
+        return httpx.Response(200, text="<div class='content'>内容</div>")
+
+    scraper = make_scraper(handler)
+    scraper.config = {**CONFIG, "detail_prefetch": 2}
+    items = [
+        ScrapedItem(title=f"项目{i}", content="", url=f"http://example.com/detail/{i}.html")
+        for i in range(6)
+    ]
+    seen = []
+    try:
+        async for item in scraper.iter_details(items):
+            await asyncio.sleep(0.01)
+            seen.append(len(requested))
+    finally:
+        await scraper.close()
+
+    # After item N is yielded only fetches up to N + 2 have been started
+    assert seen == [2, 3, 4, 5, 6, 6]
+    assert [item.content for item in items] == ["内容"] * 6
+
+
+@pytest.mark.asyncio
+async def test_broken_parse_pool_is_shut_down_and_replaced():
+    """A broken pool is shut down and the page is parsed off the event loop."""
+
+    class BrokenExecutor:
+        shutdown_args = None
+
+        def submit(self, *args, **kwargs):
+            raise BrokenProcessPool("worker died")
+
+        def shutdown(self, wait=True, cancel_futures=False):
+            self.shutdown_args = (wait, cancel_futures)
+
+    pool = ParsePool(workers=1, offload_bytes=0)
+    broken = pool._executor = BrokenExecutor()
+    html = "<html><body><div class='content'>内容</div></body></html>"
+
+    content, _ = await pool.parse_detail(html.encode("utf-8"), "utf-8", CONFIG, "lxml")
+
+    assert content == "内容"
+    assert broken.shutdown_args == (False, True)
+    assert pool._executor is None
+
+
+def paged_list(page: int, next_href: str = None) -> str:
+    """List page with three entries numbered by page, optionally linking the next page."""
+    entries = "".join(
+        f'<li><a href="/detail/{page}{n}.html">项目{page}{n}</a>'
+        f'<span class="time">2024-12-{10 - page:02d}</span></li>'
+        for n in range(3)
+    )
+    link = f'<a class="next" href="{next_href}">下一页</a>' if next_href else ""
+    return f'<html><body><ul class="list">{entries}</ul>{link}</body></html>'
+
+
+def make_paged_scraper(handler, **config) -> SimpleHttpScraper:
+    """Create a paginating scraper backed by a mock transport."""
+    scraper = SimpleHttpScraper(
+        source_name="测试网站",
+        base_url="http://example.com",
+        config={**CONFIG, **config},
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    scraper.http_cache = None
+    return scraper
+
+
+@pytest.mark.asyncio
+async def test_scrape_list_follows_next_page_links():
+    """Pages are followed through the next link until the limit is reached."""
+    requested = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.path)
+        page = 1 if request.url.path == "/list" else int(request.url.path[-6])
+        return httpx.Response(200, text=paged_list(page, f"page{page + 1}.html"))
+
+    scraper = make_paged_scraper(handler, next_page_selector="a.next")
+    items = await scraper.scrape_list(limit=7)
+
+    assert requested == ["/list", "/page2.html", "/page3.html"]
+    assert len(items) == 7
+    assert items[-1].url == "http://example.com/detail/30.html"
+
+
+@pytest.mark.asyncio
+async def test_scrape_list_stops_at_known_page():
+    """Crawling stops after the first page whose entries are all stored."""
+    requested = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(str(request.url))
+        page = 1 if request.url.path == "/list" else int(request.url.path[-6])
+        return httpx.Response(200, text=paged_list(page))
+
+    async def known_urls(urls):
+        return {url for url in urls if "/detail/2" in url}
+
+    scraper = make_paged_scraper(
+        handler,
+        page_url_template="http://example.com/list/index_{page}.html",
+        page_start=2,
+    )
+    items = await scraper.scrape_list(limit=100, known_urls=known_urls)
+
+    assert requested == [
+        "http://example.com/list",
+        "http://example.com/list/index_2.html",
+    ]
+    assert len(items) == 6
+
+
+@pytest.mark.asyncio
+async def test_scrape_list_stops_before_high_water_mark():
+    """Pages made only of items older than the high-water mark end the crawl."""
+    requested = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.path)
+        page = 1 if request.url.path == "/list" else int(request.url.path[-6])
+        return httpx.Response(200, text=paged_list(page, f"page{page + 1}.html"))
+
+    scraper = make_paged_scraper(handler, next_page_selector="a.next", max_pages=5)
+    # Page 2 is dated 2024-12-08, before the mark
+    items = await scraper.scrape_list(limit=100, since=datetime(2024, 12, 9))
+
+    assert requested == ["/list", "/page2.html"]
+    assert len(items) == 6
@@ -0,0 +1,101 @@
+"""Tests for per-source incremental state."""
+import base64
+from datetime import datetime
+
+import pytest
+
+from app.services.incremental import BloomFilter, IncrementalState
+from app.services.scraper.base import ScrapedItem
+
+
+def make_item(n: int, published_at=None, original_id=None) -> ScrapedItem:
+    """Build a list item."""
+    return ScrapedItem(
+        title=f"项目{n}",
+        content="",
+        url=f"https://example.com/{n}",
+        original_id=original_id,
+        published_at=published_at,
+    )
+
+
+def test_bloom_filter_membership_and_serialization():
+    """Added values are found, also after a base64 round trip."""
+    bloom = BloomFilter(capacity=100, error_rate=0.01)
+    for n in range(100):
+        bloom.add(f"https://example.com/{n}")
+
+    restored = BloomFilter(100, 0.01, base64.b64decode(bloom.to_base64()))
+    assert all(f"https://example.com/{n}" in restored for n in range(100))
+
+    false_positives = sum(f"https://example.org/{n}" in bloom for n in range(1000))
+    assert false_positives < 50
+
+
+@pytest.mark.asyncio
+async def test_known_urls_always_confirms_in_database():
+    """Filter misses and hits both go to the database; fully seen pages skip it."""
+    lookups = []
+    stored = {"https://example.com/1", "https://example.com/9"}
+
+    async def lookup(urls):
+        lookups.append(list(urls))
+        return stored & set(urls)
+
+    state = IncrementalState(bloom_capacity=100, bloom_error_rate=0.001)
+    state.remember(["https://example.com/1", "https://example.com/2"])
+    restored = IncrementalState(state.to_dict(), bloom_capacity=100, bloom_error_rate=0.001)
+
+    # example.com/9 was stored by a run whose state was overwritten
+    urls = ["https://example.com/1", "https://example.com/9"]
+    assert await restored.known_urls(urls, lookup) == stored
+    assert lookups == [urls]
+
+    page = ["https://example.com/1", "https://example.com/2"]
+    assert await restored.page_known_urls(page, lookup) == set(page)
+    assert await restored.page_known_urls(urls, lookup) == stored
+    assert lookups == [urls, urls]
+
+
+def test_filter_rotates_generations():
+    """The oldest generation is dropped once the current one fills up."""
+    state = IncrementalState(bloom_capacity=2, bloom_error_rate=0.001)
+    state.remember(f"https://example.com/{n}" for n in range(5))
+
+    assert state.might_contain("https://example.com/4")
+    assert state.might_contain("https://example.com/3")
+    assert not state.might_contain("https://example.com/0")
+
+
+def test_advance_tracks_newest_item():
+    """The high-water mark and latest ID follow the newest stored item."""
+    state = IncrementalState({"high_water_mark": "2024-12-01T00:00:00"})
+    state.advance([
+        make_item(1, datetime(2024, 12, 3), "A3"),
+        make_item(2, datetime(2024, 12, 5), "A5"),
+        make_item(3, datetime(2024, 11, 1), "A1"),
+    ])
+
+    assert state.high_water_mark == datetime(2024, 12, 5)
+    assert state.latest_original_id == "A5"
+
+    state.advance([make_item(4, datetime(2024, 12, 4), "A4")])
+    assert state.high_water_mark == datetime(2024, 12, 5)
+    assert state.latest_original_id == "A5"
+
+
+def test_advance_stops_below_missing_items():
+    """Failed items and listings cut short by the limit hold the mark back."""
+    state = IncrementalState({"high_water_mark": "2024-12-01T00:00:00"})
+    stored = [make_item(1, datetime(2024, 12, 5), "A5"), make_item(3, datetime(2024, 12, 2), "A2")]
+
+    state.advance(stored, complete=False)
+    assert state.high_water_mark == datetime(2024, 12, 1)
+
+    state.advance(stored, pending=[make_item(2, datetime(2024, 12, 3), "A3")])
+    assert state.high_water_mark == datetime(2024, 12, 2)
+    assert state.latest_original_id == "A2"
+
+    fresh = IncrementalState({"high_water_mark": "2024-12-01T00:00:00"})
+    assert not fresh.reached_mark(stored)
+    assert fresh.reached_mark(stored + [make_item(4, datetime(2024, 11, 30), "A0")])
@@ -0,0 +1,167 @@
+"""Tests for the background job manager."""
+import asyncio
+import pytest
+
+from app.services import jobs
+from app.services.jobs import JOB_FAILED, JOB_REFILTER, JOB_SUCCEEDED, JobManager
+
+
+@pytest.fixture
+def fake_task(monkeypatch):
+    """Replace run_source_task with a controllable fake."""
+    release = asyncio.Event()
+    calls = []
+
+    async def run_source_task(db, source_id, limit=10, progress=None):
+        calls.append(source_id)
+        progress.scraped = limit
+        await release.wait()
+        if source_id == 99:
+            raise ValueError("Source config 99 not found")
+        progress.processed = limit
+        return {"source_name": f"源{source_id}", **progress.to_dict()}
+
+    monkeypatch.setattr(jobs.task_service, "run_source_task", run_source_task)
+    return release, calls
+
+
+class TestJobManager:
+    """Test cases for JobManager."""
+
+    @pytest.mark.asyncio
+    async def test_submit_returns_immediately(self, fake_task):
+        """Jobs run in the background and report progress."""
+        release, calls = fake_task
+        manager = JobManager(max_workers=2, retention=10, timeout=5)
+
+        job = manager.submit(1, "源1", limit=5)
+        while not calls:
+            await asyncio.sleep(0.001)
+        assert job.to_dict()["status"] == "running"
+        assert job.to_dict()["scraped"] == 5
+
+        release.set()
+        await manager.wait(job)
+
+        status = job.to_dict()
+        assert status["status"] == JOB_SUCCEEDED
+        assert status["processed"] == 5
+        assert status["result"]["source_name"] == "源1"
+        assert status["duration_seconds"] is not None
+        assert manager.get(job.id) is job
+
+    @pytest.mark.asyncio
+    async def test_submit_joins_active_job(self, fake_task):
+        """A second submit for the same source joins the running job."""
+        release, calls = fake_task
+        manager = JobManager(max_workers=2, retention=10, timeout=5)
+
+        first = manager.submit(1, "源1", limit=5)
+        second = manager.submit(1, "源1", limit=5)
+        other = manager.submit(2, "源2", limit=5)
+        assert second is first
+        assert other is not first
+
+        release.set()
+        await manager.wait(first)
+        await manager.wait(other)
+        assert sorted(calls) == [1, 2]
+
+        third = manager.submit(1, "源1", limit=5)
+        assert third is not first
+        await manager.wait(third)
+
+    @pytest.mark.asyncio
+    async def test_failed_job(self, fake_task):
+        """Errors are recorded on the job."""
+        release, calls = fake_task
+        release.set()
+        manager = JobManager(max_workers=1, retention=10, timeout=5)
+
+        job = await manager.wait(manager.submit(99, "源99", limit=1))
+
+        assert job.status == JOB_FAILED
+        assert "not found" in job.error
+
+    @pytest.mark.asyncio
+    async def test_max_workers_caps_running_jobs(self, monkeypatch):
+        """At most max_workers source jobs run at once; the rest wait their turn."""
+        running = 0
+        peak = 0
+
+        async def run_source_task(db, source_id, limit=10, progress=None):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return {"source_name": f"源{source_id}"}
+
+        monkeypatch.setattr(jobs.task_service, "run_source_task", run_source_task)
+        manager = JobManager(max_workers=2, retention=10, timeout=5)
+
+        submitted = [manager.submit(source_id, f"源{source_id}", limit=1) for source_id in range(5)]
+        for job in submitted:
+            await manager.wait(job)
+
+        assert peak == 2
+        assert all(job.status == JOB_SUCCEEDED for job in submitted)
+
+    @pytest.mark.asyncio
+    async def test_timeout_fails_job_and_frees_slot(self, fake_task):
+        """A job past the timeout fails and the next source gets its slot."""
+        release, calls = fake_task
+        manager = JobManager(max_workers=1, retention=10, timeout=0.05)
+
+        slow = manager.submit(1, "源1", limit=1)
+        queued = manager.submit(2, "源2", limit=1)
+        await manager.wait(slow)
+
+        assert slow.status == JOB_FAILED
+        assert slow.error == "Timed out after 0.05s"
+
+        release.set()
+        await manager.wait(queued)
+        assert queued.status == JOB_SUCCEEDED
+        assert calls == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_retention(self, fake_task):
+        """Finished jobs beyond the retention limit are dropped."""
+        release, calls = fake_task
+        release.set()
+        manager = JobManager(max_workers=1, retention=2, timeout=5)
+
+        for source_id in range(1, 5):
+            await manager.wait(manager.submit(source_id, f"源{source_id}", limit=1))
+
+        assert len(manager.jobs) <= 3
+        assert [job.source_id for job in manager.list()][0] == 4
+
+    @pytest.mark.asyncio
+    async def test_refilter_job(self, fake_task, monkeypatch):
+        """Re-filters run as their own job kind next to scrape jobs."""
+        release, calls = fake_task
+
+        async def run_refilter(db, source_id, progress=None):
+            progress.scanned = 7
+            await release.wait()
+            return {"source_id": source_id, **progress.to_dict()}
+
+        monkeypatch.setattr(jobs.refilter_service, "run_refilter", run_refilter)
+        manager = JobManager(max_workers=2, retention=10, timeout=5)
+
+        scrape = manager.submit(1, "源1", limit=5)
+        refilter = manager.submit_refilter(1, "源1")
+        assert refilter is not scrape
+        assert manager.submit_refilter(1, "源1") is refilter
+
+        release.set()
+        await manager.wait(refilter)
+        await manager.wait(scrape)
+
+        status = refilter.to_dict()
+        assert status["kind"] == JOB_REFILTER
+        assert status["status"] == JOB_SUCCEEDED
+        assert status["scanned"] == 7
+        assert status["result"]["source_id"] == 1
@@ -85,3 +85,16 @@ async def test_query_tenders(test_db):
     tenders = result.scalars().all()
     assert len(tenders) == 1
     assert tenders[0].title == "项目1"
+
+
+@pytest.mark.asyncio
+async def test_tender_source_url_unique(test_db):
+    """Test that (source_name, source_url) is unique."""
+    from sqlalchemy.exc import IntegrityError
+
+    test_db.add_all([
+        Tender(source_name="源1", source_url="https://example.com/1", title="项目", content="内容"),
+        Tender(source_name="源1", source_url="https://example.com/1", title="项目", content="内容"),
+    ])
+    with pytest.raises(IntegrityError):
+        await test_db.commit()
@@ -0,0 +1,54 @@
+"""Tests for keyset pagination."""
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+
+from app.models.tender import Tender
+from app.services.pagination import decode_cursor, encode_cursor, paginate_by_created_at
+
+
+def test_cursor_round_trip():
+    """Cursors decode to the position they were built from."""
+    created_at = datetime(2026, 10, 17, 9, 30, 15, 123456)
+    assert decode_cursor(encode_cursor(created_at, 42)) == (created_at, 42)
+
+
+def test_decode_invalid_cursor():
+    """Malformed cursors raise ValueError."""
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+
+
+@pytest.mark.asyncio
+async def test_paginate_walks_all_rows(test_db):
+    """Following cursors visits every row once, newest first, ties broken by id."""
+    base = datetime(2026, 1, 1)
+    # Pairs of rows share a timestamp to exercise the id tie-breaker
+    test_db.add_all([
+        Tender(
+            source_name="源",
+            source_url=f"https://example.com/{i}",
+            title=f"项目{i}",
+            content="内容",
+            created_at=base + timedelta(minutes=i // 2),
+        )
+        for i in range(7)
+    ])
+    await test_db.commit()
+
+    seen = []
+    cursor = None
+    while True:
+        result = await test_db.execute(paginate_by_created_at(select(Tender), 3, cursor))
+        page = result.scalars().all()
+        seen.extend(tender.id for tender in page)
+        if len(page) < 3:
+            break
+        cursor = encode_cursor(page[-1].created_at, page[-1].id)
+
+    result = await test_db.execute(
+        select(Tender.id).order_by(Tender.created_at.desc(), Tender.id.desc())
+    )
+    assert seen == list(result.scalars().all())
+    assert len(seen) == 7
@@ -0,0 +1,104 @@
+"""Tests for HTML parser backends."""
+import pytest
+
+from app.services.scraper.parsers import LxmlParser, SoupParser, get_parser
+
+
+LIST_HTML = """<?xml version="1.0" encoding="utf-8"?>
+<html><head><style>.time { color: red }</style></head><body>
+<ul class="list">
+  <li><a href="/detail/1.html">项目1 <b>招标</b>公告<!-- 注释 --></a>
+      <span class="time">
+        2024-12-01
+      </span></li>
+  <li><a href="detail/2.html">项目2&nbsp;招标公告<script>var x = 1;</script></a></li>
+  <li><a>缺少链接</a><span class="time">2024-12-03</span></li>
+  <li class="ad"><span>广告</span></li>
+  <li><div class="title"><a href="http://other.com/4">项目4<br>变更公告</a></div>
+      <em class="time">2024-12-04</em></li>
+</ul>
+<div class="pager"><a class="next" href="?page=2">下一页</a></div>
+</body></html>
+"""
+
+DETAIL_HTML = """
+<html><body>
+<div class="header">网站导航</div>
+<div class="content article">
+  <h1>项目1招标公告</h1>
+  <!-- 编辑: 张三 -->
+  <p>预算金额：<strong>100万元</strong>。</p>
+  <script>track();</script>
+  <table><tr><td>联系人</td><td>李四</td></tr></table>
+  <p>  </p>
+  <ruby>标<rt>biao</rt></ruby>
+</div>
+</body></html>
+"""
+
+CONFIG = {
+    "list_selector": "ul.list > li",
+    "title_selector": "a",
+    "url_selector": "a",
+    "date_selector": "span.time, em.time",
+    "content_selector": "div.content",
+    "next_page_selector": "div.pager a.next",
+}
+
+
+@pytest.mark.parametrize("config", [
+    CONFIG,
+    {**CONFIG, "title_selector": "div.title a, a", "content_selector": "div.missing"},
+    {**CONFIG, "content_selector": "body > div:nth-of-type(2) p"},
+])
+def test_lxml_matches_beautifulsoup(config):
+    """lxml backend extracts the same fields as BeautifulSoup."""
+    lxml_parser, soup_parser = LxmlParser(config), SoupParser(config)
+
+    assert lxml_parser.parse_list(LIST_HTML) == soup_parser.parse_list(LIST_HTML)
+    assert lxml_parser.parse_detail(DETAIL_HTML)[0] == soup_parser.parse_detail(DETAIL_HTML)[0]
+
+
+def test_item_selectors_only_match_descendants():
+    """Every branch of a comma-separated item selector is scoped to the item."""
+    html = """<html><body>
+    <div class="item"><div class="item"><a href="/1">内层公告</a></div></div>
+    </body></html>"""
+    config = {**CONFIG, "list_selector": "div.item", "title_selector": "span, div.item"}
+
+    entries, _ = LxmlParser(config).parse_list(html)
+    assert entries == SoupParser(config).parse_list(html)[0]
+    assert [entry.title for entry in entries] == ["内层公告"]
+
+
+def test_lxml_list_fields():
+    """List entries keep page order and skip items without a link."""
+    entries, next_href = LxmlParser(CONFIG).parse_list(LIST_HTML)
+
+    assert [entry.href for entry in entries] == [
+        "/detail/1.html", "detail/2.html", "http://other.com/4"
+    ]
+    assert entries[0].title == "项目1招标公告"
+    assert entries[0].date_text == "2024-12-01"
+    assert entries[1].date_text is None
+    assert next_href == "?page=2"
+
+    content, raw_html = LxmlParser(CONFIG).parse_detail(DETAIL_HTML)
+    assert content.splitlines()[:3] == ["项目1招标公告", "预算金额：", "100万元"]
+    assert "track()" not in content
+    assert raw_html.startswith('<div class="content article">')
+
+
+def test_get_parser_compiles_once_and_falls_back():
+    """Parsers are cached per config; unsupported selectors fall back to bs4."""
+    parser = get_parser(dict(CONFIG), "lxml")
+    assert isinstance(parser, LxmlParser)
+    assert get_parser(dict(CONFIG), "lxml") is parser
+    assert isinstance(get_parser(CONFIG, "bs4"), SoupParser)
+
+    # :contains() is a soupsieve extension cssselect cannot compile
+    fallback = get_parser({**CONFIG, "title_selector": "a:-soup-contains('公告')"}, "lxml")
+    assert isinstance(fallback, SoupParser)
+
+    with pytest.raises(ValueError):
+        get_parser(CONFIG, "selectolax")
@@ -0,0 +1,107 @@
+"""Tests for the streaming task pipeline."""
+import asyncio
+import pytest
+
+from app.services.pipeline import Pipeline, Stage
+
+
+async def numbers(count: int):
+    """Async source yielding 0..count-1."""
+    for i in range(count):
+        await asyncio.sleep(0)
+        yield i
+
+
+@pytest.mark.asyncio
+async def test_pipeline_runs_all_stages():
+    """Items flow through every stage; None drops an item."""
+    persisted = []
+
+    async def keep_even(n):
+        return n if n % 2 == 0 else None
+
+    async def double(n):
+        await asyncio.sleep(0.001)
+        return n * 2
+
+    async def persist(n):
+        persisted.append(n)
+        return n
+
+    pipeline = Pipeline(
+        stages=[
+            Stage("filter", keep_even, queue_size=2),
+            Stage("extract", double, workers=3, queue_size=2),
+            Stage("persist", persist, queue_size=2),
+        ],
+        source_name="scrape",
+    )
+    await pipeline.run(numbers(10))
+
+    assert sorted(persisted) == [0, 4, 8, 12, 16]
+    summary = pipeline.summary()
+    assert list(summary) == ["scrape", "filter", "extract", "persist"]
+    assert summary["scrape"]["out"] == 10
+    assert summary["filter"]["in"] == 10
+    assert summary["filter"]["out"] == 5
+    assert summary["extract"]["workers"] == 3
+    assert summary["persist"]["in"] == 5
+
+
+@pytest.mark.asyncio
+async def test_pipeline_isolates_handler_errors():
+    """A failing item is counted and dropped without stopping the run."""
+    persisted = []
+
+    async def fail_on_three(n):
+        if n == 3:
+            raise RuntimeError("boom")
+        return n
+
+    async def persist(n):
+        persisted.append(n)
+        return n
+
+    pipeline = Pipeline(stages=[Stage("filter", fail_on_three), Stage("persist", persist)])
+    await pipeline.run(numbers(5))
+
+    assert persisted == [0, 1, 2, 4]
+    assert pipeline.summary()["filter"]["errors"] == 1
+
+
+@pytest.mark.asyncio
+async def test_pipeline_propagates_source_errors():
+    """Errors from the item source abort the run."""
+
+    async def broken_source():
+        yield 1
+        raise ConnectionError("list page unavailable")
+
+    async def passthrough(n):
+        return n
+
+    pipeline = Pipeline(stages=[Stage("filter", passthrough)])
+    with pytest.raises(ConnectionError):
+        await pipeline.run(broken_source())
+
+
+@pytest.mark.asyncio
+async def test_pipeline_batches_queued_items():
+    """Batch stages receive queued items together and never exceed batch_size."""
+    batches = []
+
+    async def slow_source():
+        for i in range(7):
+            yield i
+
+    async def collect(items):
+        batches.append(list(items))
+        await asyncio.sleep(0.001)
+        return items
+
+    pipeline = Pipeline(stages=[Stage("dedup", collect, batch_size=3, queue_size=10)])
+    await pipeline.run(slow_source())
+
+    assert sorted(n for batch in batches for n in batch) == list(range(7))
+    assert all(len(batch) <= 3 for batch in batches)
+    assert pipeline.summary()["dedup"]["out"] == 7
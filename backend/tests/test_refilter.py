@@ -0,0 +1,91 @@
+"""Tests for batch filtering and re-filtering stored tenders."""
+import pytest
+from sqlalchemy import select
+
+from app.models.tender import SourceConfig, Tender
+from app.services.filter import filter_service
+from app.services.refilter import RefilterProgress, RefilterService
+
+
+RULES = {
+    "exclude_keywords": ["废标"],
+    "include_keywords": ["软件", "系统"],
+    "min_budget": 100000,
+    "max_budget": 5000000,
+}
+
+
+def test_apply_filters_batch_matches_single_item_filters():
+    """Batch results equal keyword filters followed by budget filters per item."""
+    titles = ["软件采购", "系统集成废标公告", "家具采购", "软件开发", "软件运维", "系统升级"]
+    contents = ["", "", "桌椅", "", "", ""]
+    budgets = [200000.0, 200000.0, None, 50000.0, 9000000.0, None]
+
+    expected = []
+    for title, content, budget in zip(titles, contents, budgets):
+        result = filter_service.apply_filters(title, content, RULES)
+        if not result[0]:
+            result = filter_service.apply_budget_filters(budget, RULES)
+        expected.append(result)
+
+    assert filter_service.apply_filters_batch(titles, contents, budgets, RULES) == expected
+    assert [r[0] for r in expected] == [False, True, True, True, True, False]
+    assert filter_service.apply_filters_batch(titles, contents, budgets, None) == (
+        [(False, None)] * len(titles)
+    )
+
+
+@pytest.mark.asyncio
+async def test_refilter_source_updates_changed_rows(test_db):
+    """Stored tenders are re-evaluated in chunks and only changed rows are written."""
+    source = SourceConfig(name="源1", url="https://example.com", scraper_type="http")
+    test_db.add(source)
+    rows = [
+        ("软件采购", 200000, False, None),
+        ("家具采购", None, False, None),
+        ("系统废标公告", None, True, "Contains excluded keyword: 废标"),
+        ("软件维护", 1000, False, None),
+        ("系统集成", None, True, "Old rule"),
+    ]
+    for n, (title, budget, is_filtered, reason) in enumerate(rows):
+        test_db.add(Tender(
+            source_name="源1",
+            source_url=f"https://example.com/{n}",
+            title=title,
+            content="",
+            budget_amount=budget,
+            is_filtered=is_filtered,
+            filter_reason=reason,
+            extracted_data={"budget_amount": budget} if budget is not None else None,
+        ))
+    test_db.add(Tender(
+        source_name="源2", source_url="https://example.com/x", title="家具", content=""
+    ))
+    await test_db.commit()
+
+    source.filter_rules = RULES
+    await test_db.commit()
+
+    progress = RefilterProgress()
+    result = await RefilterService(chunk_size=2).run_refilter(test_db, source.id, progress)
+
+    # 系统集成 was rejected before extraction and is now kept without extracted data
+    assert result == {
+        "source_id": source.id, "scanned": 5, "updated": 3, "filtered": 3, "unextracted": 1
+    }
+    assert progress.to_dict() == {"scanned": 5, "updated": 3, "filtered": 3, "unextracted": 1}
+    tenders = (
+        await test_db.execute(
+            select(Tender.title, Tender.is_filtered, Tender.filter_reason).order_by(Tender.id)
+        )
+    ).all()
+    assert [(t.title, t.is_filtered) for t in tenders] == [
+        ("软件采购", False),
+        ("家具采购", True),
+        ("系统废标公告", True),
+        ("软件维护", True),
+        ("系统集成", False),
+        ("家具", False),
+    ]
+    assert tenders[3].filter_reason == "Budget 1000.0 below minimum 100000"
+    assert tenders[4].filter_reason is None
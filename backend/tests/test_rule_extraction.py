@@ -0,0 +1,125 @@
+"""Tests for the rule extraction tier."""
+from datetime import datetime
+
+import pytest
+
+from app.schemas.tender import TenderExtractModel
+from app.services.ai.extraction import ExtractionService
+from app.services.ai.rules import CONFLICTING, LABELED, UNLABELED, RuleExtractor
+
+
+CCGP_CONTENT = """一、项目基本情况
+项目名称：某市政府办公设备采购项目
+预算金额：
+150.5 万元（人民币）
+提交投标文件截止时间：2024年12月25日 09点30分（北京时间）
+开标时间：2024年12月25日 09点30分（北京时间）
+二、对本次招标提出询问，请按以下方式联系
+1.采购人信息
+名称：某市政府
+联系方式：010-12345678
+2.项目联系方式
+项目联系人：张三
+电话：13812345678
+邮箱：zhangsan@example.com
+项目地点：北京市朝阳区；"""
+
+
+def test_rules_read_labeled_fields():
+    """Labeled fields are parsed and normalized with high confidence."""
+    result = RuleExtractor().extract("办公设备采购公告", CCGP_CONTENT)
+
+    assert result.values == {
+        "project_name": "某市政府办公设备采购项目",
+        "budget_amount": 1505000.0,
+        "deadline": datetime(2024, 12, 25, 9, 30),
+        "location": "北京市朝阳区",
+        "contact_person": "张三",
+        "contact_phone": "13812345678",
+        "contact_email": "zhangsan@example.com",
+    }
+    assert set(result.confidence.values()) == {LABELED}
+
+
+@pytest.mark.parametrize("text, amount", [
+    ("预算金额：50万元", 500000.0),
+    ("预算金额（万元）：12.5", 125000.0),
+    ("采购预算：人民币1,234,567.89元", 1234567.89),
+    ("最高限价：￥800000", 800000.0),
+    ("项目预算：1.2亿元", 120000000.0),
+])
+def test_budget_units_are_normalized(text, amount):
+    """万元/亿元 amounts are converted to yuan."""
+    assert RuleExtractor().extract("公告", text).values["budget_amount"] == amount
+
+
+@pytest.mark.parametrize("text, amount, confidence", [
+    ("预算金额：第1包 50万元", 500000.0, CONFLICTING),
+    ("预算金额：第一包50万元，第二包30万元", 500000.0, CONFLICTING),
+    ("采购预算：详见附件2", None, None),
+    ("项目预算：2024年财政资金 120万元", 1200000.0, LABELED),
+    ("预算金额：见招标文件第3章", None, None),
+])
+def test_budget_ignores_lot_year_and_attachment_numbers(text, amount, confidence):
+    """Only a number that is clearly the amount is read; lot lines are unsure."""
+    result = RuleExtractor().extract("公告", text)
+    assert result.values.get("budget_amount") == amount
+    assert result.confidence.get("budget_amount") == confidence
+
+
+def test_contact_name_stops_at_next_label():
+    """Names end at the next label; office names get low confidence."""
+    result = RuleExtractor().extract("公告", "联系人：张先生电话：13912345678")
+    assert result.values["contact_person"] == "张先生"
+    assert result.values["contact_phone"] == "13912345678"
+    assert result.confidence["contact_person"] == LABELED
+
+    result = RuleExtractor().extract("公告", "联系人：采购中心\n电话：010-12345678")
+    assert result.values["contact_person"] == "采购中心"
+    assert result.confidence["contact_person"] == UNLABELED
+
+
+def test_disagreeing_or_unlabeled_values_have_low_confidence():
+    """Several package budgets or a bare phone number defer to the model."""
+    result = RuleExtractor().extract(
+        "公告", "包1预算金额：50万元\n包2预算金额：30万元\n咨询请致电 0571-88886666"
+    )
+
+    assert result.values["budget_amount"] == 500000.0
+    assert result.missing(["budget_amount", "contact_phone"], 0.8) == [
+        "budget_amount", "contact_phone"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_model_is_skipped_when_rules_find_required_fields(monkeypatch):
+    """Templated notices are answered by rules; others merge with the model."""
+    service = ExtractionService()
+    service.cache = None
+    calls = []
+
+    async def fake_model(title, content):
+        calls.append(title)
+        return TenderExtractModel(
+            project_name="模型项目名", budget_amount=1.0, contact_phone="021-55556666"
+        )
+
+    monkeypatch.setattr(service, "_extract", fake_model)
+
+    extracted = await service.extract("办公设备采购公告", CCGP_CONTENT)
+    assert calls == []
+    assert extracted.budget_amount == 1505000.0
+    assert extracted.contact_email == "zhangsan@example.com"
+
+    # No labeled deadline or phone: the model fills them, rule values are kept
+    extracted = await service.extract("公告", "项目名称：服务器采购\n预算金额：20万元")
+    assert calls == ["公告"]
+    assert extracted.project_name == "服务器采购"
+    assert extracted.budget_amount == 200000.0
+    assert extracted.contact_phone == "021-55556666"
+
+    stats = service.stats()
+    assert stats["items"] == 2
+    assert stats["rules_only"] == 1
+    assert stats["model_calls"] == 1
+    assert stats["rule_field_rates"]["budget_amount"] == 1.0
@@ -0,0 +1,101 @@
+"""Tests for the cron scheduler."""
+import asyncio
+from datetime import datetime, timedelta, timezone
+import pytest
+
+from app.services.scheduler import CronScheduler
+
+
+def make_scheduler(schedules, runner):
+    """Create a scheduler with in-memory schedules and no jitter."""
+
+    async def loader():
+        return dict(schedules)
+
+    return CronScheduler(runner=runner, loader=loader, refresh_seconds=3600)
+
+
+T0 = datetime(2026, 1, 1, 8, 0, 30, tzinfo=timezone.utc)
+
+
+class TestCronScheduler:
+    """Test cases for CronScheduler."""
+
+    @pytest.mark.asyncio
+    async def test_fires_when_due(self):
+        """A source runs once its cron time has passed."""
+        runs = []
+
+        async def runner(source_id):
+            runs.append(source_id)
+
+        scheduler = make_scheduler({1: "*/5 * * * *", 2: "0 9 * * *"}, runner)
+        await scheduler.tick(T0)
+        assert scheduler.entries[1].next_run == T0.replace(minute=5, second=0)
+        assert runs == []
+
+        await scheduler.tick(T0 + timedelta(minutes=5))
+        await asyncio.sleep(0)
+        assert runs == [1]
+
+    @pytest.mark.asyncio
+    async def test_coalesces_missed_runs(self):
+        """Several missed fire times produce a single run."""
+        runs = []
+
+        async def runner(source_id):
+            runs.append(source_id)
+
+        scheduler = make_scheduler({1: "*/5 * * * *"}, runner)
+        await scheduler.tick(T0)
+
+        late = T0 + timedelta(minutes=31)
+        await scheduler.tick(late)
+        await asyncio.sleep(0)
+
+        assert runs == [1]
+        assert scheduler.entries[1].next_run == datetime(2026, 1, 1, 8, 35, tzinfo=timezone.utc)
+
+    @pytest.mark.asyncio
+    async def test_one_run_in_flight_per_source(self):
+        """A due run is skipped while the previous one is still running."""
+        started = []
+        release = asyncio.Event()
+
+        async def runner(source_id):
+            started.append(source_id)
+            await release.wait()
+
+        scheduler = make_scheduler({1: "* * * * *"}, runner)
+        await scheduler.tick(T0)
+
+        await scheduler.tick(T0 + timedelta(minutes=1))
+        await asyncio.sleep(0)
+        await scheduler.tick(T0 + timedelta(minutes=2))
+        await asyncio.sleep(0)
+        assert started == [1]
+
+        release.set()
+        await asyncio.sleep(0.01)
+        assert 1 not in scheduler.running
+
+        await scheduler.tick(T0 + timedelta(minutes=3))
+        await asyncio.sleep(0)
+        assert started == [1, 1]
+        await scheduler.stop()
+
+    @pytest.mark.asyncio
+    async def test_refresh_drops_invalid_and_removed(self):
+        """Invalid expressions and inactive sources are not scheduled."""
+        schedules = {1: "*/5 * * * *", 2: "not a cron"}
+
+        async def runner(source_id):
+            pass
+
+        scheduler = make_scheduler(schedules, runner)
+        await scheduler.refresh(T0)
+        assert set(scheduler.entries) == {1}
+
+        schedules.pop(1)
+        await scheduler.refresh(T0)
+        assert scheduler.entries == {}
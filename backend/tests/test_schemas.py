@@ -1,7 +1,7 @@
 """Tests for TenderExtractModel."""
 import pytest
 from datetime import datetime
-from app.schemas.tender import TenderExtractModel
+from app.schemas.tender import TenderExtractModel, TenderResponse, TenderSummaryResponse
 
 
 class TestTenderExtractModel:
@@ -73,3 +73,13 @@ class TestTenderExtractModel:
         # Valid budget
         model = TenderExtractModel(budget_amount=0)
         assert model.budget_amount == 0
+
+
+class TestTenderSummaryResponse:
+    """Tests for the tender list schema."""
+
+    def test_summary_omits_text_fields(self):
+        """List items never carry the announcement text or raw HTML."""
+        assert "content" not in TenderSummaryResponse.model_fields
+        assert "raw_html" not in TenderSummaryResponse.model_fields
+        assert "content" in TenderResponse.model_fields
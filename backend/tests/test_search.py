@@ -0,0 +1,92 @@
+"""Tests for keyword search on GET /tenders."""
+import httpx
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.database import Base, get_db
+from app.main import app
+from app.models.tender import Tender
+from app.services.search import keyword_condition, keyword_rank
+
+from tests.conftest import TEST_DATABASE_URL
+
+
+def word_similarity(keyword: str, text: str) -> float:
+    """Stand-in for pg_trgm word_similarity: share of keyword characters found in text."""
+    if not keyword or not text:
+        return 0.0
+    return sum(char in text for char in keyword) / len(keyword)
+
+
+@pytest.fixture
+async def client():
+    """API client on an in-memory database with the pg_trgm functions registered."""
+    engine = create_async_engine(TEST_DATABASE_URL, echo=False)
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def register_functions(dbapi_connection, connection_record):
+        dbapi_connection.create_function("word_similarity", 2, word_similarity)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with session_factory() as session:
+        session.add_all([
+            Tender(source_name="源", source_url="u1", title="办公家具采购", content="桌椅"),
+            Tender(source_name="源", source_url="u2", title="维护服务", content="含软件系统维护"),
+            Tender(source_name="源", source_url="u3", title="软件系统开发", content="软件系统"),
+            Tender(source_name="源", source_url="u4", title="SOFTWARE license", content=""),
+        ])
+        await session.commit()
+
+    async def override_get_db():
+        async with session_factory() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+    app.dependency_overrides.pop(get_db, None)
+    await engine.dispose()
+
+
+def test_keyword_condition_compiles_to_ilike():
+    """PostgreSQL gets ILIKE on title and content, which the trigram indexes serve."""
+    sql = str(
+        select(Tender.id)
+        .where(keyword_condition("软件"))
+        .order_by(keyword_rank("软件"))
+        .compile(dialect=postgresql.dialect())
+    )
+
+    assert "tenders.title ILIKE %(title_1)s" in sql
+    assert "tenders.content ILIKE %(content_1)s" in sql
+    assert "word_similarity(%(word_similarity_2)s, tenders.title)" in sql
+    assert "substr(tenders.content, %(substr_1)s, %(substr_2)s)" in sql
+
+
+@pytest.mark.asyncio
+async def test_keyword_matches_title_or_content(client):
+    """Keyword search returns tenders matching in either column, case-insensitively."""
+    response = await client.get("/api/v1/tenders", params={"keyword": "软件"})
+    assert response.status_code == 200
+    assert sorted(t["source_url"] for t in response.json()) == ["u2", "u3"]
+
+    response = await client.get("/api/v1/tenders", params={"keyword": "software"})
+    assert [t["source_url"] for t in response.json()] == ["u4"]
+
+
+@pytest.mark.asyncio
+async def test_relevance_sort_ranks_title_matches_first(client):
+    """sort=relevance orders by the weighted title and content scores."""
+    response = await client.get(
+        "/api/v1/tenders", params={"keyword": "软件系统", "sort": "relevance"}
+    )
+
+    assert response.status_code == 200
+    assert [t["source_url"] for t in response.json()] == ["u3", "u2"]
+    assert "X-Next-Cursor" not in response.headers
@@ -0,0 +1,104 @@
+"""Tests for the batched tender writer."""
+import pytest
+from sqlalchemy import select, func
+
+from app.models.tender import RawDocument, Tender
+from app.services.raw_store import load_document
+from app.services.writer import TenderBatchWriter
+
+
+def make_row(n: int, **overrides) -> dict:
+    """Build a tender row for source 源1."""
+    row = {
+        "source_name": "源1",
+        "source_url": f"https://example.com/{n}",
+        "title": f"项目{n}",
+        "content": "内容",
+        "is_filtered": False,
+    }
+    row.update(overrides)
+    return row
+
+
+@pytest.mark.asyncio
+async def test_writer_inserts_in_batches(test_db):
+    """Rows are written once per full batch and on the final flush."""
+    writer = TenderBatchWriter(test_db, batch_size=2, commit_every=0)
+
+    for n in range(5):
+        await writer.add(make_row(n))
+    assert writer.batches == 2
+
+    await writer.flush()
+    await test_db.commit()
+
+    assert writer.batches == 3
+    assert len(writer.inserted) == 5
+    count = await test_db.scalar(select(func.count()).select_from(Tender))
+    assert count == 5
+
+
+@pytest.mark.asyncio
+async def test_writer_skips_conflicts(test_db):
+    """Rows already stored are skipped instead of failing the batch."""
+    test_db.add(Tender(**make_row(1)))
+    await test_db.commit()
+
+    writer = TenderBatchWriter(test_db, batch_size=10)
+    await writer.add(make_row(1))
+    await writer.add(make_row(2))
+    await writer.flush()
+
+    assert writer.inserted == {"https://example.com/2"}
+    assert writer.conflicts == 1
+    assert writer.errors == 0
+
+
+@pytest.mark.asyncio
+async def test_writer_isolates_bad_rows(test_db):
+    """A failing row is retried alone so the rest of the batch is kept."""
+    writer = TenderBatchWriter(test_db, batch_size=10)
+    await writer.add(make_row(1))
+    await writer.add(make_row(2, title=None))
+    await writer.add(make_row(3))
+    await writer.flush()
+
+    assert writer.inserted == {"https://example.com/1", "https://example.com/3"}
+    assert writer.errors == 1
+    assert writer.conflicts == 0
+
+
+@pytest.mark.asyncio
+async def test_writer_stores_raw_html_once(test_db):
+    """Identical raw pages are compressed into one shared document."""
+    page = "<html><body>" + "公告模板" * 500 + "</body></html>"
+    writer = TenderBatchWriter(test_db, batch_size=10)
+    await writer.add(make_row(1, raw_html=page))
+    await writer.add(make_row(2, raw_html=page))
+    await writer.add(make_row(3))
+    await writer.flush()
+
+    result = await test_db.execute(select(Tender.raw_html_hash).order_by(Tender.id))
+    hashes = result.scalars().all()
+    assert hashes[0] == hashes[1] is not None
+    assert hashes[2] is None
+
+    documents = (await test_db.execute(select(RawDocument))).scalars().all()
+    assert len(documents) == 1
+    assert documents[0].size > len(documents[0].data)
+    assert await load_document(test_db, hashes[0]) == page
+
+
+@pytest.mark.asyncio
+async def test_writer_skips_raw_html_of_conflicting_rows(test_db):
+    """Rows dropped by ON CONFLICT leave no orphaned raw document."""
+    test_db.add(Tender(**make_row(1)))
+    await test_db.commit()
+
+    writer = TenderBatchWriter(test_db, batch_size=10)
+    await writer.add(make_row(1, raw_html="<html>旧页面</html>"))
+    await writer.add(make_row(2, raw_html="<html>新页面</html>"))
+    await writer.flush()
+
+    documents = (await test_db.execute(select(RawDocument))).scalars().all()
+    assert [await load_document(test_db, d.hash) for d in documents] == ["<html>新页面</html>"]
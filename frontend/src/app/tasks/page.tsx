@@ -1,6 +1,6 @@
 'use client';
 
-import { useState } from 'react';
+import { useEffect, useState } from 'react';
 import {
   Card,
   Form,
@@ -19,19 +19,60 @@ import { PlayCircleOutlined, ReloadOutlined } from '@ant-design/icons';
 import DashboardLayout from '@/components/DashboardLayout';
 import { useSources } from '@/hooks/use-api';
 import { taskApi } from '@/lib/api';
-import type { TaskRunResponse } from '@/types/api';
+import type { TaskResult, TaskRunResponse } from '@/types/api';
 
 const { Title, Text } = Typography;
 
+// Interval between job status polls
+const POLL_INTERVAL_MS = 2000;
+
+const STATUS_TAGS: Record<string, { color: string; label: string }> = {
+  pending: { color: 'default', label: '等待中' },
+  running: { color: 'processing', label: '执行中' },
+  succeeded: { color: 'success', label: '成功' },
+  failed: { color: 'error', label: '失败' },
+};
+
+const isActive = (job: TaskResult) =>
+  job.status === 'pending' || job.status === 'running';
+
 export default function TasksPage() {
   const [form] = Form.useForm();
-  const [running, setRunning] = useState(false);
+  const [submitting, setSubmitting] = useState(false);
   const [result, setResult] = useState<TaskRunResponse | null>(null);
 
   const { sources, isLoading: sourcesLoading } = useSources();
 
+  const jobs = result?.results ?? [];
+  const running = submitting || jobs.some(isActive);
+
+  // Jobs run in the background: poll their status until all have finished
+  useEffect(() => {
+    if (!jobs.some(isActive)) {
+      return;
+    }
+
+    const timer = setTimeout(async () => {
+      const updated = await Promise.all(
+        jobs.map(async (job) => {
+          if (!job.job_id || !isActive(job)) {
+            return job;
+          }
+          try {
+            return await taskApi.getJob(job.job_id);
+          } catch (error: any) {
+            return { ...job, status: 'failed' as const, error: error.message || '无法获取任务状态' };
+          }
+        })
+      );
+      setResult((current) => (current ? { ...current, results: updated } : current));
+    }, POLL_INTERVAL_MS);
+
+    return () => clearTimeout(timer);
+  }, [jobs]);
+
   const handleRunTask = async (values: any) => {
-    setRunning(true);
+    setSubmitting(true);
     setResult(null);
 
     try {
@@ -48,7 +89,7 @@ export default function TasksPage() {
         results: [],
       });
     } finally {
-      setRunning(false);
+      setSubmitting(false);
     }
   };
 
@@ -110,60 +151,66 @@ export default function TasksPage() {
           </Form>
         </Card>
 
-        {running && (
+        {submitting && (
           <Card>
-            <Spin tip="任务执行中，请稍候...">
+            <Spin tip="正在提交任务...">
               <div style={{ height: 100 }} />
             </Spin>
           </Card>
         )}
 
-        {result && !running && (
+        {result && !submitting && (
           <Card title="执行结果">
             <Space direction="vertical" size="large" style={{ width: '100%' }}>
               <Alert
                 message={result.message}
-                type={result.success ? 'success' : 'error'}
+                description={running ? '任务在后台执行，状态每隔几秒自动刷新' : undefined}
+                type={!result.success ? 'error' : running ? 'info' : 'success'}
                 showIcon
               />
 
               <Divider />
 
-              {result.results.map((r, index) => (
-                <Card
-                  key={index}
-                  size="small"
-                  title={
-                    <Space>
-                      <Text strong>{r.source_name}</Text>
-                      {r.error ? (
-                        <Tag color="error">失败</Tag>
-                      ) : (
-                        <Tag color="success">成功</Tag>
-                      )}
-                    </Space>
-                  }
-                >
-                  {r.error ? (
-                    <Text type="danger">错误: {r.error}</Text>
-                  ) : (
-                    <Descriptions column={2} size="small">
-                      <Descriptions.Item label="采集数量">
-                        {r.scraped || 0}
-                      </Descriptions.Item>
-                      <Descriptions.Item label="处理成功">
-                        <Text type="success">{r.processed || 0}</Text>
-                      </Descriptions.Item>
-                      <Descriptions.Item label="已过滤">
-                        <Text type="warning">{r.filtered || 0}</Text>
-                      </Descriptions.Item>
-                      <Descriptions.Item label="错误数">
-                        <Text type="danger">{r.errors || 0}</Text>
-                      </Descriptions.Item>
-                    </Descriptions>
-                  )}
-                </Card>
-              ))}
+              {jobs.map((r, index) => {
+                const status = STATUS_TAGS[r.status ?? (r.error ? 'failed' : 'succeeded')];
+                return (
+                  <Card
+                    key={r.job_id ?? index}
+                    size="small"
+                    title={
+                      <Space>
+                        <Text strong>{r.source_name}</Text>
+                        <Tag color={status.color}>{status.label}</Tag>
+                        {r.duration_seconds != null && (
+                          <Text type="secondary">{r.duration_seconds.toFixed(1)}s</Text>
+                        )}
+                      </Space>
+                    }
+                  >
+                    {r.error ? (
+                      <Text type="danger">错误: {r.error}</Text>
+                    ) : (
+                      <Descriptions column={2} size="small">
+                        <Descriptions.Item label="采集数量">
+                          {r.scraped || 0}
+                        </Descriptions.Item>
+                        <Descriptions.Item label="已存在">
+                          {r.duplicates || 0}
+                        </Descriptions.Item>
+                        <Descriptions.Item label="处理成功">
+                          <Text type="success">{r.processed || 0}</Text>
+                        </Descriptions.Item>
+                        <Descriptions.Item label="已过滤">
+                          <Text type="warning">{r.filtered || 0}</Text>
+                        </Descriptions.Item>
+                        <Descriptions.Item label="错误数">
+                          <Text type="danger">{r.errors || 0}</Text>
+                        </Descriptions.Item>
+                      </Descriptions>
+                    )}
+                  </Card>
+                );
+              })}
             </Space>
           </Card>
         )}
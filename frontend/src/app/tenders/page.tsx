@@ -30,9 +30,9 @@ import type { ColumnsType } from 'antd/es/table';
 import dayjs from 'dayjs';
 import ReactMarkdown from 'react-markdown';
 import DashboardLayout from '@/components/DashboardLayout';
-import { useTenders } from '@/hooks/use-api';
+import { useTender, useTenders } from '@/hooks/use-api';
 import { tenderApi } from '@/lib/api';
-import type { Tender, TenderUpdate, TenderFilters } from '@/types/api';
+import type { TenderSummary, TenderUpdate, TenderFilters } from '@/types/api';
 
 const { Text, Title, Paragraph } = Typography;
 const { TextArea } = Input;
@@ -44,12 +44,14 @@ export default function TendersPage() {
     limit: 20,
     include_filtered: false,
   });
-  const [selectedTender, setSelectedTender] = useState<Tender | null>(null);
+  const [selectedTender, setSelectedTender] = useState<TenderSummary | null>(null);
   const [detailVisible, setDetailVisible] = useState(false);
   const [editMode, setEditMode] = useState(false);
   const [form] = Form.useForm();
 
   const { tenders, isLoading, mutate } = useTenders(filters);
+  // List items carry no content; load the full record for the drawer
+  const { tender: tenderDetail } = useTender(detailVisible ? selectedTender?.id ?? null : null);
 
   const handleSearch = (values: any) => {
     setFilters({
@@ -62,7 +64,7 @@ export default function TendersPage() {
     });
   };
 
-  const handleViewDetail = (record: Tender) => {
+  const handleViewDetail = (record: TenderSummary) => {
     setSelectedTender(record);
     setDetailVisible(true);
     setEditMode(false);
@@ -104,7 +106,7 @@ export default function TendersPage() {
     }
   };
 
-  const columns: ColumnsType<Tender> = [
+  const columns: ColumnsType<TenderSummary> = [
     {
       title: 'ID',
       dataIndex: 'id',
@@ -133,7 +135,7 @@ export default function TendersPage() {
       dataIndex: 'budget_amount',
       key: 'budget_amount',
       width: 150,
-      render: (amount: number, record: Tender) =>
+      render: (amount: number, record: TenderSummary) =>
         amount ? `¥${amount.toLocaleString()} ${record.budget_currency || ''}` : '-',
     },
     {
@@ -147,7 +149,7 @@ export default function TendersPage() {
       title: '状态',
       key: 'status',
       width: 120,
-      render: (_, record: Tender) => (
+      render: (_, record: TenderSummary) => (
         <Space direction="vertical" size={0}>
           {record.is_filtered && <Tag color="red">已过滤</Tag>}
           {record.is_manually_corrected && <Tag color="blue">已修正</Tag>}
@@ -159,7 +161,7 @@ export default function TendersPage() {
       title: '操作',
       key: 'action',
       width: 120,
-      render: (_, record: Tender) => (
+      render: (_, record: TenderSummary) => (
         <Space>
           <Button
             type="link"
@@ -390,7 +392,7 @@ export default function TendersPage() {
                   borderRadius: '4px',
                 }}
               >
-                <ReactMarkdown>{selectedTender.content}</ReactMarkdown>
+                <ReactMarkdown>{tenderDetail?.content ?? ''}</ReactMarkdown>
               </div>
             </Card>
 
@@ -0,0 +1,97 @@
+/**
+ * API client and service layer for the Tender Scraper backend
+ */
+import axios from 'axios';
+import type {
+  Tender,
+  TenderSummary,
+  TenderUpdate,
+  TenderFilters,
+  SourceConfig,
+  SourceConfigCreate,
+  TaskRunRequest,
+  TaskRunResponse,
+  TaskResult,
+} from '@/types/api';
+
+export const apiClient = axios.create({
+  baseURL: process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000/api/v1',
+  timeout: 30000,
+  headers: {
+    'Content-Type': 'application/json',
+  },
+});
+
+// Surface the backend's error detail as the error message
+apiClient.interceptors.response.use(
+  (response) => response,
+  (error) => {
+    const detail = error.response?.data?.detail;
+    if (detail) {
+      error.message = typeof detail === 'string' ? detail : JSON.stringify(detail);
+    }
+    return Promise.reject(error);
+  }
+);
+
+export const tenderApi = {
+  async getTenders(filters?: TenderFilters): Promise<TenderSummary[]> {
+    const { data } = await apiClient.get<TenderSummary[]>('/tenders', { params: filters });
+    return data;
+  },
+
+  async getTender(id: number): Promise<Tender> {
+    const { data } = await apiClient.get<Tender>(`/tenders/${id}`);
+    return data;
+  },
+
+  async updateTender(id: number, update: TenderUpdate): Promise<Tender> {
+    const { data } = await apiClient.patch<Tender>(`/tenders/${id}`, update);
+    return data;
+  },
+};
+
+export const sourceApi = {
+  async getSources(skip = 0, limit = 100): Promise<SourceConfig[]> {
+    const { data } = await apiClient.get<SourceConfig[]>('/sources', {
+      params: { skip, limit },
+    });
+    return data;
+  },
+
+  async getSource(id: number): Promise<SourceConfig> {
+    const { data } = await apiClient.get<SourceConfig>(`/sources/${id}`);
+    return data;
+  },
+
+  async createSource(source: SourceConfigCreate): Promise<SourceConfig> {
+    const { data } = await apiClient.post<SourceConfig>('/sources', source);
+    return data;
+  },
+
+  async updateSource(
+    id: number,
+    update: Partial<SourceConfigCreate>
+  ): Promise<SourceConfig> {
+    const { data } = await apiClient.patch<SourceConfig>(`/sources/${id}`, update);
+    return data;
+  },
+
+  async deleteSource(id: number): Promise<void> {
+    await apiClient.delete(`/sources/${id}`);
+  },
+};
+
+export const taskApi = {
+  /** Submit tasks; returns immediately with one pending job per source */
+  async runTask(request: TaskRunRequest): Promise<TaskRunResponse> {
+    const { data } = await apiClient.post<TaskRunResponse>('/tasks/run', request);
+    return data;
+  },
+
+  /** Current status and progress of a submitted job */
+  async getJob(jobId: string): Promise<TaskResult> {
+    const { data } = await apiClient.get<TaskResult>(`/tasks/${jobId}`);
+    return data;
+  },
+};
@@ -2,12 +2,12 @@
  * Type definitions for Tender Scraper API
  */
 
-export interface Tender {
+/** Tender list item; the announcement text is only returned by the detail endpoint */
+export interface TenderSummary {
   id: number;
   source_name: string;
   source_url: string;
   title: string;
-  content: string;
   project_name?: string;
   budget_amount?: number;
   budget_currency?: string;
@@ -24,6 +24,10 @@ export interface Tender {
   updated_at: string;
 }
 
+export interface Tender extends TenderSummary {
+  content: string;
+}
+
 export interface TenderUpdate {
   project_name?: string;
   budget_amount?: number;
@@ -45,6 +49,7 @@ export interface SourceConfig {
   filter_rules?: FilterRules;
   is_active: boolean;
   schedule_cron?: string;
+  incremental_state?: Record<string, any>;
   last_run_at?: string;
   created_at: string;
   updated_at: string;
@@ -81,12 +86,19 @@ export interface TaskRunResponse {
 }
 
 export interface TaskResult {
+  job_id?: string;
+  source_id?: number;
   source_name: string;
+  status?: 'pending' | 'running' | 'succeeded' | 'failed';
   scraped?: number;
+  duplicates?: number;
   processed?: number;
   filtered?: number;
   errors?: number;
   error?: string;
+  started_at?: string;
+  finished_at?: string;
+  duration_seconds?: number;
 }
 
 export interface PaginationParams {
@@ -95,6 +107,8 @@ export interface PaginationParams {
 }
 
 export interface TenderFilters extends PaginationParams {
+  cursor?: string;
+  fields?: string;
   source_name?: string;
   keyword?: string;
   min_budget?: number;
@@ -68,10 +68,59 @@ def get_article_detail(url, config):
         print(f"Error fetching detail {url}: {e}")
         return None
 
-def get_content_list(total_count, config, per_page=5):
+STATE_PATH = 'state.json'
+CONTENT_PATH = 'content_list.json'
+SEEN_LINKS_LIMIT = 2000
+RATE_LIMIT_RETRIES = 4  # Give up after this many rate-limited requests in a row
+RATE_LIMIT_WAIT = 60  # Seconds before the first retry, doubled on each further one
+
+def load_state():
+    """Load incremental state from previous runs."""
+    state = {"last_create_time": 0, "latest_aid": None, "seen_links": []}
+    if os.path.exists(STATE_PATH):
+        with open(STATE_PATH, 'r', encoding='utf-8') as f:
+            state.update(json.load(f))
+    return state
+
+def save_state(state):
+    """Save incremental state for the next run."""
+    with open(STATE_PATH, 'w', encoding='utf-8') as f:
+        json.dump(state, f, ensure_ascii=False, indent=4)
+
+def load_content_list(cutoff_time):
+    """Load articles saved by previous runs that are still inside the window."""
+    if not os.path.exists(CONTENT_PATH):
+        return []
+    with open(CONTENT_PATH, 'r', encoding='utf-8') as f:
+        saved = json.load(f)
+    return [item for item in saved if (item.get('create_time') or 0) >= cutoff_time]
+
+def save_content_list(new_items, saved_items):
+    """Write this run's articles followed by earlier ones, without duplicate links."""
+    merged = []
+    links = set()
+    for item in new_items + saved_items:
+        link = item.get('link')
+        if link and link in links:
+            continue
+        links.add(link)
+        merged.append(item)
+    with open(CONTENT_PATH, "w", encoding="utf-8") as f:
+        json.dump(merged, f, ensure_ascii=False, indent=4)
+    return merged
+
+def get_content_list(config, state, per_page=5):
     """
-    Fetch all articles based on the total count.
+    Fetch articles newer than the last run.
     Matches the logic from the user's screenshot.
+
+    The list is newest first, so paging stops at the first article that is
+    older than 7 days, not newer than the last run's newest article, or whose
+    link was seen recently. On an unchanged account this is a single request.
+
+    The state only advances when the crawl reached one of those stopping
+    points (or the end of the list) without skipping a page, so articles
+    missed because of an error are fetched again by the next run.
     """
     url = "https://mp.weixin.qq.com/cgi-bin/appmsg"
     
@@ -93,21 +142,31 @@ def get_content_list(total_count, config, per_page=5):
         "type": "9"
     }
 
-    page = int(math.ceil(total_count / per_page))
     content_list = []
     
-    # Calculate cutoff time (7 days ago)
+    # Calculate cutoff time (7 days ago, or the newest article of the last run)
     cutoff_time = time.time() - 7 * 24 * 3600
-    print(f"Fetching articles from the last 7 days (after {time.ctime(cutoff_time)})...")
+    saved_list = load_content_list(cutoff_time)
+    last_create_time = state["last_create_time"]
+    seen_links = set(state["seen_links"])
+    print(f"Fetching articles from the last 7 days (after {time.ctime(max(cutoff_time, last_create_time))})...")
     
+    newest_time = last_create_time
+    newest_aid = state["latest_aid"]
+    new_links = []
     stop_scraping = False
+    complete = True  # False once a page is skipped or the session fails
+    begin = 0
+    total_count = None
+    rate_limited = 0
 
     # Using tqdm for progress bar as shown in screenshot
-    for i in tqdm(range(page), desc="获取文章列表"):
+    progress = tqdm(desc="获取文章列表")
+    while total_count is None or begin < total_count:
         if stop_scraping:
             break
             
-        data["begin"] = str(i * per_page)
+        data["begin"] = str(begin)
         
         try:
             response = requests.get(url, headers=headers, params=data, timeout=10)
@@ -118,26 +177,54 @@ def get_content_list(total_count, config, per_page=5):
             if base_resp.get('ret') != 0:
                 print(f"\nError from WeChat: {base_resp}")
                 if base_resp.get('ret') == 200013:
-                    print("Rate limit reached. Waiting 60s...")
-                    time.sleep(60)
+                    rate_limited += 1
+                    if rate_limited > RATE_LIMIT_RETRIES:
+                        print("Still rate limited. Stopping; run again later.")
+                        complete = False
+                        break
+                    wait = RATE_LIMIT_WAIT * 2 ** (rate_limited - 1)
+                    print(f"Rate limit reached. Waiting {wait}s...")
+                    time.sleep(wait)
+                    continue
                 elif base_resp.get('ret') == 200003:
                     print("Session invalid. Please update cookie/token.")
+                    complete = False
                     break
+                else:
+                    complete = False
+
+            rate_limited = 0
+
+            # The first page also carries the total, so no separate count request is needed
+            if total_count is None:
+                total_count = int(content_json.get('app_msg_cnt', 0))
+                progress.total = int(math.ceil(total_count / per_page))
                 
             if "app_msg_list" in content_json:
                 for item in content_json["app_msg_list"]:
                     create_time = item.get('create_time')
+                    link = item.get('link')
                     # Check if article is older than cutoff
                     if create_time and create_time < cutoff_time:
                         print(f"\nReached article from {time.ctime(create_time)}. Stopping.")
                         stop_scraping = True
                         break
+                    # Check if article was already fetched by a previous run
+                    if (create_time and create_time <= last_create_time) or link in seen_links:
+                        print("\nReached article seen in a previous run. Stopping.")
+                        stop_scraping = True
+                        break
+
+                    if create_time and create_time > newest_time:
+                        newest_time = create_time
+                        newest_aid = item.get('aid')
+                    if link:
+                        new_links.append(link)
                     
                     # Filter for tender info (simple keyword check in title)
                     title = item.get('title', '')
                     # Keywords: 招标, 采购, 询价, 谈判, 磋商, 竞价
                     if any(kw in title for kw in ['招标', '采购', '询价', '谈判', '磋商', '竞价']):
-                        link = item.get('link')
                         if link:
                             # Fetch details
                             detail = get_article_detail(link, config)
@@ -153,9 +240,11 @@ def get_content_list(total_count, config, per_page=5):
                         pass
             
             # Save to JSON incrementally
-            with open("content_list.json", "w", encoding="utf-8") as f:
-                json.dump(content_list, f, ensure_ascii=False, indent=4)
+            save_content_list(content_list, saved_list)
             
+            progress.update(1)
+            begin += per_page
+
             if stop_scraping:
                 break
 
@@ -163,42 +252,27 @@ def get_content_list(total_count, config, per_page=5):
             time.sleep(random.randint(5, 10))
                 
         except Exception as e:
-            print(f"\nError fetching page {i}: {e}")
+            print(f"\nError fetching page {begin // per_page}: {e}")
+            complete = False
+            if total_count is None:
+                break
+            begin += per_page
             time.sleep(5)
+    progress.close()
 
-    print(f"\nScraping complete. Saved {len(content_list)} tender articles to content_list.json.")
+    merged = save_content_list(content_list, saved_list)
 
-def get_total_count(config):
-    """Helper to get the total number of articles to initialize the loop."""
-    url = "https://mp.weixin.qq.com/cgi-bin/appmsg"
-    headers = {
-        "Cookie": config.get('cookie', ""),
-        "User-Agent": config.get('user_agent', "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/115.0.0.0 Safari/537.36")
-    }
-    data = {
-        "token": config['token'],
-        "lang": "zh_CN",
-        "f": "json",
-        "ajax": "1",
-        "action": "list_ex",
-        "begin": "0",
-        "count": "5",
-        "query": "",
-        "fakeid": config['fakeid'],
-        "type": "9"
-    }
-    
-    try:
-        response = requests.get(url, headers=headers, params=data, timeout=10)
-        res_json = response.json()
-        if res_json.get('base_resp', {}).get('ret') == 0:
-            return int(res_json.get('app_msg_cnt', 0))
-        else:
-            print(f"Error getting count: {res_json}")
-            return 0
-    except Exception as e:
-        print(f"Error getting count: {e}")
-        return 0
+    # Remember where this run stopped, unless articles may have been skipped
+    if complete:
+        state["last_create_time"] = newest_time
+        state["latest_aid"] = newest_aid
+        state["seen_links"] = (new_links + state["seen_links"])[:SEEN_LINKS_LIMIT]
+        save_state(state)
+    else:
+        print("\nSome pages were not fetched; state.json is unchanged so the next run retries them.")
+
+    print(f"\nScraping complete. Saved {len(content_list)} new tender articles "
+          f"({len(merged)} in the last 7 days) to {CONTENT_PATH}.")
 
 def main():
     config = load_config()
@@ -209,14 +283,7 @@ def main():
         print("Please update config.json with your actual cookie, token, and fakeid.")
         return
 
-    print("Fetching total article count...")
-    total_count = get_total_count(config)
-    
-    if total_count > 0:
-        print(f"Total articles: {total_count}")
-        get_content_list(total_count, config)
-    else:
-        print("Could not retrieve article count or count is 0.")
+    get_content_list(config, load_state())
 
 if __name__ == "__main__":
     main()